@@ -1,25 +1,35 @@
 """
 Mail Converter Core Package
+
+Public names are resolved lazily (PEP 562) so that importing ``core`` does not
+pull in reportlab, PyPDF2, extract_msg etc. until a class that needs
+them is actually used. Names are grouped into ``core.convert`` (PDF conversion
+pipeline) and ``core.tools`` (Email Tools); callers that only need one group
+can import it directly.
 """
 
-from .pst_extractor import PSTExtractor
-from .eml_parser import EMLParser
-from .mbox_extractor import MBOXExtractor, MboxExtractionResult
-from .msg_parser import MSGParser, ParsedMSG
-from .attachment_converter import AttachmentConverter
-from .pdf_merger import PDFMerger
-from .duplicate_detector import DuplicateDetector
-from .conversion_pipeline import ConversionPipeline, InputType
-
-# Email Tools
-from .email_fingerprint import EmailFingerprint, FingerprintIndex, create_fingerprint
-from .mailbox_writer import MailboxWriter, OutputFormat, is_mapi_available
-from .mailbox_comparator import MailboxComparator, ComparisonConfig, ComparisonResult
-from .mailbox_merger import MailboxMerger, MergeConfig, MergeResult
-from .mailbox_deduplicator import MailboxDeduplicator, DedupeConfig, DedupeResult
-from .mailbox_filter import MailboxFilter, FilterConfig, FilterResult
-
-__all__ = [
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Static analyzers can't follow __getattr__, so spell the imports out here.
+    from .convert import (
+        PSTExtractor, EMLParser, MBOXExtractor, MboxExtractionResult, MSGParser, ParsedMSG,
+        AttachmentConverter, PDFMerger, DuplicateDetector, ConversionPipeline, InputType,
+    )
+
+    # Email Tools
+    from .tools import (
+        EmailFingerprint, FingerprintIndex, create_fingerprint,
+        MailboxWriter, OutputFormat, is_mapi_available,
+        MailboxComparator, ComparisonConfig, ComparisonResult,
+        MailboxMerger, MergeConfig, MergeResult,
+        MailboxDeduplicator, DedupeConfig, DedupeResult,
+        MailboxFilter, FilterConfig, FilterResult,
+    )
+
+__all__ = (
     'PSTExtractor',
     'EMLParser',
     'MBOXExtractor',
@@ -50,4 +60,41 @@ __all__ = [
     'MailboxFilter',
     'FilterConfig',
     'FilterResult',
-]
+)
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    'PSTExtractor': ('.convert', 'PSTExtractor'),
+    'EMLParser': ('.convert', 'EMLParser'),
+    'MBOXExtractor': ('.convert', 'MBOXExtractor'),
+    'MboxExtractionResult': ('._types', 'MboxExtractionResult'),
+    'MSGParser': ('.convert', 'MSGParser'),
+    'ParsedMSG': ('._types', 'ParsedMSG'),
+    'AttachmentConverter': ('.convert', 'AttachmentConverter'),
+    'PDFMerger': ('.convert', 'PDFMerger'),
+    'DuplicateDetector': ('.convert', 'DuplicateDetector'),
+    'ConversionPipeline': ('.convert', 'ConversionPipeline'),
+    'InputType': ('._types', 'InputType'),
+    # Email Tools
+    'EmailFingerprint': ('.tools', 'EmailFingerprint'),
+    'FingerprintIndex': ('.tools', 'FingerprintIndex'),
+    'create_fingerprint': ('.tools', 'create_fingerprint'),
+    'MailboxWriter': ('.tools', 'MailboxWriter'),
+    'OutputFormat': ('._types', 'OutputFormat'),
+    'is_mapi_available': ('.tools', 'is_mapi_available'),
+    'MailboxComparator': ('.tools', 'MailboxComparator'),
+    'ComparisonConfig': ('._types', 'ComparisonConfig'),
+    'ComparisonResult': ('._types', 'ComparisonResult'),
+    'MailboxMerger': ('.tools', 'MailboxMerger'),
+    'MergeConfig': ('._types', 'MergeConfig'),
+    'MergeResult': ('._types', 'MergeResult'),
+    'MailboxDeduplicator': ('.tools', 'MailboxDeduplicator'),
+    'DedupeConfig': ('._types', 'DedupeConfig'),
+    'DedupeResult': ('._types', 'DedupeResult'),
+    'MailboxFilter': ('.tools', 'MailboxFilter'),
+    'FilterConfig': ('._types', 'FilterConfig'),
+    'FilterResult': ('._types', 'FilterResult'),
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, __all__, _LAZY)
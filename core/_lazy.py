@@ -0,0 +1,45 @@
+"""
+Lazy Export Helper
+
+Builds the PEP 562 ``__getattr__``/``__dir__`` pair used by the ``core``
+package and its ``convert``/``tools`` groups, so each namespace only imports
+a submodule when one of its names is first accessed.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    names: Iterable[str],
+    exports: Dict[str, Tuple[str, str]],
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Create module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: ``__name__`` of the package doing the exporting
+        names: Public names (the package's ``__all__``)
+        exports: Mapping of public name -> (relative module, attribute)
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at module level
+    """
+    names_set = frozenset(names)
+
+    def __getattr__(name: str) -> object:
+        if name not in names_set:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, attr = exports[name]
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, attr)
+        # Cache on the package so later lookups bypass __getattr__ entirely
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(names_set.union(vars(sys.modules[package])))
+
+    return __getattr__, __dir__
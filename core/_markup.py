@@ -0,0 +1,33 @@
+"""
+Markup Escaping Module
+
+Escaping for text placed in reportlab Paragraph markup or HTML, shared by the
+converters and the merger. Standard library only.
+"""
+
+
+def escape_markup(text: str, quote: bool = False) -> str:
+    """
+    Escape &, < and > (and " if quote is set) in a few C-level passes.
+    
+    str.translate takes a slow path when characters map to multi-character
+    strings, so this uses chained replace(); pure-ASCII text is replaced as
+    bytes, which skips the per-codepoint width handling on long bodies.
+    
+    Args:
+        text: Text to escape
+        quote: Also escape double quotes, for HTML attribute values
+    
+    Returns:
+        Escaped text
+    """
+    if text.isascii():
+        data = text.encode('ascii').replace(b'&', b'&amp;').replace(
+            b'<', b'&lt;').replace(b'>', b'&gt;')
+        if quote:
+            data = data.replace(b'"', b'&quot;')
+        return data.decode('ascii')
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    if quote:
+        text = text.replace('"', '&quot;')
+    return text
@@ -0,0 +1,227 @@
+"""
+Shared Types Module
+
+Plain dataclasses and enums used as configuration and result objects across
+the core package. This module only depends on the standard library, so
+building a config (e.g. to hand to a worker process) does not import the
+heavy extractor/writer/converter modules that consume it.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .email_fingerprint import FingerprintMatch
+
+
+class OutputFormat(Enum):
+    """Supported output formats"""
+    MBOX = "mbox"
+    EML_FOLDER = "eml_folder"
+    PST = "pst"  # Windows only
+
+
+class InputType(Enum):
+    """Types of input files/folders"""
+    PST = "pst"
+    MBOX = "mbox"
+    EML = "eml"
+    MSG = "msg"
+    EML_FOLDER = "eml_folder"
+    PST_FOLDER = "pst_folder"
+    MBOX_FOLDER = "mbox_folder"
+    MIXED_FOLDER = "mixed_folder"
+
+
+@dataclass
+class MboxExtractionResult:
+    """Result of MBOX extraction."""
+    success: bool
+    email_count: int  # Number of emails extracted
+    output_dir: str
+    extracted_files: List[str] = field(default_factory=list)  # Paths to extracted EML files
+    folder_structure: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def emails_extracted(self) -> int:
+        """Alias for email_count for backwards compatibility."""
+        return self.email_count
+
+
+@dataclass
+class MSGAttachment:
+    """Represents an attachment from an MSG file."""
+    filename: str
+    content: bytes
+    content_type: str
+    content_id: Optional[str] = None
+    is_inline: bool = False
+
+
+@dataclass
+class ParsedMSG:
+    """Parsed MSG file data."""
+    subject: str
+    sender: str
+    sender_email: str
+    recipients_to: List[str]
+    recipients_cc: List[str]
+    recipients_bcc: List[str]
+    date: Optional[datetime]
+    body_text: str
+    body_html: str
+    attachments: List[MSGAttachment]
+    headers: Dict[str, str]
+
+    # For compatibility with ParsedEmail
+    inline_images: Dict[str, MSGAttachment] = field(default_factory=dict)
+
+    def get_display_date(self) -> str:
+        """Get formatted date string."""
+        if self.date:
+            return self.date.strftime("%Y-%m-%d %H:%M:%S")
+        return "Unknown Date"
+
+
+@dataclass
+class ComparisonConfig:
+    """Configuration for mailbox comparison"""
+    # Matching options
+    use_message_id: bool = True
+    use_content: bool = True
+    timestamp_tolerance_seconds: int = 15
+
+    # Output options
+    output_format: OutputFormat = OutputFormat.EML_FOLDER
+
+    # What to output
+    output_common: bool = True
+    output_unique_a: bool = True
+    output_unique_b: bool = True
+
+
+@dataclass
+class ComparisonResult:
+    """Result of mailbox comparison"""
+    success: bool
+
+    # Counts
+    total_in_a: int = 0
+    total_in_b: int = 0
+    common_count: int = 0
+    unique_to_a_count: int = 0
+    unique_to_b_count: int = 0
+
+    # Output paths (set after writing)
+    common_output_path: Optional[str] = None
+    unique_a_output_path: Optional[str] = None
+    unique_b_output_path: Optional[str] = None
+
+    # Errors and warnings
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    # Detailed matches (for debugging/reporting)
+    matches: List['FingerprintMatch'] = field(default_factory=list)
+
+
+@dataclass
+class MergeConfig:
+    """Configuration for mailbox merging"""
+    # Deduplication options
+    deduplicate: bool = True
+    use_message_id: bool = True
+    use_content: bool = True
+    timestamp_tolerance_seconds: int = 15
+
+    # Output options
+    output_format: OutputFormat = OutputFormat.MBOX
+
+
+@dataclass
+class MergeResult:
+    """Result of mailbox merge operation"""
+    success: bool
+    output_path: str = ""
+
+    # Counts
+    total_input_emails: int = 0
+    emails_written: int = 0
+    duplicates_removed: int = 0
+
+    # Errors and warnings
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class DedupeConfig:
+    """Configuration for deduplication"""
+    # Matching options
+    use_message_id: bool = True
+    use_content: bool = True
+    timestamp_tolerance_seconds: int = 15
+
+    # Output options
+    output_format: OutputFormat = OutputFormat.MBOX
+    keep_duplicates: bool = False  # If True, also output duplicates separately
+
+
+@dataclass
+class DedupeResult:
+    """Result of deduplication operation"""
+    success: bool
+    output_path: str = ""
+    duplicates_path: Optional[str] = None
+
+    # Counts
+    total_emails: int = 0
+    unique_emails: int = 0
+    duplicates_found: int = 0
+
+    # Detailed matches
+    duplicate_matches: List['FingerprintMatch'] = field(default_factory=list)
+
+    # Errors and warnings
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FilterConfig:
+    """Configuration for email filtering"""
+    # Filter criteria (OR logic - email matches if ANY criteria matches)
+    sender_emails: List[str] = field(default_factory=list)      # Match if sender in list
+    sender_domains: List[str] = field(default_factory=list)     # Match if sender domain in list
+    recipient_emails: List[str] = field(default_factory=list)   # Match if any recipient in list
+    recipient_domains: List[str] = field(default_factory=list)  # Match if any recipient domain in list
+
+    # Logic
+    match_mode: str = "any"  # "any" = OR, "all" = AND (for multiple criteria)
+    include_cc: bool = True  # Include CC recipients in matching
+    include_bcc: bool = True # Include BCC recipients in matching
+
+    # Output
+    output_format: OutputFormat = OutputFormat.EML_FOLDER
+    output_non_matching: bool = False  # Also output non-matching emails
+
+
+@dataclass
+class FilterResult:
+    """Result of filter operation"""
+    success: bool
+    matched_output_path: str = ""
+    non_matched_output_path: Optional[str] = None
+
+    # Counts
+    total_emails: int = 0
+    matched_emails: int = 0
+    non_matched_emails: int = 0
+
+    # Errors and warnings
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
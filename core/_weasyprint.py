@@ -0,0 +1,38 @@
+"""
+WeasyPrint Loader Module
+
+Shared lazy import of WeasyPrint for the email and attachment converters, so
+a missing install is detected (and remembered) once per process.
+"""
+
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def load_weasyprint() -> Optional[SimpleNamespace]:
+    """
+    Import WeasyPrint on first use.
+    
+    WeasyPrint requires GTK/GLib native libraries which may not be available
+    on Windows, and importing it is slow, so it is only loaded when HTML is
+    actually rendered. A failed import is remembered, not retried per file.
+    
+    Returns:
+        Namespace with HTML, CSS, default_url_fetcher and FontConfiguration,
+        or None if WeasyPrint is unavailable
+    """
+    try:
+        from weasyprint import HTML, CSS, default_url_fetcher
+        from weasyprint.text.fonts import FontConfiguration
+    except (ImportError, OSError, Exception):
+        # ImportError: package not installed
+        # OSError: native libraries (libgobject, etc.) not found on Windows
+        return None
+    return SimpleNamespace(
+        HTML=HTML,
+        CSS=CSS,
+        default_url_fetcher=default_url_fetcher,
+        FontConfiguration=FontConfiguration,
+    )
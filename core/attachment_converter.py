@@ -7,44 +7,317 @@ Supports: PDF, DOC(X), XLS(X), PPT(X), images, text files, EML, MSG, HTML, CSV
 
 import os
 import io
+import re
+import hashlib
 import sys
 import tempfile
 import subprocess
 import shutil
 import platform
+import socket
+import threading
+import time
+import zlib
+import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Callable, List, Tuple, Union
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Callable, Dict, List, Tuple, Union
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
 from enum import Enum
 
-# PDF libraries
-from reportlab.lib.pagesizes import letter, A4
+# PDF page geometry (cheap). Platypus, PIL, Office readers, PyPDF2,
+# pdf2image and pytesseract are imported by the methods that need them.
+from reportlab.lib.pagesizes import letter, A4, landscape
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT
 
-# Image processing
-from PIL import Image
-import img2pdf
+from ._markup import escape_markup
+from ._weasyprint import load_weasyprint
 
-# Document processing
-from docx import Document as DocxDocument
-from pptx import Presentation
-import openpyxl
-import xlrd
-import pandas as pd
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    import pikepdf
+    from PIL import Image
+    from PyPDF2 import PdfWriter
+    from reportlab.lib.styles import StyleSheet1
+    from reportlab.platypus import SimpleDocTemplate, TableStyle
 
-# PDF processing
-from PyPDF2 import PdfReader, PdfWriter
-from pdf2image import convert_from_path, convert_from_bytes
+logger = logging.getLogger(__name__)
 
-# OCR
-import pytesseract
+# MIME types recorded for files embedded in placeholder PDFs
+MIME_TYPES = {
+    '.ics': 'text/calendar',
+    '.wav': 'audio/wav',
+    '.mp3': 'audio/mpeg',
+    '.msg': 'application/vnd.ms-outlook',
+    '.eml': 'message/rfc822',
+    '.zip': 'application/zip',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.xls': 'application/vnd.ms-excel',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
 
-logger = logging.getLogger(__name__)
+# charset declared in an HTML <meta> tag (searched in the first 1024 bytes)
+_HTML_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+# Control characters -> space, for plain-string table cells
+_CTRL_TABLE = str.maketrans({c: ' ' for c in (*range(0x20), 0x7F)})
+
+# ICS line breaks and ORGANIZER/ATTENDEE parsing (see _parse_ics_content())
+_ICS_NEWLINE_RE = re.compile(r'\r\n?|\n')
+_ICS_CN_RE = re.compile(r'CN=([^;:]+)', re.IGNORECASE)
+_ICS_MAILTO_RE = re.compile(r'mailto:', re.IGNORECASE)
+# ICS duration unit byte (upper case) -> label; months/years are not allowed by RFC 5545
+_ICS_DURATION_UNITS = {ord('W'): 'week', ord('D'): 'day', ord('H'): 'hour',
+                       ord('M'): 'minute', ord('S'): 'second'}
+
+# Filename lines reserved on the "not converted" placeholder page
+PLACEHOLDER_NAME_LINES = 3
+
+
+def _table_cell(cell: str) -> str:
+    """Truncate a CSV cell to 30 characters and blank out control characters."""
+    cell = cell[:30]
+    # translate() does a dict lookup per character; most cells need none
+    return cell if cell.isprintable() else cell.translate(_CTRL_TABLE)
+
+
+@lru_cache(maxsize=None)
+def _report_styles() -> 'StyleSheet1':
+    """
+    Sample stylesheet plus the custom paragraph styles the converters use.
+    
+    Built once; styles are only read while laying out, so all conversions
+    share them.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    
+    styles = getSampleStyleSheet()
+    
+    # Monospace style for text files
+    styles.add(ParagraphStyle(
+        'Mono',
+        parent=styles['Normal'],
+        fontName='Courier',
+        fontSize=9,
+        leading=12
+    ))
+    
+    # Calendar invite styles
+    styles.add(ParagraphStyle(
+        'EventTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.HexColor('#1a365d')
+    ))
+    styles.add(ParagraphStyle(
+        'Label',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica-Bold',
+        textColor=colors.HexColor('#4a5568'),
+        spaceBefore=8,
+        spaceAfter=2
+    ))
+    styles.add(ParagraphStyle(
+        'Value',
+        parent=styles['Normal'],
+        fontSize=11,
+        leftIndent=10,
+        spaceAfter=6
+    ))
+    styles.add(ParagraphStyle(
+        'Attendee',
+        parent=styles['Normal'],
+        fontSize=10,
+        leftIndent=20,
+        spaceAfter=2
+    ))
+    styles.add(ParagraphStyle(
+        'Description',
+        parent=styles['Normal'],
+        fontSize=10,
+        leftIndent=10,
+        spaceAfter=6
+    ))
+    return styles
+
+
+@lru_cache(maxsize=None)
+def _report_table_styles() -> Dict[str, 'TableStyle']:
+    """Table styles for spreadsheet ('excel') and CSV ('csv') previews, built once."""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    
+    return {
+        'excel': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ]),
+        'csv': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTSIZE', (0, 0), (-1, -1), 7),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ]),
+    }
+
+
+@lru_cache(maxsize=None)
+def _html_base_css():
+    """Base stylesheet for WeasyPrint HTML rendering, parsed once."""
+    return load_weasyprint().CSS(string='''
+        @page { size: letter; margin: 0.75in; }
+        body { font-family: sans-serif; font-size: 11pt; line-height: 1.4; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ccc; padding: 4px 8px; }
+    ''')
+
+
+def _render_html_worker(html: str, base_url: str, output_path: str) -> Optional[str]:
+    """
+    Render one HTML document with WeasyPrint in a worker process.
+    
+    Module-level so ProcessPoolExecutor can pickle it.
+    
+    Returns:
+        None on success, otherwise the error message
+    """
+    try:
+        load_weasyprint().HTML(string=html, base_url=base_url).write_pdf(
+            output_path, stylesheets=[_html_base_css()]
+        )
+    except Exception as e:
+        return str(e)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _placeholder_template() -> Tuple[bytes, Tuple[float, float, float, float]]:
+    """
+    Build the static part of the "not converted" placeholder page.
+    
+    Returns:
+        (PDF bytes, (x, y, width, height) of the area left blank for the
+        filename and type/size lines)
+    """
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Flowable
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    
+    class FieldSlot(Flowable):
+        """Blank area that remembers where it landed on the page."""
+        
+        def __init__(self, height):
+            super().__init__()
+            self.height = height
+            self.slot = None
+        
+        def wrap(self, avail_width, avail_height):
+            self.width = avail_width
+            return avail_width, self.height
+        
+        def draw(self):
+            x, y = self.canv.absolutePosition(0, 0)
+            self.slot = (x, y, self.width, self.height)
+    
+    buffer = io.BytesIO()
+    
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=inch,
+        leftMargin=inch,
+        topMargin=1.5*inch,
+        bottomMargin=inch
+    )
+    
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    title_style = ParagraphStyle(
+        name='AttachmentTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        textColor=colors.Color(0.2, 0.2, 0.4),
+        spaceAfter=15,
+        alignment=1  # Center
+    )
+    
+    # Info style
+    info_style = ParagraphStyle(
+        name='AttachmentInfo',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.Color(0.4, 0.4, 0.4),
+        spaceAfter=8,
+        alignment=1
+    )
+    
+    # Not converted warning style
+    warning_style = ParagraphStyle(
+        name='NotConverted',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=colors.Color(0.8, 0.1, 0.1),
+        spaceBefore=15,
+        spaceAfter=15,
+        alignment=1,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Instructions style
+    instructions_style = ParagraphStyle(
+        name='Instructions',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.Color(0.5, 0.5, 0.5),
+        spaceBefore=20,
+        alignment=1,
+        leading=14
+    )
+    
+    # Filename lines (12pt bold on 12pt leading, 5pt after) + info line (12pt leading, 8pt after)
+    slot = FieldSlot(PLACEHOLDER_NAME_LINES * 12 + 5 + 12 + 8)
+    
+    story = [
+        Spacer(1, 0.5*inch),
+        Paragraph("📎 ATTACHMENT", title_style),
+        Spacer(1, 10),
+        slot,
+        Spacer(1, 15),
+        Paragraph("(Not Converted)", warning_style),
+        Spacer(1, 10),
+        Paragraph(
+            "This attachment type cannot be converted to PDF.",
+            info_style
+        ),
+        Paragraph(
+            "The original file is embedded in this PDF document.<br/><br/>"
+            "<b>To access the file:</b><br/>"
+            "• In Adobe Reader: View → Show/Hide → Navigation Panes → Attachments<br/>"
+            "• In Preview (Mac): The attachment panel may not be supported<br/>"
+            "• In other readers: Look for a paperclip icon or attachments panel",
+            instructions_style
+        ),
+    ]
+    
+    doc.build(story)
+    return buffer.getvalue(), slot.slot
 
 
 class ConversionStatus(Enum):
@@ -100,10 +373,72 @@ class AttachmentConverter:
         '.msg': '_convert_msg',
     }
     
+    # Converters that accept the file's bytes via a content= keyword
+    IN_MEMORY_METHODS = frozenset({
+        '_convert_pdf', '_convert_image', '_convert_text', '_convert_csv', '_convert_ics', '_convert_html'
+    })
+    
+    # Extension -> pure-Python conversion method used when LibreOffice is unavailable
+    FALLBACK_CONVERTERS = {
+        '.doc': '_docx_to_pdf_fallback',
+        '.docx': '_docx_to_pdf_fallback',
+        '.ppt': '_pptx_to_pdf_fallback',
+        '.pptx': '_pptx_to_pdf_fallback',
+    }
+    
+    # Inputs larger than this are converted without consulting the result cache
+    CACHE_MAX_FILE_SIZE = 50 * 1024 * 1024
+    
+    # On-disk PDF cache budget; least recently used entries are evicted past it
+    CACHE_MAX_BYTES = 1024 * 1024 * 1024
+    
+    # Bump when converter output changes, so older cached PDFs are not reused
+    CACHE_VERSION = 1
+    
+    # Images larger than this (longest side, pixels) are downscaled before OCR
+    OCR_MAX_IMAGE_SIDE = 3500
+    
+    # Maximum files converted concurrently by convert_many()
+    CONVERT_WORKERS = 4
+    
+    # Maximum concurrent tesseract processes when OCRing a PDF
+    OCR_WORKERS = 4
+    
+    # Pages rendered per Poppler call when OCRing a PDF without PyMuPDF
+    OCR_CHUNK_PAGES = 10
+    
+    # Lines per Preformatted block in text PDFs, so page splitting stays cheap
+    TEXT_LINES_PER_BLOCK = 2000
+    
+    # Body lines per Paragraph in MSG PDFs
+    MSG_LINES_PER_PARAGRAPH = 100
+    
+    # Formats convert_many() hands to a single LibreOffice run. One run can mix
+    # them: "--convert-to pdf" picks the writer/impress/calc export per file.
+    # .xlsx is left out because it gets print settings applied first.
+    LIBREOFFICE_BATCH_FORMATS = frozenset({'.doc', '.docx', '.ppt', '.pptx', '.xls'})
+    
+    # Formats convert_many() renders on a process pool when WeasyPrint is
+    # available; it is pure Python and holds the GIL, so threads don't help
+    HTML_BATCH_FORMATS = frozenset({'.html', '.htm'})
+    
+    # LibreOffice PDF export filter for each document type
+    LIBREOFFICE_FILTERS = {
+        '.doc': 'writer_pdf_Export',
+        '.docx': 'writer_pdf_Export',
+        '.ppt': 'impress_pdf_Export',
+        '.pptx': 'impress_pdf_Export',
+        '.xls': 'calc_pdf_Export',
+        '.xlsx': 'calc_pdf_Export',
+    }
+    
     def __init__(
         self, 
         ocr_enabled: bool = True,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        ocr_preprocess: bool = False,
+        ocr_dpi: int = 200,
+        pdf_cache_dir: Optional[Union[str, Path]] = None
     ):
         """
         Initialize the attachment converter.
@@ -111,11 +446,56 @@ class AttachmentConverter:
         Args:
             ocr_enabled: Whether to apply OCR to images and scanned PDFs
             progress_callback: Optional callback for progress messages
+            ocr_preprocess: Binarize images (grayscale + Otsu threshold) before OCR.
+                Faster and often more accurate, but the PDF shows the
+                black-and-white image rather than the original.
+            ocr_dpi: Resolution scanned PDF pages are rendered at for OCR
+            pdf_cache_dir: Directory to keep converted PDFs in across runs. By
+                default they are kept in this converter's private temp dir
+                and removed by cleanup().
         """
         self.ocr_enabled = ocr_enabled
+        self.ocr_preprocess = ocr_preprocess
+        self.ocr_dpi = ocr_dpi
+        # Concurrent tesseract processes per PDF; callers running several
+        # converters at once (see ConversionPipeline) lower it
+        self.ocr_workers = min(self.OCR_WORKERS, os.cpu_count() or 1)
         self.progress_callback = progress_callback
         self.temp_dir = tempfile.mkdtemp(prefix="mail_converter_")
         
+        # Persistent LibreOffice listener (started on first document conversion)
+        self._lo_proc: Optional[subprocess.Popen] = None
+        self._lo_desktop = None
+        self._lo_uno_unavailable = False
+        # LibreOffice conversions run one at a time: they share the listener,
+        # the CLI output directory and the CLI's profile
+        self._lo_lock = threading.RLock()
+        
+        # Directories already created by _ensure_dir()
+        self._known_dirs = set()
+        
+        # Child process environment, built once (see _safe_subprocess_run())
+        self._clean_env = self._clean_subprocess_env()
+        
+        # Converted PDFs keyed by input name + content hash (see convert()).
+        # The PDFs live in pdf_cache_dir; _result_cache indexes the ones seen this run.
+        # Only a caller-chosen directory is shared between runs: a fixed path in
+        # the system temp dir could be pre-created or read by other users.
+        if pdf_cache_dir is None:
+            pdf_cache_dir = Path(self.temp_dir) / "pdf_cache"
+        self.pdf_cache_dir = Path(pdf_cache_dir)
+        self._result_cache: Dict[str, Tuple[Path, ConversionResult]] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_bytes: Optional[int] = None
+        
+        # Parsed placeholder template, opened on first use (see _new_placeholder_pdf())
+        self._template_pdf: Optional['pikepdf.Pdf'] = None
+        self._template_lock = threading.Lock()
+        
+        # WeasyPrint worker processes, started by the first HTML batch and kept
+        # for later batches (see _render_html_batch()); stopped by cleanup()
+        self._html_pool: Optional['ProcessPoolExecutor'] = None
+        
         # Check for external tools
         self._check_dependencies()
     
@@ -210,7 +590,19 @@ class AttachmentConverter:
         Returns:
             CompletedProcess result
         """
-        # Create a clean environment to avoid macOS threading issues
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            stdin=subprocess.DEVNULL,    # Don't inherit stdin
+            start_new_session=True,      # Isolate from parent process group
+            env=self._clean_env,
+            **kwargs
+        )
+    
+    def _clean_subprocess_env(self) -> dict:
+        """Build an environment for child processes that avoids macOS threading issues."""
         clean_env = os.environ.copy()
         
         # Remove macOS-specific variables that can cause issues
@@ -221,154 +613,259 @@ class AttachmentConverter:
         if platform.system() == 'Darwin':
             clean_env['OBJC_DISABLE_INITIALIZE_FORK_SAFETY'] = 'YES'
         
-        return subprocess.run(
+        return clean_env
+    
+    # === Persistent LibreOffice listener (UNO) ===
+    
+    def _start_libreoffice_listener(self):
+        """
+        Start a headless LibreOffice that accepts UNO connections and connect to it.
+        
+        Returns:
+            The LibreOffice Desktop object, or None if UNO is not usable
+        """
+        try:
+            import uno
+        except ImportError:
+            # The "uno" bindings ship with LibreOffice's own Python, not pip
+            logger.info("Python UNO bindings not available - using one LibreOffice process per file")
+            self._lo_uno_unavailable = True
+            return None
+        
+        # Pick a free local port for the listener
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        
+        # Private profile so we don't collide with a LibreOffice the user has open
+        profile_url = Path(self.temp_dir, "lo_profile").as_uri()
+        connection = f"socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        cmd = [
+            self.libreoffice_path,
+            '--headless',
+            '--invisible',
+            '--nologo',
+            '--norestart',
+            '--nofirststartwizard',
+            f'-env:UserInstallation={profile_url}',
+            f'--accept={connection}',
+        ]
+        
+        self._lo_proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            stdin=subprocess.DEVNULL,    # Don't inherit stdin
-            start_new_session=True,      # Isolate from parent process group
-            env=clean_env,
-            **kwargs
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            env=self._clean_env,
         )
+        
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx
+        )
+        
+        # LibreOffice needs a few seconds to open the socket on first start
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self._lo_proc.poll() is not None:
+                break
+            try:
+                ctx = resolver.resolve(f"uno:{connection}")
+                desktop = ctx.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", ctx
+                )
+                logger.info(f"LibreOffice listener started on port {port}")
+                return desktop
+            except Exception:
+                time.sleep(0.25)
+        
+        logger.warning("Could not connect to LibreOffice listener - using one process per file")
+        self._stop_libreoffice_listener()
+        return None
+    
+    def _stop_libreoffice_listener(self):
+        """Terminate the persistent LibreOffice listener if it is running."""
+        self._lo_desktop = None
+        proc, self._lo_proc = self._lo_proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    
+    def _get_libreoffice_desktop(self):
+        """Return a live Desktop from the listener, (re)starting it if needed."""
+        if self._lo_uno_unavailable or not self.has_libreoffice:
+            return None
+        
+        # Health check: a dead process or broken bridge means relaunch
+        if self._lo_desktop is not None:
+            try:
+                if self._lo_proc is not None and self._lo_proc.poll() is None:
+                    self._lo_desktop.getComponents()
+                    return self._lo_desktop
+            except Exception:
+                pass
+            logger.warning("LibreOffice listener is not responding, restarting it")
+            self._stop_libreoffice_listener()
+        
+        try:
+            self._lo_desktop = self._start_libreoffice_listener()
+        except Exception as e:
+            logger.warning(f"Could not start LibreOffice listener: {e}")
+            self._stop_libreoffice_listener()
+        return self._lo_desktop
+    
+    def _libreoffice_convert_via_uno(
+        self,
+        input_path: Path,
+        output_path: Path,
+        filter_name: str,
+        timeout: int = 120
+    ) -> bool:
+        """
+        Convert a document to PDF through the persistent LibreOffice listener.
+        
+        Args:
+            input_path: Document to convert
+            output_path: Destination PDF path
+            filter_name: LibreOffice PDF export filter (e.g. "writer_pdf_Export")
+            timeout: Maximum time to wait (seconds)
+            
+        Returns:
+            True if converted, False if the listener is unavailable or died
+            (caller should fall back to a one-shot LibreOffice process)
+            
+        Raises:
+            subprocess.TimeoutExpired: Conversion took longer than timeout
+            RuntimeError: LibreOffice could not convert this document
+        """
+        desktop = self._get_libreoffice_desktop()
+        if desktop is None:
+            return False
+        
+        import uno
+        from com.sun.star.beans import PropertyValue
+        
+        def props(**values):
+            result = []
+            for name, value in values.items():
+                prop = PropertyValue()
+                prop.Name = name
+                prop.Value = value
+                result.append(prop)
+            return tuple(result)
+        
+        # UNO calls have no timeout of their own - kill the listener if it hangs
+        timed_out = threading.Event()
+        
+        def on_timeout():
+            timed_out.set()
+            self._stop_libreoffice_listener()
+        
+        watchdog = threading.Timer(timeout, on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        
+        document = None
+        try:
+            document = desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(input_path.resolve())),
+                "_blank", 0, props(Hidden=True, ReadOnly=True)
+            )
+            if document is None:
+                raise RuntimeError("LibreOffice could not open the document")
+            document.storeToURL(
+                uno.systemPathToFileUrl(str(output_path.resolve())),
+                props(FilterName=filter_name)
+            )
+            return True
+        except Exception as e:
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(self.libreoffice_path, timeout)
+            if self._lo_proc is None or self._lo_proc.poll() is not None:
+                logger.warning(f"LibreOffice listener died during conversion: {e}")
+                self._stop_libreoffice_listener()
+                return False
+            raise RuntimeError(f"LibreOffice could not convert document: {e}")
+        finally:
+            watchdog.cancel()
+            if document is not None:
+                try:
+                    document.close(True)
+                except Exception:
+                    pass
+    
+    def _new_placeholder_pdf(self) -> Tuple['pikepdf.Pdf', Tuple[float, float, float, float]]:
+        """
+        Start a placeholder PDF from the cached template page.
+        
+        The template is parsed once per converter and its page copied into a
+        fresh document, rather than re-parsing the template bytes every time.
+        
+        Returns:
+            Tuple of (new single-page PDF, field slot as x, y, width, height)
+        """
+        import pikepdf
+        
+        template, slot = _placeholder_template()
+        pdf = pikepdf.Pdf.new()
+        # pikepdf objects aren't safe to share between threads, so copy under a lock
+        with self._template_lock:
+            if self._template_pdf is None:
+                self._template_pdf = pikepdf.Pdf.open(io.BytesIO(template))
+            pdf.pages.extend(self._template_pdf.pages)
+        return pdf, slot
     
     def _create_embedded_attachment_pdf(
         self, 
         input_path: Path, 
         output_path: Path, 
-        ext: str
+        ext: str,
+        content: Optional[bytes] = None
     ) -> ConversionResult:
         """
         Create a placeholder PDF with the original file embedded.
         For unsupported or failed conversions.
         """
+        import pikepdf
+        
         try:
-            buffer = io.BytesIO()
-            
-            doc = SimpleDocTemplate(
-                buffer,
-                pagesize=letter,
-                rightMargin=inch,
-                leftMargin=inch,
-                topMargin=1.5*inch,
-                bottomMargin=inch
-            )
-            
-            styles = getSampleStyleSheet()
-            
-            # Title style
-            title_style = ParagraphStyle(
-                name='AttachmentTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                textColor=colors.Color(0.2, 0.2, 0.4),
-                spaceAfter=15,
-                alignment=1  # Center
-            )
-            
-            # Filename style
-            filename_style = ParagraphStyle(
-                name='AttachmentFilename',
-                parent=styles['Normal'],
-                fontSize=12,
-                textColor=colors.Color(0.2, 0.2, 0.2),
-                spaceAfter=5,
-                alignment=1,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Info style
-            info_style = ParagraphStyle(
-                name='AttachmentInfo',
-                parent=styles['Normal'],
-                fontSize=10,
-                textColor=colors.Color(0.4, 0.4, 0.4),
-                spaceAfter=8,
-                alignment=1
-            )
-            
-            # Not converted warning style
-            warning_style = ParagraphStyle(
-                name='NotConverted',
-                parent=styles['Normal'],
-                fontSize=14,
-                textColor=colors.Color(0.8, 0.1, 0.1),
-                spaceBefore=15,
-                spaceAfter=15,
-                alignment=1,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Instructions style
-            instructions_style = ParagraphStyle(
-                name='Instructions',
-                parent=styles['Normal'],
-                fontSize=9,
-                textColor=colors.Color(0.5, 0.5, 0.5),
-                spaceBefore=20,
-                alignment=1,
-                leading=14
-            )
+            # Static page is built once; only the filename and size are drawn per file
+            pdf, slot = self._new_placeholder_pdf()
             
-            # Get file info
-            file_size = input_path.stat().st_size if input_path.exists() else 0
+            # Get file info (one stat; size of 0 / nothing embedded if the file is gone)
+            if content is not None:
+                file_size = len(content)
+                has_file = True
+            else:
+                try:
+                    file_size = input_path.stat().st_size
+                    has_file = True
+                except OSError:
+                    file_size = 0
+                    has_file = False
             size_str = self._format_file_size(file_size)
+            self._draw_placeholder_fields(
+                pdf, slot, input_path.name, f"Type: {ext.upper()} | Size: {size_str}"
+            )
             
-            story = [
-                Spacer(1, 0.5*inch),
-                Paragraph("📎 ATTACHMENT", title_style),
-                Spacer(1, 10),
-                Paragraph(self._escape_text(input_path.name), filename_style),
-                Paragraph(f"Type: {ext.upper()} | Size: {size_str}", info_style),
-                Spacer(1, 15),
-                Paragraph("(Not Converted)", warning_style),
-                Spacer(1, 10),
-                Paragraph(
-                    "This attachment type cannot be converted to PDF.",
-                    info_style
-                ),
-                Paragraph(
-                    "The original file is embedded in this PDF document.<br/><br/>"
-                    "<b>To access the file:</b><br/>"
-                    "• In Adobe Reader: View → Show/Hide → Navigation Panes → Attachments<br/>"
-                    "• In Preview (Mac): The attachment panel may not be supported<br/>"
-                    "• In other readers: Look for a paperclip icon or attachments panel",
-                    instructions_style
-                ),
-            ]
-            
-            doc.build(story)
-            
-            # Now create the final PDF with embedded file using pikepdf
-            pdf_bytes = buffer.getvalue()
-            
-            # Use pikepdf to embed the file (compatible with pikepdf merge)
-            import pikepdf
-            pdf = pikepdf.Pdf.open(io.BytesIO(pdf_bytes))
-            
-            # Read the original file and embed it
-            if input_path.exists():
-                with open(input_path, 'rb') as f:
-                    file_data = f.read()
-                
-                # Create the embedded file stream
-                file_stream = pikepdf.Stream(pdf, file_data)
+            # Read the original file (unless already in memory) and embed it
+            if has_file:
+                # Create the embedded file stream, compressed up front so pikepdf only
+                # ever holds the deflated copy (it would deflate it on save anyway)
+                raw_size, deflated = self._deflate_for_embedding(input_path, content)
+                file_stream = pikepdf.Stream(pdf, deflated)
+                del deflated
+                file_stream['/Filter'] = pikepdf.Name('/FlateDecode')
+                file_stream['/Params'] = pikepdf.Dictionary({'/Size': raw_size})
                 file_stream['/Type'] = pikepdf.Name('/EmbeddedFile')
                 
                 # Try to set MIME type based on extension
-                mime_types = {
-                    '.ics': 'text/calendar',
-                    '.wav': 'audio/wav',
-                    '.mp3': 'audio/mpeg',
-                    '.msg': 'application/vnd.ms-outlook',
-                    '.eml': 'message/rfc822',
-                    '.zip': 'application/zip',
-                    '.doc': 'application/msword',
-                    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                    '.xls': 'application/vnd.ms-excel',
-                    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                }
-                mime_type = mime_types.get(ext.lower(), 'application/octet-stream')
+                mime_type = MIME_TYPES.get(ext.lower(), 'application/octet-stream')
                 file_stream['/Subtype'] = pikepdf.Name(f'/{mime_type.replace("/", "#2F")}')
                 
                 # Create file spec dictionary
@@ -432,7 +929,7 @@ class AttachmentConverter:
                 page.Annots.append(pdf.make_indirect(link_annot))
             
             # Write output
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(output_path.parent)
             pdf.save(str(output_path))
             
             return ConversionResult(
@@ -454,6 +951,108 @@ class AttachmentConverter:
                 message=f"Failed to create embedded attachment: {str(e)}"
             )
     
+    def _deflate_for_embedding(
+        self,
+        input_path: Path,
+        content: Optional[bytes] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Zlib-compress a file for embedding, reading it in blocks.
+        
+        Args:
+            input_path: File to compress (read only if content is None)
+            content: The file's bytes if already in memory
+            
+        Returns:
+            Tuple of (uncompressed size, FlateDecode data)
+        """
+        compressor = zlib.compressobj(6)
+        out = io.BytesIO()
+        raw_size = 0
+        block_size = 1024 * 1024
+        
+        if content is not None:
+            view = memoryview(content)
+            blocks = (view[i:i + block_size] for i in range(0, len(view), block_size))
+            for block in blocks:
+                out.write(compressor.compress(block))
+            raw_size = len(content)
+        else:
+            with open(input_path, 'rb') as f:
+                for block in iter(lambda: f.read(block_size), b''):
+                    raw_size += len(block)
+                    out.write(compressor.compress(block))
+        
+        out.write(compressor.flush())
+        return raw_size, out.getvalue()
+    
+    def _draw_placeholder_fields(
+        self,
+        pdf: 'pikepdf.Pdf',
+        slot: Tuple[float, float, float, float],
+        filename: str,
+        info: str
+    ):
+        """
+        Draw the filename and type/size line into the placeholder template's slot.
+        
+        Args:
+            pdf: Open copy of the placeholder template
+            slot: (x, y, width, height) of the reserved area on the page
+            filename: Attachment filename (wrapped, centered, bold)
+            info: Type/size line (centered)
+        """
+        import pikepdf
+        from reportlab.lib.utils import simpleSplit
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        
+        page = pdf.pages[0]
+        font_type1 = {'/Type': pikepdf.Name.Font, '/Subtype': pikepdf.Name.Type1,
+                      '/Encoding': pikepdf.Name.WinAnsiEncoding}
+        bold = page.add_resource(
+            pikepdf.Dictionary({**font_type1, '/BaseFont': pikepdf.Name('/Helvetica-Bold')}),
+            pikepdf.Name.Font, prefix='PH'
+        )
+        regular = page.add_resource(
+            pikepdf.Dictionary({**font_type1, '/BaseFont': pikepdf.Name('/Helvetica')}),
+            pikepdf.Name.Font, prefix='PH'
+        )
+        
+        def winansi(text: str) -> str:
+            # Standard Type1 fonts only cover WinAnsi; same limit as the old Paragraph
+            return text.encode('cp1252', 'replace').decode('cp1252')
+        
+        slot_x, slot_y, slot_width, slot_height = slot
+        lines = simpleSplit(winansi(filename), 'Helvetica-Bold', 12, slot_width) or ['']
+        if len(lines) > PLACEHOLDER_NAME_LINES:
+            lines = lines[:PLACEHOLDER_NAME_LINES]
+            lines[-1] = lines[-1][:-1] + '\u2026'
+        
+        # (text, font, size, gray level, baseline) matching the old paragraph styles
+        top = slot_y + slot_height
+        runs = [
+            (line, 'Helvetica-Bold', 12, 0.2, top - 12 - i * 12)
+            for i, line in enumerate(lines)
+        ]
+        info_top = top - len(lines) * 12 - 5
+        runs.append((winansi(info), 'Helvetica', 10, 0.4, info_top - 10))
+        
+        ops = [([], pikepdf.Operator('q')), ([], pikepdf.Operator('BT'))]
+        for text, font_name, size, gray, y in runs:
+            x = slot_x + (slot_width - stringWidth(text, font_name, size)) / 2
+            font = bold if font_name == 'Helvetica-Bold' else regular
+            ops += [
+                ([font, size], pikepdf.Operator('Tf')),
+                ([gray, gray, gray], pikepdf.Operator('rg')),
+                ([1, 0, 0, 1, x, y], pikepdf.Operator('Tm')),
+                ([pikepdf.String(text.encode('cp1252', 'replace'))], pikepdf.Operator('Tj')),
+            ]
+        ops += [([], pikepdf.Operator('ET')), ([], pikepdf.Operator('Q'))]
+        
+        # Isolate the template's graphics state from ours
+        page.contents_add(pikepdf.Stream(pdf, b'q\n'), prepend=True)
+        page.contents_add(pikepdf.Stream(pdf, b'Q\n' + pikepdf.unparse_content_stream(ops)))
+    
     def _format_file_size(self, size: int) -> str:
         """Format file size in human readable form."""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -464,15 +1063,19 @@ class AttachmentConverter:
     
     def _escape_text(self, text: str) -> str:
         """Escape text for reportlab."""
-        if not text:
-            return ""
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        return text
+        return escape_markup(text) if text else ""
     
     def cleanup(self):
         """Clean up temporary files."""
+        self._stop_libreoffice_listener()
+        if self._html_pool is not None:
+            self._html_pool.shutdown(wait=True)
+            self._html_pool = None
+        self._known_dirs.clear()
+        with self._template_lock:
+            if self._template_pdf is not None:
+                self._template_pdf.close()
+                self._template_pdf = None
         if os.path.exists(self.temp_dir):
             shutil.rmtree(self.temp_dir, ignore_errors=True)
     
@@ -493,41 +1096,89 @@ class AttachmentConverter:
         Returns:
             ConversionResult with conversion details
         """
-        input_path = Path(input_path)
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        return self._convert_file(Path(input_path), Path(output_dir), output_filename)
+    
+    def _convert_file(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        output_filename: Optional[str],
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
+        """
+        Convert a file to PDF, consulting the result cache.
         
-        # Determine output filename
-        if output_filename:
-            output_path = output_dir / f"{output_filename}.pdf"
-        else:
-            output_path = output_dir / f"{input_path.stem}.pdf"
+        Args:
+            input_path: Path to the input file
+            output_dir: Directory for the output PDF
+            output_filename: Optional custom output filename (without .pdf)
+            content: The file's bytes if the caller already has them in memory
+            
+        Returns:
+            ConversionResult with conversion details
+        """
+        self._ensure_dir(output_dir)
         
-        # Get file extension
+        output_path = self._output_path(input_path, output_dir, output_filename)
         ext = input_path.suffix.lower()
         
-        if ext not in self.SUPPORTED_FORMATS:
+        # Converters that can work from memory get the bytes read here once,
+        # shared with the cache key, instead of hashing and then re-reading the file
+        if content is None and self.SUPPORTED_FORMATS.get(ext) in self.IN_MEMORY_METHODS:
+            content = self._read_if_small(input_path)
+        
+        # Reuse the PDF if identical content was already converted
+        cache_key = self._cache_key(input_path, content)
+        cached = self._get_cached_result(cache_key, input_path, output_path)
+        if cached is not None:
+            return cached
+        
+        # Converters may write output_path in place; an earlier output there
+        # may be linked to a cached PDF, so never write through it
+        try:
+            output_path.unlink()
+        except FileNotFoundError:
+            pass
+        result = self._convert_uncached(input_path, output_path, ext, content)
+        self._store_cached_result(cache_key, result)
+        return result
+    
+    def _convert_uncached(
+        self,
+        input_path: Path,
+        output_path: Path,
+        ext: str,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
+        """Run the conversion for one file, falling back to an embedded placeholder."""
+        # Get conversion method; a PDF under another (or no) extension is still a PDF
+        method_name = self.SUPPORTED_FORMATS.get(ext)
+        if method_name is None and self._has_pdf_header(input_path, content):
+            method_name = self.SUPPORTED_FORMATS['.pdf']
+        if method_name is None:
             # Create a placeholder PDF with embedded file for unsupported formats
-            return self._create_embedded_attachment_pdf(input_path, output_path, ext)
+            return self._create_embedded_attachment_pdf(input_path, output_path, ext, content)
         
-        # Get conversion method
-        method_name = self.SUPPORTED_FORMATS[ext]
         method = getattr(self, method_name)
         
         try:
             self._log(f"Converting {input_path.name}...")
-            result = method(input_path, output_path)
+            with self._lo_lock if ext in self.LIBREOFFICE_FILTERS else nullcontext():
+                if content is not None and method_name in self.IN_MEMORY_METHODS:
+                    result = method(input_path, output_path, content=content)
+                else:
+                    result = method(input_path, output_path)
             
             # If conversion failed, create embedded placeholder instead
             if result.status == ConversionStatus.FAILED:
-                return self._create_embedded_attachment_pdf(input_path, output_path, ext)
+                return self._create_embedded_attachment_pdf(input_path, output_path, ext, content)
             
             return result
         except Exception as e:
             logger.exception(f"Error converting {input_path}: {e}")
             # Try to create embedded placeholder on error
             try:
-                return self._create_embedded_attachment_pdf(input_path, output_path, ext)
+                return self._create_embedded_attachment_pdf(input_path, output_path, ext, content)
             except:
                 return ConversionResult(
                     status=ConversionStatus.FAILED,
@@ -537,6 +1188,459 @@ class AttachmentConverter:
                     message=f"Conversion error: {str(e)}"
                 )
     
+    def _make_doc(self, output_path: Path, pagesize=letter, margin: float = 72) -> 'SimpleDocTemplate':
+        """Create a Platypus document for output_path with the same margin on every side."""
+        from reportlab.platypus import SimpleDocTemplate
+        
+        return SimpleDocTemplate(
+            str(output_path),
+            pagesize=pagesize,
+            rightMargin=margin,
+            leftMargin=margin,
+            topMargin=margin,
+            bottomMargin=margin
+        )
+    
+    def _has_pdf_header(self, input_path: Path, content: Optional[bytes] = None) -> bool:
+        """Check for the %PDF- magic number."""
+        if content is not None:
+            return content.startswith(b'%PDF-')
+        try:
+            with open(input_path, 'rb') as f:
+                return f.read(5) == b'%PDF-'
+        except OSError:
+            return False
+    
+    # === Result Cache ===
+    
+    def _read_if_small(self, path: Path) -> Optional[bytes]:
+        """Read a file's bytes if it is small enough to cache, otherwise None."""
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > self.CACHE_MAX_FILE_SIZE:
+                    return None
+                return f.read()
+        except OSError:
+            return None
+    
+    def _cache_key(self, input_path: Path, content: Optional[bytes] = None) -> Optional[str]:
+        """
+        Key a file by its name, its content and the settings that shape the output.
+        
+        The name is part of the key because placeholders and some converters
+        print it into the PDF. OCR settings and available tools are included
+        because the cache outlives this converter.
+        
+        Returns:
+            Hex digest, or None if the file is too large to be worth hashing
+        """
+        settings = (
+            f"{self.CACHE_VERSION}|{self.ocr_enabled}|{self.ocr_dpi}|{self.ocr_preprocess}|"
+            f"{self.has_tesseract}|{self.has_libreoffice}|"
+        )
+        digest = hashlib.blake2b(settings.encode(), digest_size=16)
+        digest.update(input_path.name.encode('utf-8', 'replace'))
+        if content is not None:
+            if len(content) > self.CACHE_MAX_FILE_SIZE:
+                return None
+            digest.update(content)
+            return digest.hexdigest()
+        
+        try:
+            with open(input_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > self.CACHE_MAX_FILE_SIZE:
+                    return None
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            return digest.hexdigest()
+        except OSError:
+            return None
+    
+    def _get_cached_result(
+        self,
+        cache_key: Optional[str],
+        input_path: Path,
+        output_path: Path
+    ) -> Optional[ConversionResult]:
+        """
+        Place a previously converted PDF at output_path if one is cached.
+        
+        The cached PDF is linked rather than copied where possible (see
+        _fast_copy), and an output that is already a link to it, as after
+        re-processing into the same directory, is left alone.
+        """
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+        if cached is None:
+            cached = self._load_cached_entry(cache_key)
+            if cached is None:
+                return None
+        
+        cached_pdf, cached_result = cached
+        try:
+            try:
+                up_to_date = os.path.samefile(cached_pdf, output_path)
+            except FileNotFoundError:
+                up_to_date = False
+            if not up_to_date:
+                self._fast_copy(cached_pdf, output_path)
+            # mtime is the LRU clock for eviction
+            os.utime(cached_pdf)
+        except OSError:
+            # Evicted (possibly by another run) since it was indexed
+            with self._cache_lock:
+                self._result_cache.pop(cache_key, None)
+            return None
+        
+        logger.debug(f"Reusing cached conversion for {input_path.name}")
+        return replace(cached_result, output_path=output_path, original_path=input_path)
+    
+    def _store_cached_result(self, cache_key: Optional[str], result: ConversionResult):
+        """Keep a copy of a successful conversion for later identical inputs."""
+        if cache_key is None or result.output_path is None:
+            return
+        if result.status not in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL):
+            return
+        
+        cached_pdf = self.pdf_cache_dir / f"{cache_key}.pdf"
+        meta = {
+            'status': result.status.value,
+            'original_type': result.original_type,
+            'message': result.message,
+            'ocr_applied': result.ocr_applied,
+        }
+        # Write under temporary names and rename, so concurrent runs never
+        # see a half-written entry; the PDF goes last since it marks the entry
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        pdf_tmp = cached_pdf.with_name(cached_pdf.name + suffix)
+        meta_path = cached_pdf.with_suffix('.json')
+        meta_tmp = meta_path.with_name(meta_path.name + suffix)
+        try:
+            self._ensure_dir(self.pdf_cache_dir)
+            meta_tmp.write_text(json.dumps(meta), encoding='utf-8')
+            os.replace(meta_tmp, meta_path)
+            # Linked, not copied: outputs are replaced rather than rewritten
+            # (see _fast_copy()), so the entry can share the output's data
+            self._fast_copy(result.output_path, pdf_tmp)
+            size = pdf_tmp.stat().st_size
+            os.replace(pdf_tmp, cached_pdf)
+        except OSError as e:
+            logger.debug(f"Could not cache {result.original_path.name}: {e}")
+            for path in (meta_tmp, pdf_tmp):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            return
+        
+        with self._cache_lock:
+            self._result_cache[cache_key] = (cached_pdf, result)
+            if self._cache_bytes is not None:
+                self._cache_bytes += size
+        self._evict_cached_entries()
+    
+    def _load_cached_entry(self, cache_key: str) -> Optional[Tuple[Path, ConversionResult]]:
+        """Look up a PDF cached by an earlier run and index it for this one."""
+        cached_pdf = self.pdf_cache_dir / f"{cache_key}.pdf"
+        try:
+            meta = json.loads(cached_pdf.with_suffix('.json').read_text(encoding='utf-8'))
+            if not cached_pdf.exists():
+                return None
+            result = ConversionResult(
+                status=ConversionStatus(meta['status']),
+                output_path=cached_pdf,
+                original_path=cached_pdf,
+                original_type=meta['original_type'],
+                message=meta['message'],
+                ocr_applied=meta['ocr_applied']
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        with self._cache_lock:
+            self._result_cache[cache_key] = (cached_pdf, result)
+        return cached_pdf, result
+    
+    def _evict_cached_entries(self):
+        """Delete least recently used cache entries once the cache is over budget."""
+        with self._cache_lock:
+            # Size the directory once, then keep a running total
+            if self._cache_bytes is not None and self._cache_bytes <= self.CACHE_MAX_BYTES:
+                return
+            
+            entries = []
+            total = 0
+            try:
+                with os.scandir(self.pdf_cache_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith('.pdf'):
+                            st = entry.stat()
+                            entries.append((st.st_mtime, st.st_size, entry.name))
+                            total += st.st_size
+            except OSError:
+                return
+            
+            if total > self.CACHE_MAX_BYTES:
+                # Evict down to 90% so the next few stores don't rescan
+                entries.sort()
+                for _, size, name in entries:
+                    if total <= self.CACHE_MAX_BYTES * 0.9:
+                        break
+                    cached_pdf = self.pdf_cache_dir / name
+                    try:
+                        cached_pdf.unlink()
+                        cached_pdf.with_suffix('.json').unlink()
+                    except OSError:
+                        pass
+                    self._result_cache.pop(cached_pdf.stem, None)
+                    total -= size
+            self._cache_bytes = total
+    
+    def convert_many(
+        self,
+        input_paths: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        output_filenames: Optional[List[Optional[str]]] = None
+    ) -> List[ConversionResult]:
+        """
+        Convert several files to PDF, batching Office documents.
+        
+        Word, PowerPoint and .xls files are converted by a single LibreOffice run
+        instead of one process each (unless the persistent listener is
+        available, which already avoids the startup cost). Several HTML files
+        are rendered by WeasyPrint on a process pool. Everything else, and any
+        document the batches didn't produce, goes through convert() on a
+        thread pool; LibreOffice work is still done one file at a time.
+        
+        Args:
+            input_paths: Paths to the input files
+            output_dir: Directory for the output PDFs
+            output_filenames: Optional custom output filenames (without .pdf),
+                one per input path
+            
+        Returns:
+            ConversionResult for each input, in the same order
+        """
+        input_paths = [Path(p) for p in input_paths]
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if output_filenames is None:
+            output_filenames = [None] * len(input_paths)
+        
+        results: List[Optional[ConversionResult]] = [None] * len(input_paths)
+        
+        # LibreOffice names outputs <stem>.pdf, so a batch can't hold two equal stems
+        batch = {}
+        cache_keys = {}
+        for i, path in enumerate(input_paths):
+            if path.suffix.lower() in self.LIBREOFFICE_BATCH_FORMATS and path.stem not in batch:
+                # Already converted documents don't need to be in the batch
+                cache_keys[i] = self._cache_key(path)
+                output_path = self._output_path(path, output_dir, output_filenames[i])
+                results[i] = self._get_cached_result(cache_keys[i], path, output_path)
+                if results[i] is None:
+                    batch[path.stem] = i
+        
+        produced = {}
+        if len(batch) > 1 and self.has_libreoffice:
+            with self._lo_lock:
+                if self._get_libreoffice_desktop() is None:
+                    produced = self._libreoffice_convert_batch(
+                        [input_paths[i] for i in batch.values()]
+                    )
+        if produced:
+            for i in batch.values():
+                path = input_paths[i]
+                pdf = produced.get(path)
+                if pdf is None:
+                    continue
+                output_path = self._output_path(path, output_dir, output_filenames[i])
+                self._move_file(pdf, output_path)
+                results[i] = ConversionResult(
+                    status=ConversionStatus.SUCCESS,
+                    output_path=output_path,
+                    original_path=path,
+                    original_type=path.suffix.lower(),
+                    message="Document converted successfully"
+                )
+                self._store_cached_result(cache_keys[i], results[i])
+            shutil.rmtree(next(iter(produced.values())).parent, ignore_errors=True)
+        
+        remaining = [i for i, result in enumerate(results) if result is None]
+        if not remaining:
+            return results
+        targets = {
+            i: self._output_path(input_paths[i], output_dir, output_filenames[i])
+            for i in remaining
+        }
+        # Two inputs writing the same PDF keep the old last-one-wins order
+        # only if everything runs serially
+        serial = len(set(targets.values())) < len(remaining)
+        
+        html_jobs = {
+            i: (input_paths[i], targets[i]) for i in remaining
+            if input_paths[i].suffix.lower() in self.HTML_BATCH_FORMATS
+        }
+        if len(html_jobs) > 1 and not serial and load_weasyprint() is not None:
+            for i, result in self._render_html_batch(html_jobs).items():
+                results[i] = result
+            remaining = [i for i in remaining if results[i] is None]
+        
+        # The rest are independent; most of the time goes to child processes
+        # (LibreOffice, tesseract) or I/O, so threads overlap them well
+        if not remaining:
+            return results
+        workers = 1 if serial else min(self.CONVERT_WORKERS, os.cpu_count() or 1, len(remaining))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                i: executor.submit(self.convert, input_paths[i], output_dir, output_filenames[i])
+                for i in remaining
+            }
+            for i, future in futures.items():
+                results[i] = future.result()
+        
+        return results
+    
+    def _render_html_batch(self, jobs: Dict[int, Tuple[Path, Path]]) -> Dict[int, ConversionResult]:
+        """
+        Render several HTML files with WeasyPrint on a process pool.
+        
+        Args:
+            jobs: Index -> (input path, output path)
+            
+        Returns:
+            Index -> result for the files that were cached or rendered; files
+            that failed are left out so convert() can apply its fallbacks
+        """
+        results = {}
+        pending = {}
+        for i, (path, output_path) in jobs.items():
+            content = self._read_if_small(path)
+            cache_key = self._cache_key(path, content)
+            cached = self._get_cached_result(cache_key, path, output_path)
+            if cached is not None:
+                results[i] = cached
+            else:
+                html = self._read_html_file(path, content)
+                pending[i] = (cache_key, html)
+                # WeasyPrint writes in place; don't write through a cache link
+                try:
+                    output_path.unlink()
+                except FileNotFoundError:
+                    pass
+        if not pending:
+            return results
+        
+        futures = {}
+        try:
+            if self._html_pool is None:
+                # Loads multiprocessing, so only imported when a batch needs it
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                
+                # Up to one worker per CPU (Python 3.8 starts them all on the
+                # first submit), reused by later batches instead of paying
+                # process startup each time. spawn: this converter runs thread
+                # pools, and forking a process with running threads can deadlock
+                self._html_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            for i, (cache_key, html) in pending.items():
+                path, output_path = jobs[i]
+                self._log(f"Converting {path.name}...")
+                futures[i] = self._html_pool.submit(
+                    _render_html_worker, html, str(path.parent), str(output_path)
+                )
+            for i, future in futures.items():
+                path, output_path = jobs[i]
+                error = future.result()
+                if error is not None:
+                    logger.warning(f"WeasyPrint HTML conversion failed: {error}")
+                    continue
+                results[i] = ConversionResult(
+                    status=ConversionStatus.SUCCESS,
+                    output_path=output_path,
+                    original_path=path,
+                    original_type='.html',
+                    message="HTML converted successfully"
+                )
+                self._store_cached_result(pending[i][0], results[i])
+        except Exception as e:
+            # e.g. no process support, or a worker died; whatever is missing
+            # is converted serially, and the next batch starts a fresh pool
+            logger.warning(f"Parallel HTML conversion unavailable: {e}")
+            if self._html_pool is not None:
+                # Drop queued renders, and let running ones finish so they
+                # can't write an output the serial fallback is writing
+                for future in futures.values():
+                    future.cancel()
+                self._html_pool.shutdown(wait=True)
+                self._html_pool = None
+        
+        return results
+    
+    def _ensure_dir(self, path: Path):
+        """Create a directory once; later calls for the same path skip the syscall."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+    
+    def _fast_copy(self, src: Path, dst: Path):
+        """
+        Copy a file that is passed through unchanged, without copying its bytes if possible.
+        
+        Hard-links dst to src when both are on the same filesystem, then tries an
+        APFS clone on macOS, and only then falls back to a real copy. A linked
+        output shares its data with the input, so this is only safe because
+        output PDFs are treated as read-only: anything that rewrites a file here
+        must replace it (unlink, then create) rather than open it for writing.
+        
+        Args:
+            src: File to copy
+            dst: Destination path (replaced if it exists)
+        """
+        # Never write through an existing dst, it may itself be a link
+        try:
+            dst.unlink()
+        except FileNotFoundError:
+            pass
+        
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+        
+        if platform.system() == 'Darwin':
+            try:
+                result = subprocess.run(
+                    ['cp', '-c', str(src), str(dst)],
+                    capture_output=True,
+                    env=self._clean_env
+                )
+                if result.returncode == 0:
+                    return
+            except OSError:
+                pass
+        
+        shutil.copy(src, dst)
+    
+    def _move_file(self, src: Path, dst: Path):
+        """Move a produced file into place: a rename when possible, copy + delete across filesystems."""
+        try:
+            os.replace(src, dst)
+        except OSError:
+            shutil.move(str(src), str(dst))
+    
+    def _output_path(self, input_path: Path, output_dir: Path, output_filename: Optional[str]) -> Path:
+        """Determine the PDF path for an input file."""
+        if output_filename:
+            return output_dir / f"{output_filename}.pdf"
+        return output_dir / f"{input_path.stem}.pdf"
+    
     def convert_bytes(
         self,
         content: bytes,
@@ -558,61 +1662,61 @@ class AttachmentConverter:
         Returns:
             ConversionResult with conversion details
         """
-        # Save to temp file first
-        temp_path = Path(self.temp_dir) / filename
-        temp_path.parent.mkdir(parents=True, exist_ok=True)
+        # Save to temp file first (LibreOffice and the copy fallbacks need a path);
+        # one subdir per thread, so two same-named attachments converted at once
+        # don't overwrite each other's input
+        temp_path = Path(self.temp_dir) / f"in_{threading.get_ident()}" / filename
+        self._ensure_dir(temp_path.parent)
         
+        # A new file each time: an earlier output may be hard-linked to the old one
+        try:
+            temp_path.unlink()
+        except FileNotFoundError:
+            pass
         with open(temp_path, 'wb') as f:
             f.write(content)
         
-        return self.convert(temp_path, output_dir, output_filename)
+        # Hand the bytes along too, so PDF/image converters don't read the file back
+        return self._convert_file(temp_path, Path(output_dir), output_filename, content)
     
     # === PDF Conversion (with OCR) ===
     
-    def _convert_pdf(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _convert_pdf(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """Convert/process PDF, applying OCR if needed."""
         ocr_applied = False
         
         try:
-            reader = PdfReader(str(input_path))
-            
-            # Check if PDF is encrypted
-            if reader.is_encrypted:
-                # Try empty password first (some PDFs are "encrypted" with no password)
-                try:
-                    reader.decrypt('')
-                except Exception:
-                    # Password protected - just copy as-is and embed
-                    logger.warning(f"PDF is password-protected: {input_path.name}")
-                    return self._create_embedded_attachment_pdf(input_path, output_path, '.pdf')
+            import pikepdf
             
-            # Check if PDF has text
+            # One pikepdf pass over the first 3 pages: stop as soon as a page has
+            # text or an image, since either means the PDF is copied as-is
             has_text = False
-            for page in reader.pages[:3]:  # Check first 3 pages
-                text = page.extract_text()
-                if text and text.strip():
-                    has_text = True
-                    break
-            
-            # Check if PDF has embedded images (common in scanned PDFs)
             has_images = False
+            page_count = None
             try:
-                import pikepdf
-                with pikepdf.open(input_path) as pdf:
-                    for page in list(pdf.pages)[:3]:
-                        if '/Resources' in page:
-                            resources = page['/Resources']
-                            if '/XObject' in resources:
-                                xobjects = resources['/XObject']
-                                for key in xobjects.keys():
-                                    xobj = xobjects[key]
-                                    if xobj.get('/Subtype') == '/Image':
-                                        has_images = True
-                                        break
-                        if has_images:
+                # Empty-password "encrypted" PDFs open transparently
+                pdf = pikepdf.open(io.BytesIO(content) if content is not None else input_path)
+            except pikepdf.PasswordError:
+                # Password protected - just copy as-is and embed
+                logger.warning(f"PDF is password-protected: {input_path.name}")
+                return self._create_embedded_attachment_pdf(input_path, output_path, '.pdf', content)
+            
+            with pdf:
+                page_count = len(pdf.pages)
+                # Without OCR every outcome is a plain copy, so skip the scan
+                if self.ocr_enabled:
+                    for page in islice(pdf.pages, 3):  # Check first 3 pages
+                        if self._page_has_text(page):
+                            has_text = True
+                            break
+                        if self._page_has_images(page):
+                            has_images = True
                             break
-            except Exception:
-                pass  # If we can't check, assume no images
             
             # Decision logic:
             # - If PDF has text: just copy (already searchable)
@@ -623,17 +1727,17 @@ class AttachmentConverter:
             
             if has_text:
                 # PDF already has searchable text, just copy
-                shutil.copy(input_path, output_path)
+                self._fast_copy(input_path, output_path)
             elif has_images:
                 # PDF has images (likely scanned document) - just copy to preserve rendering
                 # OCR can cause compatibility issues on some viewers
-                shutil.copy(input_path, output_path)
+                self._fast_copy(input_path, output_path)
             elif self.ocr_enabled:
                 # No text, no images - try OCR
-                ocr_applied = self._ocr_pdf(input_path, output_path)
+                ocr_applied = self._ocr_pdf(input_path, output_path, page_count)
             else:
                 # Just copy as-is
-                shutil.copy(input_path, output_path)
+                self._fast_copy(input_path, output_path)
             
             return ConversionResult(
                 status=ConversionStatus.SUCCESS,
@@ -648,7 +1752,7 @@ class AttachmentConverter:
             logger.warning(f"PDF processing error for {input_path.name}: {e}")
             # If PDF is corrupted or has issues, try to just copy it
             try:
-                shutil.copy(input_path, output_path)
+                self._fast_copy(input_path, output_path)
                 return ConversionResult(
                     status=ConversionStatus.PARTIAL,
                     output_path=output_path,
@@ -660,35 +1764,56 @@ class AttachmentConverter:
             except Exception as copy_error:
                 logger.error(f"Failed to copy PDF {input_path.name}: {copy_error}")
                 # Last resort: embed the original file
-                return self._create_embedded_attachment_pdf(input_path, output_path, '.pdf')
+                return self._create_embedded_attachment_pdf(input_path, output_path, '.pdf', content)
     
-    def _ocr_pdf(self, input_path: Path, output_path: Path) -> bool:
-        """Apply OCR to a PDF file."""
+    def _page_has_text(self, page) -> bool:
+        """Check whether a pikepdf page's content stream draws any text."""
+        try:
+            import pikepdf
+            return bool(pikepdf.parse_content_stream(page, "Tj TJ ' \""))
+        except Exception:
+            return False
+    
+    def _page_has_images(self, page) -> bool:
+        """Check whether a pikepdf page references an image XObject."""
+        try:
+            if '/Resources' in page:
+                resources = page['/Resources']
+                if '/XObject' in resources:
+                    xobjects = resources['/XObject']
+                    for key in xobjects.keys():
+                        if xobjects[key].get('/Subtype') == '/Image':
+                            return True
+        except Exception:
+            pass  # If we can't check, assume no images
+        return False
+    
+    def _ocr_pdf(
+        self,
+        input_path: Path,
+        output_path: Path,
+        page_count: Optional[int] = None
+    ) -> bool:
+        """Apply OCR to a PDF file (page_count, if known, saves re-parsing it)."""
+        from PyPDF2 import PdfWriter
+        
         if not self.ocr_enabled or not self.has_tesseract:
-            shutil.copy(input_path, output_path)
+            self._fast_copy(input_path, output_path)
             return False
         
         try:
-            # Convert PDF to images (pass poppler_path on Windows if found)
-            convert_kwargs = {'dpi': 300}
-            if self.poppler_path:
-                convert_kwargs['poppler_path'] = self.poppler_path
-            
-            images = convert_from_path(str(input_path), **convert_kwargs)
-            
-            # OCR each page and create new PDF
-            pdf_pages = []
-            for img in images:
-                # Get OCR PDF for this page
-                pdf_bytes = pytesseract.image_to_pdf_or_hocr(img, extension='pdf')
-                pdf_pages.append(pdf_bytes)
-            
-            # Merge all pages
+            # OCR pages concurrently (each runs in its own tesseract process) and
+            # append them in page order, keeping only a few pages in flight
             writer = PdfWriter()
-            for pdf_bytes in pdf_pages:
-                reader = PdfReader(io.BytesIO(pdf_bytes))
-                for page in reader.pages:
-                    writer.add_page(page)
+            workers = self.ocr_workers
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for img in self._iter_pdf_page_images(input_path, self.ocr_dpi, page_count):
+                    pending.append(executor.submit(self._ocr_page, img, self.ocr_dpi))
+                    if len(pending) >= workers * 2:
+                        self._append_pdf_bytes(writer, pending.popleft().result())
+                while pending:
+                    self._append_pdf_bytes(writer, pending.popleft().result())
             
             with open(output_path, 'wb') as f:
                 writer.write(f)
@@ -697,32 +1822,151 @@ class AttachmentConverter:
         
         except Exception as e:
             logger.warning(f"OCR failed for PDF: {e}")
-            shutil.copy(input_path, output_path)
+            self._fast_copy(input_path, output_path)
             return False
     
+    def _ocr_page(self, img: 'Image.Image', dpi: int) -> bytes:
+        """OCR one rendered page image into a searchable single-page PDF."""
+        import pytesseract
+        
+        try:
+            if self.ocr_preprocess:
+                img = self._preprocess_for_ocr(img)
+            # Tell tesseract the render DPI so the PDF page keeps its original size
+            return pytesseract.image_to_pdf_or_hocr(img, extension='pdf', config=f'--dpi {dpi}')
+        finally:
+            img.close()
+    
+    def _preprocess_for_ocr(self, img: 'Image.Image') -> 'Image.Image':
+        """
+        Convert an image to black and white for tesseract.
+        
+        Uses Otsu's threshold, computed from the image histogram.
+        """
+        gray = img.convert('L')
+        hist = gray.histogram()
+        total = sum(hist)
+        sum_all = sum(level * count for level, count in enumerate(hist))
+        
+        # Otsu: pick the threshold that maximizes between-class variance
+        threshold = 127
+        best = 0.0
+        weight_bg = 0
+        sum_bg = 0
+        for level, count in enumerate(hist):
+            weight_bg += count
+            sum_bg += level * count
+            weight_fg = total - weight_bg
+            if weight_bg == 0 or weight_fg == 0:
+                continue
+            mean_bg = sum_bg / weight_bg
+            mean_fg = (sum_all - sum_bg) / weight_fg
+            variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+            if variance > best:
+                best = variance
+                threshold = level
+        return gray.point([255 if level > threshold else 0 for level in range(256)])
+    
+    def _append_pdf_bytes(self, writer: 'PdfWriter', pdf_bytes: bytes):
+        """Append every page of an in-memory PDF to a writer."""
+        from PyPDF2 import PdfReader
+        
+        for page in PdfReader(io.BytesIO(pdf_bytes)).pages:
+            writer.add_page(page)
+    
+    def _iter_pdf_page_images(
+        self,
+        input_path: Path,
+        dpi: int = 300,
+        page_count: Optional[int] = None
+    ):
+        """
+        Rasterize a PDF one page at a time.
+        
+        Uses PyMuPDF when installed (in-process, no Poppler fork), otherwise
+        pdf2image/Poppler.
+        
+        Args:
+            input_path: PDF to rasterize
+            dpi: Render resolution
+            page_count: Number of pages, if the caller already knows it
+            
+        Yields:
+            RGB PIL image for each page
+        """
+        from PIL import Image
+        from pdf2image import convert_from_path
+        
+        try:
+            import fitz
+        except ImportError:
+            fitz = None
+        
+        if fitz is not None:
+            with fitz.open(str(input_path)) as doc:
+                for page in doc:
+                    pix = page.get_pixmap(dpi=dpi)
+                    yield Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+            return
+        
+        # Convert PDF to images (pass poppler_path on Windows if found)
+        convert_kwargs = {'dpi': dpi, 'fmt': 'jpeg', 'paths_only': True}
+        if self.poppler_path:
+            convert_kwargs['poppler_path'] = self.poppler_path
+        
+        # Render a few pages at a time to disk so memory stays flat on long PDFs
+        if page_count is None:
+            import pikepdf
+            with pikepdf.open(input_path) as pdf:
+                page_count = len(pdf.pages)
+        chunk = self.OCR_CHUNK_PAGES
+        for first_page in range(1, page_count + 1, chunk):
+            last_page = min(first_page + chunk - 1, page_count)
+            with tempfile.TemporaryDirectory(dir=self.temp_dir) as chunk_dir:
+                image_paths = convert_from_path(
+                    str(input_path),
+                    first_page=first_page,
+                    last_page=last_page,
+                    output_folder=chunk_dir,
+                    **convert_kwargs
+                )
+                for image_path in image_paths:
+                    img = Image.open(image_path)
+                    img.load()
+                    yield img
+    
     # === Image Conversion ===
     
-    def _convert_image(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _convert_image(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """Convert image to PDF with OCR."""
+        from PIL import Image
+        import pytesseract
+        
         ocr_applied = False
         
         try:
-            img = Image.open(input_path)
+            img = Image.open(io.BytesIO(content) if content is not None else input_path)
+            source_dpi = img.info.get('dpi')
+            
+            # JPEG/PNG that need no mode conversion can be wrapped without re-encoding
+            passthrough = img.format in ('JPEG', 'PNG') and img.mode in ('RGB', 'L')
             
             # Convert to RGB if necessary
             if img.mode in ('RGBA', 'P', 'LA'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
+                img = self._flatten_on_white(img)
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
             
             if self.ocr_enabled and self.has_tesseract:
                 # Create searchable PDF with OCR
                 try:
-                    pdf_bytes = pytesseract.image_to_pdf_or_hocr(img, extension='pdf')
+                    ocr_img, config = self._prepare_image_for_ocr(img, source_dpi)
+                    pdf_bytes = pytesseract.image_to_pdf_or_hocr(ocr_img, extension='pdf', config=config)
                     with open(output_path, 'wb') as f:
                         f.write(pdf_bytes)
                     ocr_applied = True
@@ -730,7 +1974,7 @@ class AttachmentConverter:
                     logger.warning(f"OCR failed for image: {e}")
                     # Fallback to simple conversion
                     img.save(output_path, 'PDF', resolution=300)
-            else:
+            elif not (passthrough and self._image_to_pdf_passthrough(input_path, output_path, content)):
                 # Simple conversion without OCR
                 img.save(output_path, 'PDF', resolution=300)
             
@@ -746,6 +1990,73 @@ class AttachmentConverter:
         except Exception as e:
             raise RuntimeError(f"Image conversion failed: {e}")
     
+    def _prepare_image_for_ocr(
+        self,
+        img: 'Image.Image',
+        source_dpi: Optional[Tuple[float, float]] = None
+    ) -> Tuple['Image.Image', str]:
+        """
+        Shrink oversized images (and optionally binarize) before tesseract.
+        
+        Args:
+            img: RGB image to OCR (not modified)
+            source_dpi: The image's own DPI, if it declared one
+            
+        Returns:
+            Tuple of (image to OCR, tesseract config string)
+        """
+        from PIL import Image
+        
+        scale = 1.0
+        if max(img.size) > self.OCR_MAX_IMAGE_SIDE:
+            # Tesseract time grows with pixel count; text is readable well below this
+            scale = self.OCR_MAX_IMAGE_SIDE / max(img.size)
+            img = img.copy()
+            img.thumbnail((self.OCR_MAX_IMAGE_SIDE, self.OCR_MAX_IMAGE_SIDE), Image.LANCZOS)
+        
+        if self.ocr_preprocess:
+            img = self._preprocess_for_ocr(img)
+        
+        # Scale the declared DPI too, so the PDF page keeps the image's physical size
+        config = ''
+        if source_dpi and source_dpi[0]:
+            config = f'--dpi {max(1, round(float(source_dpi[0]) * scale))}'
+        return img, config
+    
+    def _flatten_on_white(self, img: 'Image.Image') -> 'Image.Image':
+        """Composite an image with transparency onto a white background."""
+        from PIL import Image
+        
+        # convert() keeps the alpha of LA and palette transparency
+        rgba = img.convert('RGBA')
+        background = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, rgba).convert('RGB')
+    
+    def _image_to_pdf_passthrough(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> bool:
+        """
+        Wrap a JPEG/PNG in a PDF with img2pdf, keeping the compressed stream.
+        
+        Returns:
+            True if written, False if img2pdf can't handle the image
+        """
+        import img2pdf
+        
+        try:
+            # Same page size PIL produced with resolution=300
+            layout = img2pdf.get_fixed_dpi_layout_fun((300, 300))
+            pdf_bytes = img2pdf.convert(content if content is not None else str(input_path), layout_fun=layout)
+            with open(output_path, 'wb') as f:
+                f.write(pdf_bytes)
+            return True
+        except Exception as e:
+            logger.debug(f"img2pdf could not convert {input_path.name}, using PIL: {e}")
+            return False
+    
     # === Word Document Conversion ===
     
     def _convert_docx(self, input_path: Path, output_path: Path) -> ConversionResult:
@@ -768,34 +2079,14 @@ class AttachmentConverter:
     
     def _libreoffice_convert(self, input_path: Path, output_path: Path, ext: str) -> ConversionResult:
         """Convert document using LibreOffice."""
-        if not self.has_libreoffice:
-            # Fallback: try to extract text
-            return self._fallback_document_convert(input_path, output_path, ext)
-        
-        try:
-            # Use the stored LibreOffice path (handles macOS app bundle)
-            lo_path = self.libreoffice_path
-            
-            # Create temp output directory
-            temp_out = Path(self.temp_dir) / "lo_output"
-            temp_out.mkdir(exist_ok=True)
-            
-            # Run LibreOffice conversion using thread-safe subprocess helper
-            cmd = [
-                lo_path,
-                '--headless',
-                '--convert-to', 'pdf',
-                '--outdir', str(temp_out),
-                str(input_path)
-            ]
-            
-            result = self._safe_subprocess_run(cmd, timeout=120)
-            
-            # Find output file
-            expected_output = temp_out / f"{input_path.stem}.pdf"
-            
-            if expected_output.exists():
-                shutil.move(str(expected_output), str(output_path))
+        if not self.has_libreoffice:
+            # Fallback: try to extract text
+            return self._fallback_document_convert(input_path, output_path, ext)
+        
+        try:
+            # Prefer the persistent listener - it skips LibreOffice startup per file
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._libreoffice_convert_via_uno(input_path, output_path, self.LIBREOFFICE_FILTERS[ext]):
                 return ConversionResult(
                     status=ConversionStatus.SUCCESS,
                     output_path=output_path,
@@ -803,8 +2094,15 @@ class AttachmentConverter:
                     original_type=ext,
                     message="Document converted successfully"
                 )
-            else:
-                raise RuntimeError(f"LibreOffice did not produce output: {result.stderr}")
+            
+            self._libreoffice_cli_convert(input_path, output_path, 'pdf', timeout=120)
+            return ConversionResult(
+                status=ConversionStatus.SUCCESS,
+                output_path=output_path,
+                original_path=input_path,
+                original_type=ext,
+                message="Document converted successfully"
+            )
         
         except subprocess.TimeoutExpired:
             logger.warning(f"LibreOffice timed out converting {input_path.name} (>120s)")
@@ -813,46 +2111,92 @@ class AttachmentConverter:
             logger.warning(f"LibreOffice conversion failed for {input_path.name}: {e}")
             return self._fallback_document_convert(input_path, output_path, ext)
     
-    def _libreoffice_excel_to_pdf(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _libreoffice_cli_convert(self, input_path: Path, output_path: Path, convert_to: str, timeout: int):
         """
-        Convert Excel to PDF using LibreOffice with ALL sheets.
-        Uses special export options to ensure all sheets are included.
-        """
-        if not self.has_libreoffice:
-            return self._excel_fallback_convert(input_path, output_path, '.xlsx')
+        Convert one document with a one-off LibreOffice process.
+        
+        Each call gets its own output directory, so concurrent conversions of
+        files with the same stem can't pick up each other's PDF.
         
+        Args:
+            input_path: Document to convert
+            output_path: Where to put the PDF
+            convert_to: LibreOffice --convert-to target, e.g. 'pdf:calc_pdf_Export'
+            timeout: Seconds before the process is killed
+            
+        Raises:
+            subprocess.TimeoutExpired: If LibreOffice took too long
+            RuntimeError: If LibreOffice produced no PDF
+        """
+        temp_out = Path(tempfile.mkdtemp(prefix="lo_", dir=self.temp_dir))
         try:
-            lo_path = self.libreoffice_path
-            
-            # Create temp output directory
-            temp_out = Path(self.temp_dir) / "lo_output"
-            temp_out.mkdir(exist_ok=True)
-            
-            # LibreOffice Calc by default exports only the active sheet.
-            # To export ALL sheets, we need to use the proper export filter.
-            # The "calc_pdf_Export" filter with empty Selection exports all sheets.
+            # Use the stored LibreOffice path (handles macOS app bundle)
             cmd = [
-                lo_path,
+                self.libreoffice_path,
                 '--headless',
-                '--convert-to', 'pdf:calc_pdf_Export',
+                '--convert-to', convert_to,
                 '--outdir', str(temp_out),
                 str(input_path)
             ]
+            result = self._safe_subprocess_run(cmd, timeout=timeout)
             
-            logger.info(f"Converting Excel with all sheets: {input_path.name}")
-            
-            # Use thread-safe subprocess helper (longer timeout for multi-sheet workbooks)
-            result = self._safe_subprocess_run(cmd, timeout=180)
-            
-            # Find output file
             expected_output = temp_out / f"{input_path.stem}.pdf"
+            try:
+                self._move_file(expected_output, output_path)
+            except OSError:
+                raise RuntimeError(f"LibreOffice did not produce output: {result.stderr}")
+        finally:
+            shutil.rmtree(temp_out, ignore_errors=True)
+    
+    def _libreoffice_convert_batch(self, input_paths: List[Path]) -> Dict[Path, Path]:
+        """
+        Convert several documents with one LibreOffice process.
+        
+        Args:
+            input_paths: Documents to convert (must have distinct stems)
             
-            if expected_output.exists():
-                # Verify we got more than just the active sheet by checking file size
-                pdf_size = expected_output.stat().st_size
-                logger.info(f"Excel PDF created: {pdf_size} bytes")
-                
-                shutil.move(str(expected_output), str(output_path))
+        Returns:
+            Dict mapping each converted input path to its PDF in a temp directory.
+            Inputs LibreOffice failed on are missing from the dict.
+        """
+        temp_out = Path(tempfile.mkdtemp(prefix="lo_batch_", dir=self.temp_dir))
+        cmd = [
+            self.libreoffice_path,
+            '--headless',
+            '--convert-to', 'pdf',
+            '--outdir', str(temp_out),
+            *(str(p) for p in input_paths)
+        ]
+        
+        self._log(f"Converting {len(input_paths)} documents with LibreOffice...")
+        timeout = 120 + 30 * len(input_paths)
+        try:
+            self._safe_subprocess_run(cmd, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"LibreOffice batch conversion timed out (>{timeout}s)")
+        except Exception as e:
+            logger.warning(f"LibreOffice batch conversion failed: {e}")
+        
+        produced = {}
+        for path in input_paths:
+            pdf = temp_out / f"{path.stem}.pdf"
+            if pdf.exists():
+                produced[path] = pdf
+        return produced
+    
+    def _libreoffice_excel_to_pdf(self, input_path: Path, output_path: Path) -> ConversionResult:
+        """
+        Convert Excel to PDF using LibreOffice with ALL sheets.
+        Uses special export options to ensure all sheets are included.
+        """
+        if not self.has_libreoffice:
+            return self._excel_fallback_convert(input_path, output_path, '.xlsx')
+        
+        try:
+            # Persistent listener first; storeToURL exports every sheet by default
+            if self._libreoffice_convert_via_uno(
+                input_path, output_path, self.LIBREOFFICE_FILTERS['.xlsx'], timeout=180
+            ):
                 return ConversionResult(
                     status=ConversionStatus.SUCCESS,
                     output_path=output_path,
@@ -860,8 +2204,21 @@ class AttachmentConverter:
                     original_type='.xlsx',
                     message="Excel converted with print settings applied"
                 )
-            else:
-                raise RuntimeError(f"LibreOffice did not produce output: {result.stderr}")
+            
+            # LibreOffice Calc by default exports only the active sheet.
+            # To export ALL sheets, we need to use the proper export filter.
+            # The "calc_pdf_Export" filter with empty Selection exports all sheets.
+            logger.info(f"Converting Excel with all sheets: {input_path.name}")
+            
+            # Longer timeout for multi-sheet workbooks
+            self._libreoffice_cli_convert(input_path, output_path, 'pdf:calc_pdf_Export', timeout=180)
+            return ConversionResult(
+                status=ConversionStatus.SUCCESS,
+                output_path=output_path,
+                original_path=input_path,
+                original_type='.xlsx',
+                message="Excel converted with print settings applied"
+            )
         
         except subprocess.TimeoutExpired:
             logger.warning(f"LibreOffice timed out converting Excel {input_path.name}")
@@ -873,42 +2230,37 @@ class AttachmentConverter:
     
     def _fallback_document_convert(self, input_path: Path, output_path: Path, ext: str) -> ConversionResult:
         """Fallback conversion for documents when LibreOffice is unavailable."""
-        
-        if ext in ('.docx', '.doc'):
-            return self._docx_to_pdf_fallback(input_path, output_path)
-        elif ext in ('.pptx', '.ppt'):
-            return self._pptx_to_pdf_fallback(input_path, output_path)
-        else:
-            return ConversionResult(
-                status=ConversionStatus.FAILED,
-                output_path=None,
-                original_path=input_path,
-                original_type=ext,
-                message="LibreOffice required for this format"
-            )
+        fallback = self.FALLBACK_CONVERTERS.get(ext)
+        if fallback is not None:
+            return getattr(self, fallback)(input_path, output_path)
+        return ConversionResult(
+            status=ConversionStatus.FAILED,
+            output_path=None,
+            original_path=input_path,
+            original_type=ext,
+            message="LibreOffice required for this format"
+        )
     
     def _docx_to_pdf_fallback(self, input_path: Path, output_path: Path) -> ConversionResult:
         """Convert DOCX to PDF using python-docx (text only)."""
+        from reportlab.platypus import Paragraph, Spacer
+        from docx import Document as DocxDocument
+        
         try:
             doc = DocxDocument(str(input_path))
             
             # Create PDF with reportlab
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
+            pdf_doc = self._make_doc(output_path)
             
-            styles = getSampleStyleSheet()
-            story = []
+            styles = _report_styles()
+            normal_style = styles['Normal']
             
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    story.append(Paragraph(para.text, styles['Normal']))
-                    story.append(Spacer(1, 12))
+            # One Paragraph + Spacer per non-empty paragraph, built in one comprehension
+            story = [
+                flowable
+                for para in doc.paragraphs if para.text.strip()
+                for flowable in (Paragraph(para.text, normal_style), Spacer(1, 12))
+            ]
             
             if story:
                 pdf_doc.build(story)
@@ -930,30 +2282,26 @@ class AttachmentConverter:
     
     def _pptx_to_pdf_fallback(self, input_path: Path, output_path: Path) -> ConversionResult:
         """Convert PPTX to PDF using python-pptx (text only)."""
+        from reportlab.platypus import Paragraph, Spacer
+        from pptx import Presentation
+        
         try:
             prs = Presentation(str(input_path))
             
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
+            pdf_doc = self._make_doc(output_path)
             
-            styles = getSampleStyleSheet()
+            styles = _report_styles()
             story = []
             
+            heading_style = styles['Heading2']
+            normal_style = styles['Normal']
             for i, slide in enumerate(prs.slides, 1):
-                story.append(Paragraph(f"<b>Slide {i}</b>", styles['Heading2']))
-                story.append(Spacer(1, 12))
-                
-                for shape in slide.shapes:
-                    if hasattr(shape, 'text') and shape.text.strip():
-                        story.append(Paragraph(shape.text, styles['Normal']))
-                        story.append(Spacer(1, 6))
-                
+                story.extend((Paragraph(f"<b>Slide {i}</b>", heading_style), Spacer(1, 12)))
+                story.extend(
+                    flowable
+                    for shape in slide.shapes if hasattr(shape, 'text') and shape.text.strip()
+                    for flowable in (Paragraph(shape.text, normal_style), Spacer(1, 6))
+                )
                 story.append(Spacer(1, 24))
             
             if story:
@@ -991,9 +2339,57 @@ class AttachmentConverter:
             if result.status == ConversionStatus.SUCCESS:
                 return result
         
-        # Fallback to pandas/reportlab
+        # Fallback to openpyxl/xlrd + reportlab
         return self._excel_fallback_convert(input_path, output_path, ext)
     
+    def _excel_print_ready(self, input_path: Path) -> bool:
+        """
+        Check whether every sheet is already visible, landscape and fit to one page wide.
+        
+        Reads the workbook XML directly: openpyxl's read-only mode doesn't load
+        page setup, and a full load is what this check exists to avoid.
+        Margins are not compared.
+        """
+        import zipfile
+        from xml.etree.ElementTree import iterparse
+        
+        ns = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+        try:
+            with zipfile.ZipFile(input_path) as zf:
+                with zf.open('xl/workbook.xml') as f:
+                    for _, elem in iterparse(f):
+                        if elem.tag == f'{ns}sheet' and elem.get('state', 'visible') != 'visible':
+                            return False
+                
+                sheet_names = [
+                    name for name in zf.namelist()
+                    if name.startswith('xl/worksheets/') and name.endswith('.xml')
+                ]
+                if not sheet_names:
+                    return False
+                
+                for name in sheet_names:
+                    fit_to_page = False
+                    page_setup = None
+                    with zf.open(name) as f:
+                        for _, elem in iterparse(f):
+                            if elem.tag == f'{ns}pageSetUpPr':
+                                fit_to_page = elem.get('fitToPage') in ('1', 'true')
+                            elif elem.tag == f'{ns}pageSetup':
+                                page_setup = dict(elem.attrib)
+                            elif elem.tag == f'{ns}row':
+                                elem.clear()
+                    
+                    if not fit_to_page or page_setup is None:
+                        return False
+                    if (page_setup.get('orientation') != 'landscape'
+                            or page_setup.get('fitToWidth', '1') != '1'
+                            or page_setup.get('fitToHeight', '1') != '0'):
+                        return False
+            return True
+        except Exception:
+            return False
+    
     def _convert_excel_with_settings(self, input_path: Path, output_path: Path) -> ConversionResult:
         """
         Convert Excel with optimized print settings:
@@ -1006,12 +2402,17 @@ class AttachmentConverter:
         from openpyxl.worksheet.page import PageMargins
         from openpyxl.worksheet.properties import WorksheetProperties, PageSetupProperties
         
-        # Create a temp copy to modify
+        # Nothing to rewrite if the workbook is already set up this way
+        if self._excel_print_ready(input_path):
+            logger.info(f"Excel print settings already applied: {input_path.name}")
+            return self._libreoffice_excel_to_pdf(input_path, output_path)
+        
+        # Modified copy for LibreOffice; openpyxl reads the original and writes
+        # it here on save, so the input is never copied byte for byte first
         temp_xlsx = Path(self.temp_dir) / f"print_ready_{input_path.name}"
-        shutil.copy(input_path, temp_xlsx)
         
         try:
-            wb = load_workbook(temp_xlsx)
+            wb = load_workbook(input_path)
             
             # Get list of all sheet names for logging
             sheet_names = wb.sheetnames
@@ -1073,15 +2474,15 @@ class AttachmentConverter:
             raise
     
     def _excel_fallback_convert(self, input_path: Path, output_path: Path, ext: str) -> ConversionResult:
-        """Fallback Excel conversion using pandas/reportlab (landscape, fit to page)."""
+        """Fallback Excel conversion using openpyxl/xlrd and reportlab (landscape, fit to page)."""
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+        
+        # Limit columns and rows for readability
+        max_cols = 10
+        max_rows = 100
+        
         try:
-            if ext == '.xlsx':
-                df_dict = pd.read_excel(input_path, sheet_name=None, engine='openpyxl')
-            else:
-                df_dict = pd.read_excel(input_path, sheet_name=None, engine='xlrd')
-            
             # Use landscape with small margins for spreadsheets
-            from reportlab.lib.pagesizes import landscape, letter
             pdf_doc = SimpleDocTemplate(
                 str(output_path),
                 pagesize=landscape(letter),
@@ -1091,45 +2492,35 @@ class AttachmentConverter:
                 bottomMargin=36
             )
             
-            styles = getSampleStyleSheet()
+            styles = _report_styles()
             story = []
             
-            for sheet_name, df in df_dict.items():
-                story.append(Paragraph(f"<b>Sheet: {sheet_name}</b>", styles['Heading2']))
-                story.append(Spacer(1, 12))
+            # Read one cell past each limit, so truncation can still be marked
+            for sheet_name, table_data in self._iter_excel_sheets(
+                input_path, ext, max_rows + 1, max_cols + 1
+            ):
+                story.extend((
+                    Paragraph(f"<b>Sheet: {sheet_name}</b>", styles['Heading2']),
+                    Spacer(1, 12),
+                ))
                 
-                if not df.empty:
-                    # Convert DataFrame to table
-                    table_data = [df.columns.tolist()] + df.values.tolist()
-                    
-                    # Limit columns and rows for readability
-                    max_cols = 10
-                    max_rows = 100
-                    
-                    if len(table_data[0]) > max_cols:
-                        table_data = [row[:max_cols] + ['...'] for row in table_data]
-                    
-                    if len(table_data) > max_rows:
-                        table_data = table_data[:max_rows] + [['...'] * len(table_data[0])]
-                    
-                    # Convert all values to strings
-                    table_data = [[str(cell)[:50] for cell in row] for row in table_data]
-                    
-                    table = Table(table_data)
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 8),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ]))
-                    
-                    story.append(table)
+                # First row is the header; a header alone is an empty sheet
+                if len(table_data) <= 1:
+                    story.extend((Paragraph("(empty sheet)", styles['Normal']), Spacer(1, 24)))
+                    continue
                 
-                story.append(Spacer(1, 24))
+                # Truncate columns and stringify in one pass; mark cut rows/columns
+                more_cols = ['...'] if len(table_data[0]) > max_cols else []
+                rows = [
+                    ['' if cell is None else str(cell)[:50] for cell in row[:max_cols]] + more_cols
+                    for row in table_data[:max_rows]
+                ]
+                if len(table_data) > max_rows:
+                    rows.append(['...'] * len(rows[0]))
+                
+                table = Table(rows)
+                table.setStyle(_report_table_styles()['excel'])
+                story.extend((table, Spacer(1, 24)))
             
             pdf_doc.build(story)
             
@@ -1144,39 +2535,105 @@ class AttachmentConverter:
         except Exception as e:
             raise RuntimeError(f"Excel conversion failed: {e}")
     
+    def _iter_excel_sheets(self, input_path: Path, ext: str, max_rows: int, max_cols: int):
+        """
+        Read the top-left corner of every sheet in a workbook.
+        
+        Rows are streamed and reading stops at max_rows, so only the cells that
+        can be shown are parsed (openpyxl read-only for .xlsx, xlrd for .xls).
+        
+        Args:
+            input_path: Workbook to read
+            ext: '.xlsx' or '.xls'
+            max_rows: Maximum non-blank rows per sheet
+            max_cols: Maximum columns per row
+            
+        Yields:
+            Tuple of (sheet name, rows); rows are equal-length lists of cell
+            values with None for empty cells
+        """
+        if ext == '.xlsx':
+            from openpyxl import load_workbook
+            
+            wb = load_workbook(input_path, read_only=True, data_only=True)
+            try:
+                for sheet in wb.worksheets:
+                    rows = sheet.iter_rows(max_col=max_cols, values_only=True)
+                    yield sheet.title, self._take_excel_rows(rows, max_rows)
+            finally:
+                wb.close()
+            return
+        
+        import xlrd
+        
+        def cell_value(cell):
+            if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+                return None
+            if cell.ctype == xlrd.XL_CELL_DATE:
+                return xlrd.xldate.xldate_as_datetime(cell.value, book.datemode)
+            if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                return bool(cell.value)
+            if cell.ctype == xlrd.XL_CELL_NUMBER and cell.value.is_integer():
+                return int(cell.value)
+            return cell.value
+        
+        book = xlrd.open_workbook(str(input_path), on_demand=True)
+        try:
+            for index in range(book.nsheets):
+                sheet = book.sheet_by_index(index)
+                rows = (
+                    [cell_value(cell) for cell in sheet.row_slice(r, 0, min(sheet.ncols, max_cols))]
+                    for r in range(sheet.nrows)
+                )
+                yield sheet.name, self._take_excel_rows(rows, max_rows)
+                book.unload_sheet(index)
+        finally:
+            book.release_resources()
+    
+    def _take_excel_rows(self, rows, max_rows: int) -> list:
+        """Collect up to max_rows non-blank rows, trimmed and padded to the used width."""
+        taken = []
+        width = 0
+        for row in rows:
+            used = [i for i, value in enumerate(row) if value is not None and value != '']
+            if not used:
+                continue
+            taken.append(list(row))
+            width = max(width, used[-1] + 1)
+            if len(taken) >= max_rows:
+                break
+        return [row[:width] + [None] * (width - len(row)) for row in taken]
+    
     # === Text File Conversion ===
     
-    def _convert_text(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _convert_text(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """Convert text file to PDF."""
+        from reportlab.platypus import Preformatted
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        
         try:
             # Read text with encoding detection
-            content = self._read_text_file(input_path)
+            content = self._read_text_file(input_path, content)
             
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
+            pdf_doc = self._make_doc(output_path)
             
             # Use monospace style for text files
-            styles = getSampleStyleSheet()
-            mono_style = ParagraphStyle(
-                'Mono',
-                parent=styles['Normal'],
-                fontName='Courier',
-                fontSize=9,
-                leading=12
-            )
+            mono_style = _report_styles()['Mono']
             
+            # Preformatted takes the text verbatim (no markup parsing) and is
+            # split across pages by reportlab, instead of one Paragraph per line.
+            # Long lines are wrapped at the frame width, as Paragraph did.
+            max_chars = int(pdf_doc.width // stringWidth('M', 'Courier', 9))
+            lines = content.expandtabs(8).split('\n')
             story = []
-            
-            for line in content.split('\n'):
-                # Escape special characters for reportlab
-                line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                story.append(Paragraph(line or '&nbsp;', mono_style))
+            for start in range(0, len(lines), self.TEXT_LINES_PER_BLOCK):
+                block = '\n'.join(lines[start:start + self.TEXT_LINES_PER_BLOCK])
+                story.append(Preformatted(block, mono_style, maxLineLength=max_chars))
             
             pdf_doc.build(story)
             
@@ -1191,102 +2648,105 @@ class AttachmentConverter:
         except Exception as e:
             raise RuntimeError(f"Text conversion failed: {e}")
     
-    def _read_text_file(self, path: Path) -> str:
-        """Read text file with encoding detection."""
-        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252', 'ascii']
+    def _read_text_file(self, path: Path, content: Optional[bytes] = None) -> str:
+        """Read text file (or its bytes, if already in memory) with encoding detection."""
+        # Read once; every attempt below decodes the same bytes
+        raw = content if content is not None else path.read_bytes()
+        
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        # Not UTF-8: let charset-normalizer guess from a prefix, if installed
+        try:
+            from charset_normalizer import from_bytes
+        except ImportError:
+            from_bytes = None
+        if from_bytes is not None:
+            best = from_bytes(raw[:65536]).best()
+            if best is not None:
+                return raw.decode(best.encoding, errors='replace')
         
-        for encoding in encodings:
+        for encoding in ('utf-16', 'latin-1', 'cp1252', 'ascii'):
             try:
-                with open(path, 'r', encoding=encoding) as f:
-                    return f.read()
-            except (UnicodeDecodeError, UnicodeError):
+                return raw.decode(encoding)
+            except UnicodeError:
                 continue
         
         # Last resort
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            return f.read()
+        return raw.decode('utf-8', errors='replace')
+    
+    def _read_html_file(self, path: Path, content: Optional[bytes] = None) -> str:
+        """
+        Read an HTML file (or its bytes), honouring a BOM or <meta charset>.
+        
+        Valid UTF-8 wins over the declaration, since mail clients often
+        label UTF-8 as ISO-8859-1; the declared charset is used before
+        falling back to _read_text_file's guessing.
+        """
+        raw = content if content is not None else path.read_bytes()
+        
+        if raw.startswith(b'\xef\xbb\xbf'):
+            return raw[3:].decode('utf-8', errors='replace')
+        if raw.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return raw.decode('utf-16', errors='replace')
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        match = _HTML_CHARSET_RE.search(raw, 0, 1024)
+        if match:
+            encoding = match.group(1).decode('ascii').lower()
+            # As browsers do: Latin-1 and ASCII labels mean windows-1252
+            if encoding in ('iso-8859-1', 'latin1', 'latin-1', 'us-ascii', 'ascii'):
+                encoding = 'cp1252'
+            try:
+                return raw.decode(encoding, errors='replace')
+            except LookupError:
+                pass
+        
+        return self._read_text_file(path, raw)
     
     # === ICS Calendar Conversion ===
     
-    def _convert_ics(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _convert_ics(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """
         Convert ICS (iCalendar) file to a nicely formatted PDF.
         Extracts event details like title, date/time, location, attendees, etc.
         """
+        from reportlab.platypus import Paragraph, Spacer
+        
         try:
-            content = self._read_text_file(input_path)
-            events = self._parse_ics_content(content)
+            events = self._parse_ics_content(self._read_text_file(input_path, content))
             
             if not events:
                 # No events found, create a simple text conversion
-                return self._convert_text(input_path, output_path)
+                return self._convert_text(input_path, output_path, content)
             
             # Create PDF with event details
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
-            styles = getSampleStyleSheet()
+            pdf_doc = self._make_doc(output_path)
             
             # Custom styles for calendar invite
-            title_style = ParagraphStyle(
-                'EventTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=12,
-                textColor=colors.HexColor('#1a365d')
-            )
-            
-            label_style = ParagraphStyle(
-                'Label',
-                parent=styles['Normal'],
-                fontSize=10,
-                fontName='Helvetica-Bold',
-                textColor=colors.HexColor('#4a5568'),
-                spaceBefore=8,
-                spaceAfter=2
-            )
-            
-            value_style = ParagraphStyle(
-                'Value',
-                parent=styles['Normal'],
-                fontSize=11,
-                leftIndent=10,
-                spaceAfter=6
-            )
-            
-            attendee_style = ParagraphStyle(
-                'Attendee',
-                parent=styles['Normal'],
-                fontSize=10,
-                leftIndent=20,
-                spaceAfter=2
-            )
-            
-            desc_style = ParagraphStyle(
-                'Description',
-                parent=styles['Normal'],
-                fontSize=10,
-                leftIndent=10,
-                spaceAfter=6
-            )
-            
-            story = []
+            styles = _report_styles()
+            title_style = styles['EventTitle']
+            label_style = styles['Label']
+            value_style = styles['Value']
+            attendee_style = styles['Attendee']
+            desc_style = styles['Description']
             
             # Header
-            story.append(Paragraph("📅 Calendar Invitation", styles['Title']))
-            story.append(Spacer(1, 20))
+            story = [Paragraph("📅 Calendar Invitation", styles['Title']), Spacer(1, 20)]
             
             for i, event in enumerate(events):
                 if i > 0:
-                    story.append(Spacer(1, 20))
-                    story.append(Paragraph("─" * 60, styles['Normal']))
-                    story.append(Spacer(1, 20))
+                    story.extend((Spacer(1, 20), Paragraph("─" * 60, styles['Normal']), Spacer(1, 20)))
                 
                 # Event title/summary
                 summary = self._escape_text(event.get('summary', 'Untitled Event'))
@@ -1314,26 +2774,34 @@ class AttachmentConverter:
                 
                 # Location
                 if event.get('location'):
-                    story.append(Paragraph("Location", label_style))
-                    story.append(Paragraph(self._escape_text(event['location']), value_style))
+                    story.extend((
+                        Paragraph("Location", label_style),
+                        Paragraph(self._escape_text(event['location']), value_style),
+                    ))
                 
                 # Organizer
                 if event.get('organizer'):
-                    story.append(Paragraph("Organizer", label_style))
-                    story.append(Paragraph(self._escape_text(event['organizer']), value_style))
+                    story.extend((
+                        Paragraph("Organizer", label_style),
+                        Paragraph(self._escape_text(event['organizer']), value_style),
+                    ))
                 
                 # Attendees
                 if event.get('attendees'):
                     story.append(Paragraph(f"Attendees ({len(event['attendees'])})", label_style))
-                    for attendee in event['attendees'][:20]:  # Limit to 20
-                        story.append(Paragraph(f"• {self._escape_text(attendee)}", attendee_style))
+                    story.extend(
+                        Paragraph(f"• {self._escape_text(attendee)}", attendee_style)
+                        for attendee in event['attendees'][:20]  # Limit to 20
+                    )
                     if len(event['attendees']) > 20:
                         story.append(Paragraph(f"  ... and {len(event['attendees']) - 20} more", attendee_style))
                 
                 # Status
                 if event.get('status'):
-                    story.append(Paragraph("Status", label_style))
-                    story.append(Paragraph(self._escape_text(event['status']), value_style))
+                    story.extend((
+                        Paragraph("Status", label_style),
+                        Paragraph(self._escape_text(event['status']), value_style),
+                    ))
                 
                 # Description
                 if event.get('description'):
@@ -1347,8 +2815,10 @@ class AttachmentConverter:
                 
                 # URL
                 if event.get('url'):
-                    story.append(Paragraph("URL", label_style))
-                    story.append(Paragraph(self._escape_text(event['url']), value_style))
+                    story.extend((
+                        Paragraph("URL", label_style),
+                        Paragraph(self._escape_text(event['url']), value_style),
+                    ))
             
             pdf_doc.build(story)
             
@@ -1371,21 +2841,8 @@ class AttachmentConverter:
         """
         events = []
         current_event = None
-        current_key = None
-        current_value = ""
-        
-        lines = content.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-        
-        # Handle line continuations (lines starting with space/tab are continuations)
-        unfolded_lines = []
-        for line in lines:
-            if line.startswith(' ') or line.startswith('\t'):
-                if unfolded_lines:
-                    unfolded_lines[-1] += line[1:]
-            else:
-                unfolded_lines.append(line)
         
-        for line in unfolded_lines:
+        for line in self._unfold_ics_lines(content):
             line = line.strip()
             if not line:
                 continue
@@ -1399,14 +2856,8 @@ class AttachmentConverter:
             elif current_event is not None and ':' in line:
                 # Parse property
                 # Handle properties with parameters like DTSTART;TZID=America/New_York:20240115T090000
-                if ';' in line.split(':')[0]:
-                    key_part = line.split(':')[0]
-                    key = key_part.split(';')[0]
-                    value = ':'.join(line.split(':')[1:])
-                else:
-                    key, value = line.split(':', 1)
-                
-                key = key.upper()
+                head, value = line.split(':', 1)
+                key = head.split(';', 1)[0].upper()
                 
                 if key == 'SUMMARY':
                     current_event['summary'] = self._decode_ics_value(value)
@@ -1428,19 +2879,14 @@ class AttachmentConverter:
                     
                     # Check for CN (Common Name) in the parameters part before the colon
                     # The full line might be: ORGANIZER;CN=John Smith:mailto:john@example.com
-                    # But we only have the value part after the first colon split
-                    # So check the key_part if it exists
-                    if ';' in line.split(':')[0]:
-                        key_part = line.split(':')[0]
-                        # Look for CN= in the parameters
-                        import re
-                        cn_match = re.search(r'CN=([^;:]+)', key_part, re.IGNORECASE)
+                    if ';' in head:
+                        cn_match = _ICS_CN_RE.search(head)
                         if cn_match:
                             organizer_name = cn_match.group(1).strip('"\'')
                     
                     # Extract email from mailto:
                     if 'mailto:' in organizer.lower():
-                        organizer_email = re.split(r'mailto:', organizer, flags=re.IGNORECASE)[-1]
+                        organizer_email = _ICS_MAILTO_RE.split(organizer)[-1]
                     else:
                         organizer_email = organizer
                     
@@ -1462,9 +2908,7 @@ class AttachmentConverter:
                     attendee = value
                     # Handle both MAILTO: and mailto: (case insensitive)
                     if 'mailto:' in attendee.lower():
-                        import re
-                        attendee = re.split(r'mailto:', attendee, flags=re.IGNORECASE)[-1]
-                        attendee = attendee.split('mailto:')[-1]
+                        attendee = _ICS_MAILTO_RE.split(attendee)[-1]
                     current_event['attendees'].append(attendee)
                 elif key == 'STATUS':
                     current_event['status'] = value
@@ -1473,6 +2917,20 @@ class AttachmentConverter:
         
         return events
     
+    def _unfold_ics_lines(self, content: str):
+        """Yield ICS lines with folded continuations (leading space/tab) joined back on."""
+        current = None
+        for line in _ICS_NEWLINE_RE.split(content):
+            if line.startswith((' ', '\t')):
+                if current is not None:
+                    current += line[1:]
+            else:
+                if current is not None:
+                    yield current
+                current = line
+        if current is not None:
+            yield current
+    
     def _decode_ics_value(self, value: str) -> str:
         """Decode ICS escaped characters."""
         value = value.replace('\\n', '\n')
@@ -1488,102 +2946,99 @@ class AttachmentConverter:
             # Remove any trailing Z (UTC indicator) for parsing
             clean_value = value.rstrip('Z')
             
-            # Try different formats
-            formats = [
-                ('%Y%m%dT%H%M%S', '%B %d, %Y at %I:%M %p'),  # 20240115T090000
-                ('%Y%m%d', '%B %d, %Y'),  # 20240115 (all-day event)
-            ]
-            
-            for in_fmt, out_fmt in formats:
-                try:
-                    from datetime import datetime
-                    dt = datetime.strptime(clean_value, in_fmt)
-                    result = dt.strftime(out_fmt)
-                    if value.endswith('Z'):
-                        result += ' (UTC)'
-                    return result
-                except ValueError:
-                    continue
+            # Pick the format by length rather than trying each one
+            if len(clean_value) == 15:
+                # 20240115T090000
+                result = datetime.strptime(clean_value, '%Y%m%dT%H%M%S').strftime('%B %d, %Y at %I:%M %p')
+            elif len(clean_value) == 8:
+                # 20240115 (all-day event)
+                result = datetime.strptime(clean_value, '%Y%m%d').strftime('%B %d, %Y')
+            else:
+                # Unknown format, return as-is
+                return value
             
-            # If no format matched, return as-is
-            return value
+            if value.endswith('Z'):
+                result += ' (UTC)'
+            return result
         except Exception:
             return value
     
     def _format_ics_duration(self, value: str) -> str:
         """Format ICS duration into human-readable format."""
-        # ICS duration format: P[n]W or P[n]DT[n]H[n]M[n]S
+        # ICS duration format: [+-]P[n]W or [+-]P[n]DT[n]H[n]M[n]S, always ASCII
         try:
-            result = []
-            value = value.upper()
-            
-            if value.startswith('P'):
-                value = value[1:]
-            
-            if 'W' in value:
-                weeks = int(value.split('W')[0])
-                result.append(f"{weeks} week{'s' if weeks != 1 else ''}")
-            elif 'T' in value:
-                date_part, time_part = value.split('T')
-                
-                if 'D' in date_part:
-                    days = int(date_part.split('D')[0])
-                    result.append(f"{days} day{'s' if days != 1 else ''}")
-                
-                if 'H' in time_part:
-                    hours = int(time_part.split('H')[0])
-                    result.append(f"{hours} hour{'s' if hours != 1 else ''}")
-                    time_part = time_part.split('H')[1]
-                
-                if 'M' in time_part:
-                    minutes = int(time_part.split('M')[0])
-                    result.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-            
-            return ', '.join(result) if result else value
-        except Exception:
+            data = value.strip().encode('ascii')
+        except UnicodeEncodeError:
             return value
+        
+        result = []
+        acc = 0
+        digits = False
+        for ch in data:
+            if 0x30 <= ch <= 0x39:
+                acc = acc * 10 + (ch - 0x30)
+                digits = True
+                continue
+            if digits:
+                unit = _ICS_DURATION_UNITS.get(ch & 0xDF)  # upper-case
+                if unit is None:
+                    return value
+                result.append(f"{acc} {unit}{'s' if acc != 1 else ''}")
+                acc = 0
+                digits = False
+            elif ch not in b'+-PTpt':  # sign and designators carry no label
+                return value
+        
+        return ', '.join(result) if result else value
 
     # === CSV Conversion ===
 
-    def _convert_csv(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _convert_csv(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """Convert CSV file to PDF."""
+        from reportlab.platypus import Paragraph, Spacer, LongTable
+        import csv
+        
         try:
-            df = pd.read_csv(input_path, nrows=1000)  # Limit rows
+            # Parse only the rows that will be shown: header + 1000. An empty
+            # file (common for log snippets) skips reading and decoding
+            size = len(content) if content is not None else input_path.stat().st_size
+            if size == 0:
+                table_data = []
+            else:
+                text = self._read_text_file(input_path, content)
+                rows = (row for row in csv.reader(io.StringIO(text, newline='')) if row)
+                table_data = list(islice(rows, 1001))
             
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=A4,
-                rightMargin=36,
-                leftMargin=36,
-                topMargin=36,
-                bottomMargin=36
-            )
+            pdf_doc = self._make_doc(output_path, pagesize=A4, margin=36)
             
-            styles = getSampleStyleSheet()
+            styles = _report_styles()
             story = []
             
-            story.append(Paragraph(f"<b>{input_path.name}</b>", styles['Heading2']))
+            story.append(Paragraph(f"<b>{escape_markup(input_path.name)}</b>", styles['Heading2']))
             story.append(Spacer(1, 12))
             
-            if not df.empty:
-                # Prepare table data
-                table_data = [df.columns.tolist()] + df.values.tolist()
-                
-                # Limit and truncate
+            if len(table_data) > 1:
+                # Limit and truncate; pad short rows so the table stays rectangular
                 max_cols = 8
-                if len(table_data[0]) > max_cols:
-                    table_data = [row[:max_cols] for row in table_data]
-                
-                table_data = [[str(cell)[:30] for cell in row] for row in table_data]
+                ncols = min(max(len(row) for row in table_data), max_cols)
+                table_data = [
+                    list(map(_table_cell, row[:ncols])) + [''] * (ncols - len(row))
+                    for row in table_data
+                ]
                 
-                table = Table(table_data)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 7),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                # Fixed column widths spare ReportLab measuring every cell;
+                # LongTable repeats the header on each page
+                table = LongTable(
+                    table_data,
+                    colWidths=[pdf_doc.width / ncols] * ncols,
+                    repeatRows=1
+                )
+                table.setStyle(_report_table_styles()['csv'])
                 
                 story.append(table)
             
@@ -1602,29 +3057,25 @@ class AttachmentConverter:
     
     # === HTML Conversion ===
     
-    def _convert_html(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _convert_html(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """Convert HTML file to PDF using WeasyPrint, or fallback to basic conversion."""
         # Try WeasyPrint first (may not be available on Windows)
-        try:
-            from weasyprint import HTML, CSS
-        except (ImportError, OSError, Exception):
+        weasyprint = load_weasyprint()
+        if weasyprint is None:
             # WeasyPrint not available - use fallback
             logger.info("WeasyPrint not available, using text fallback for HTML")
-            return self._html_text_fallback(input_path, output_path)
+            return self._html_text_fallback(input_path, output_path, content)
         
         try:
-            content = self._read_text_file(input_path)
+            html = self._read_html_file(input_path, content)
             
-            # Basic CSS for reasonable rendering
-            base_css = CSS(string='''
-                @page { size: letter; margin: 0.75in; }
-                body { font-family: sans-serif; font-size: 11pt; line-height: 1.4; }
-                table { border-collapse: collapse; width: 100%; }
-                th, td { border: 1px solid #ccc; padding: 4px 8px; }
-            ''')
-            
-            html_doc = HTML(string=content, base_url=str(input_path.parent))
-            html_doc.write_pdf(str(output_path), stylesheets=[base_css])
+            html_doc = weasyprint.HTML(string=html, base_url=str(input_path.parent))
+            html_doc.write_pdf(str(output_path), stylesheets=[_html_base_css()])
             
             return ConversionResult(
                 status=ConversionStatus.SUCCESS,
@@ -1636,42 +3087,42 @@ class AttachmentConverter:
         
         except ImportError:
             logger.warning("WeasyPrint not available, using text-only fallback")
-            return self._html_text_fallback(input_path, output_path)
+            return self._html_text_fallback(input_path, output_path, content)
         except Exception as e:
             logger.warning(f"WeasyPrint HTML conversion failed: {e}")
-            return self._html_text_fallback(input_path, output_path)
+            return self._html_text_fallback(input_path, output_path, content)
     
-    def _html_text_fallback(self, input_path: Path, output_path: Path) -> ConversionResult:
+    def _html_text_fallback(
+        self,
+        input_path: Path,
+        output_path: Path,
+        content: Optional[bytes] = None
+    ) -> ConversionResult:
         """Fallback HTML to PDF conversion (text only)."""
+        from reportlab.pdfgen.canvas import Canvas
+        from reportlab.lib.utils import simpleSplit
+        
         try:
-            from html.parser import HTMLParser
-            
-            class TextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text = []
-                
-                def handle_data(self, data):
-                    self.text.append(data.strip())
-            
-            content = self._read_text_file(input_path)
-            
-            parser = TextExtractor()
-            parser.feed(content)
-            text = ' '.join(filter(None, parser.text))
-            
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
-            styles = getSampleStyleSheet()
-            story = [Paragraph(text, styles['Normal'])]
-            pdf_doc.build(story)
+            pieces = self._html_text_pieces(self._read_html_file(input_path, content))
+            text = ' '.join(' '.join(pieces).split())
+            
+            # Plain wrapped text needs no Platypus layout; draw the lines directly
+            # (same font, size and leading as the Normal paragraph style)
+            font, size, leading, margin = 'Helvetica', 10, 12, 72
+            page_width, page_height = letter
+            top = page_height - margin - size
+            
+            canvas = Canvas(str(output_path), pagesize=letter)
+            canvas.setFont(font, size)
+            y = top
+            for line in simpleSplit(text, font, size, page_width - 2 * margin):
+                if y < margin:
+                    canvas.showPage()
+                    canvas.setFont(font, size)
+                    y = top
+                canvas.drawString(margin, y, line)
+                y -= leading
+            canvas.save()
             
             return ConversionResult(
                 status=ConversionStatus.PARTIAL,
@@ -1684,6 +3135,36 @@ class AttachmentConverter:
         except Exception as e:
             raise RuntimeError(f"HTML fallback conversion failed: {e}")
     
+    def _html_text_pieces(self, html: str) -> List[str]:
+        """
+        Extract the text nodes of an HTML document, stripped, empty ones dropped.
+        
+        Uses lxml (a python-docx dependency) when it can parse the document,
+        otherwise the much slower pure-Python html.parser.
+        """
+        try:
+            import lxml.html
+            pieces = lxml.html.fromstring(html).itertext()
+            return [p for p in (piece.strip() for piece in pieces) if p]
+        except Exception:
+            pass  # not installed, or a document lxml rejects (e.g. empty)
+        
+        from html.parser import HTMLParser
+        
+        class TextExtractor(HTMLParser):
+            def __init__(self):
+                super().__init__()
+                self.text = []
+            
+            def handle_data(self, data):
+                data = data.strip()
+                if data:
+                    self.text.append(data)
+        
+        parser = TextExtractor()
+        parser.feed(html)
+        return parser.text
+    
     # === EML Conversion ===
     
     def _convert_eml(self, input_path: Path, output_path: Path) -> ConversionResult:
@@ -1714,40 +3195,51 @@ class AttachmentConverter:
     
     def _convert_msg(self, input_path: Path, output_path: Path) -> ConversionResult:
         """Convert MSG (Outlook) file to PDF."""
+        from reportlab.platypus import Paragraph, Spacer
+        
         try:
             import extract_msg
             
+            # Read each property once (extract_msg parses OLE streams on access)
+            # and release the file before the PDF is laid out
             msg = extract_msg.Message(str(input_path))
+            try:
+                sender, to, subject, date, body = (
+                    self._msg_property(msg, name)
+                    for name in ('sender', 'to', 'subject', 'date', 'body')
+                )
+            finally:
+                msg.close()
             
-            pdf_doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
+            pdf_doc = self._make_doc(output_path)
             
-            styles = getSampleStyleSheet()
+            styles = _report_styles()
             story = []
             
             # Header
-            story.append(Paragraph("<b>From:</b> " + (msg.sender or "Unknown"), styles['Normal']))
-            story.append(Paragraph("<b>To:</b> " + (msg.to or "Unknown"), styles['Normal']))
-            story.append(Paragraph("<b>Subject:</b> " + (msg.subject or "No Subject"), styles['Normal']))
-            story.append(Paragraph("<b>Date:</b> " + (str(msg.date) or "Unknown"), styles['Normal']))
+            header = (
+                ("From", sender or "Unknown"),
+                ("To", to or "Unknown"),
+                ("Subject", subject or "No Subject"),
+                ("Date", str(date) if date else "Unknown"),
+            )
+            for label, value in header:
+                story.append(Paragraph(f"<b>{label}:</b> {escape_markup(value)}", styles['Normal']))
             story.append(Spacer(1, 24))
             
-            # Body
-            body = msg.body or "(No content)"
-            for line in body.split('\n'):
-                line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                story.append(Paragraph(line or '&nbsp;', styles['Normal']))
+            # Body: escaped in one go, then one Paragraph per block of lines
+            body_lines = io.StringIO(escape_markup(body or "(No content)"))
+            while True:
+                block = [
+                    line.rstrip('\n') or '&nbsp;'
+                    for line in islice(body_lines, self.MSG_LINES_PER_PARAGRAPH)
+                ]
+                if not block:
+                    break
+                story.append(Paragraph('<br/>'.join(block), styles['Normal']))
             
             pdf_doc.build(story)
             
-            msg.close()
-            
             return ConversionResult(
                 status=ConversionStatus.SUCCESS,
                 output_path=output_path,
@@ -1759,6 +3251,19 @@ class AttachmentConverter:
         except Exception as e:
             raise RuntimeError(f"MSG conversion failed: {e}")
     
+    def _msg_property(self, msg, name: str):
+        """
+        Read one extract_msg property, or None if it is missing or its stream is corrupt.
+        
+        extract_msg parses the OLE stream when a property is accessed, so one
+        malformed field raises there; this keeps it from failing the whole file.
+        """
+        try:
+            return getattr(msg, name, None)
+        except Exception as e:
+            logger.debug(f"Could not read MSG {name}: {e}")
+            return None
+    
     def get_supported_extensions(self) -> List[str]:
         """Get list of supported file extensions."""
         return list(self.SUPPORTED_FORMATS.keys())
@@ -5,13 +5,18 @@ Orchestrates the complete PST/MBOX/MSG/EML to PDF conversion process.
 Supports multiple input types and combining folders by name.
 """
 
+import io
 import os
+import re
 import shutil
 import logging
+import time
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any, Tuple
+from typing import Optional, Callable, List, Dict, Set, Any, Tuple, Iterable, Iterator
 from dataclasses import dataclass, field
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from enum import Enum
 import json
 import glob
@@ -28,6 +33,7 @@ from .duplicate_detector import (
     DuplicateCertainty, 
     create_fingerprint_from_parsed_email
 )
+from ._types import InputType
 
 logger = logging.getLogger(__name__)
 
@@ -56,18 +62,6 @@ class PipelineProgress:
     message: str
 
 
-class InputType(Enum):
-    """Types of input files/folders"""
-    PST = "pst"
-    MBOX = "mbox"
-    EML = "eml"
-    MSG = "msg"
-    EML_FOLDER = "eml_folder"
-    PST_FOLDER = "pst_folder"
-    MBOX_FOLDER = "mbox_folder"
-    MIXED_FOLDER = "mixed_folder"
-
-
 @dataclass
 class PipelineConfig:
     """Configuration for the conversion pipeline"""
@@ -89,6 +83,8 @@ class PipelineConfig:
     
     # OCR
     ocr_enabled: bool = True
+    ocr_preprocess: bool = False  # Binarize images before OCR (faster, output is black and white)
+    ocr_dpi: int = 200  # Render resolution for OCR of scanned PDF pages
     
     # Output options
     keep_individual_pdfs: bool = True
@@ -108,6 +104,8 @@ class PipelineConfig:
     preserve_pst_structure: bool = True
     rename_emls: bool = True  # Rename EMLs to YYYYMMDD_HHMMSS_subject.eml
     skip_deleted_items: bool = True  # Skip emails from "Deleted Items" folder
+    max_workers: int = 0  # Emails converted in parallel processes; 0 = one per CPU, 1 = in-process
+    attachment_workers: int = 4  # Threads converting one email's attachments, capped at a pool worker's CPU share; 1 = serially
     
     def __post_init__(self):
         """Initialize input_paths from pst_path if not provided."""
@@ -147,6 +145,87 @@ class PipelineResult:
         return 0
 
 
+@dataclass
+class _EmailOutcome:
+    """Result of converting one email and its attachments (picklable for worker processes)"""
+    final_pdf_path: Optional[Path] = None
+    attachments_converted: int = 0
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+# A path segment starting with "deleted", or "deleted items" anywhere
+_DELETED_FOLDER_RE = re.compile(r'(?:^|[\\/])deleted|deleted items', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _is_deleted_folder(source_folder: str) -> bool:
+    """Whether a source folder is a "Deleted Items" folder; cached, as most emails share a folder."""
+    return _DELETED_FOLDER_RE.search(source_folder) is not None
+
+
+class _WorkerLogHandler(logging.Handler):
+    """Hands a record logged in a worker process to the same logger here."""
+    
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(record.name).handle(record)
+
+
+# Pipeline used by a worker process; built once per process by _init_email_worker()
+_worker_pipeline: Optional['ConversionPipeline'] = None
+
+
+def _init_email_worker(config: PipelineConfig, workers: int, log_queue, log_levels: Dict[str, int]):
+    """
+    Process-pool initializer: build the converters once for this worker.
+    
+    The pool already runs one email per worker, so the worker's attachment
+    and OCR threads are limited to its share of the CPUs rather than adding
+    to the pool's.
+    
+    Spawned workers don't run the app's logging setup, so their records are
+    sent to log_queue for the pipeline's process to write (see
+    _convert_emails()), filtered by the same logger levels as there.
+    """
+    import logging.handlers
+    import multiprocessing.util
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    for name, level in log_levels.items():
+        logging.getLogger(name or None).setLevel(level)
+    
+    global _worker_pipeline
+    _worker_pipeline = ConversionPipeline(config)
+    cpu_share = max(1, (os.cpu_count() or 1) // workers)
+    _worker_pipeline.attachment_workers = min(config.attachment_workers, cpu_share)
+    _worker_pipeline.attachment_converter.ocr_workers = min(
+        _worker_pipeline.attachment_converter.ocr_workers, cpu_share
+    )
+    # Worker processes exit without atexit; remove the temp dir / LibreOffice listener
+    multiprocessing.util.Finalize(
+        None, _worker_pipeline.attachment_converter.cleanup, exitpriority=10
+    )
+
+
+def _convert_email_in_worker(parsed_path: Path, output_name: str, folder_path: str) -> _EmailOutcome:
+    """
+    Process-pool task: convert one email with this worker's pipeline.
+    
+    The parsed email comes as a pickle file written by the pipeline's process:
+    loading it is far cheaper than parsing the EML again (MIME decoding), and
+    unlike a pickled task argument it isn't held in the parent's work queue.
+    """
+    import pickle
+    
+    with open(parsed_path, 'rb') as f:
+        email_data = pickle.load(f)
+    os.unlink(parsed_path)
+    return _worker_pipeline._convert_one_email(email_data, output_name, folder_path)
+
+
 class ConversionPipeline:
     """
     Main orchestrator for PST/MBOX/MSG/EML to PDF conversion.
@@ -165,6 +244,22 @@ class ConversionPipeline:
     - Combining folders by name across multiple sources
     """
     
+    # Overall percentage range covered by each stage
+    STAGE_WEIGHTS = {
+        PipelineStage.INITIALIZING: (0, 5),
+        PipelineStage.EXTRACTING_PST: (5, 20),
+        PipelineStage.PARSING_EMAILS: (20, 30),
+        PipelineStage.CONVERTING_EMAILS: (30, 50),
+        PipelineStage.CONVERTING_ATTACHMENTS: (50, 70),
+        PipelineStage.MERGING_INDIVIDUAL: (70, 85),
+        PipelineStage.MERGING_FINAL: (85, 100),
+        PipelineStage.COMPLETE: (100, 100),
+        PipelineStage.FAILED: (0, 0)
+    }
+    
+    # Minimum seconds between progress updates that don't change the shown percentage
+    PROGRESS_INTERVAL = 0.1
+    
     def __init__(
         self,
         config: PipelineConfig,
@@ -179,6 +274,8 @@ class ConversionPipeline:
         """
         self.config = config
         self.progress_callback = progress_callback
+        # Threads per email for attachments; lowered in process-pool workers
+        self.attachment_workers = config.attachment_workers
         
         # Initialize components
         self.pst_extractor = PSTExtractor(
@@ -193,7 +290,9 @@ class ConversionPipeline:
         )
         self.attachment_converter = AttachmentConverter(
             ocr_enabled=config.ocr_enabled,
-            progress_callback=self._attachment_progress
+            progress_callback=self._attachment_progress,
+            ocr_preprocess=config.ocr_preprocess,
+            ocr_dpi=config.ocr_dpi
         )
         self.pdf_merger = PDFMerger(
             progress_callback=self._merger_progress,
@@ -221,6 +320,10 @@ class ConversionPipeline:
         # State
         self._current_stage = PipelineStage.INITIALIZING
         self._cancelled = False
+        self._known_dirs = set()  # Output/temp folders already created
+        self._eml_dest_names: Dict[Path, Set[str]] = {}  # EML folder -> names copied into it
+        self._last_progress = None  # (stage, whole percentage) last sent to the callback
+        self._last_progress_time = 0.0
         
         # Setup output directories
         self._setup_output_dirs()
@@ -239,6 +342,12 @@ class ConversionPipeline:
         for d in [self.emls_dir, self.individual_pdfs_dir, self.combined_dir, self.temp_dir]:
             d.mkdir(exist_ok=True)
     
+    def _ensure_dir(self, path: Path):
+        """Create a directory once; later calls for the same path skip the syscall."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+    
     def _report_progress(
         self,
         stage: PipelineStage,
@@ -254,19 +363,7 @@ class ConversionPipeline:
             return
         
         # Calculate overall percentage
-        stage_weights = {
-            PipelineStage.INITIALIZING: (0, 5),
-            PipelineStage.EXTRACTING_PST: (5, 20),
-            PipelineStage.PARSING_EMAILS: (20, 30),
-            PipelineStage.CONVERTING_EMAILS: (30, 50),
-            PipelineStage.CONVERTING_ATTACHMENTS: (50, 70),
-            PipelineStage.MERGING_INDIVIDUAL: (70, 85),
-            PipelineStage.MERGING_FINAL: (85, 100),
-            PipelineStage.COMPLETE: (100, 100),
-            PipelineStage.FAILED: (0, 0)
-        }
-        
-        start_pct, end_pct = stage_weights.get(stage, (0, 100))
+        start_pct, end_pct = self.STAGE_WEIGHTS.get(stage, (0, 100))
         
         if total > 0:
             stage_progress = current / total
@@ -275,6 +372,20 @@ class ConversionPipeline:
         
         overall_pct = start_pct + (end_pct - start_pct) * stage_progress
         
+        # Every email and attachment reports progress, and each callback costs a
+        # GUI event; updates that don't move the bar are sent at most every
+        # PROGRESS_INTERVAL, and a stage's last update is always sent
+        now = time.monotonic()
+        shown = (stage, int(overall_pct))
+        if (
+            shown == self._last_progress
+            and current < total
+            and now - self._last_progress_time < self.PROGRESS_INTERVAL
+        ):
+            return
+        self._last_progress = shown
+        self._last_progress_time = now
+        
         progress = PipelineProgress(
             stage=stage,
             current_item=current,
@@ -318,10 +429,11 @@ class ConversionPipeline:
         
         if p.is_dir():
             # Check what files are in the folder
-            has_pst = any(p.glob("*.pst")) or any(p.glob("*.PST"))
-            has_mbox = any(p.glob("*.mbox")) or any(p.glob("*.MBOX"))
-            has_eml = any(p.glob("*.eml")) or any(p.glob("*.EML"))
-            has_msg = any(p.glob("*.msg")) or any(p.glob("*.MSG"))
+            files = self._files_by_extension(p)
+            has_pst = ".pst" in files
+            has_mbox = ".mbox" in files
+            has_eml = ".eml" in files
+            has_msg = ".msg" in files
             
             if has_pst and not (has_mbox or has_eml or has_msg):
                 return InputType.PST_FOLDER
@@ -350,6 +462,26 @@ class ConversionPipeline:
                 logger.warning(f"Unknown file type: {path}")
                 return InputType.EML  # Default to EML
     
+    @staticmethod
+    def _files_by_extension(folder: Path) -> Dict[str, List[Path]]:
+        """
+        List the files directly in a folder, grouped by lowercased extension.
+        
+        One directory read, instead of a glob per extension and per case.
+        
+        Args:
+            folder: Folder to list
+            
+        Returns:
+            Extension (e.g. ".pst") -> files, in directory order
+        """
+        files: Dict[str, List[Path]] = defaultdict(list)
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files[os.path.splitext(entry.name)[1].lower()].append(Path(entry.path))
+        return files
+    
     def _extract_emails_from_inputs(self, result: PipelineResult) -> List[Tuple[Path, str]]:
         """
         Extract/collect EML files from all input sources.
@@ -428,15 +560,18 @@ class ConversionPipeline:
         
         # Collect EML paths with folder info
         emls: List[Tuple[Path, str]] = []
+        folder_names: Dict[Path, str] = {}  # EML directory -> folder name, one per PST folder
         for eml_path in self.pst_extractor.get_extracted_emls(str(output_subdir)):
-            # Get relative folder within PST
-            try:
-                rel_path = eml_path.relative_to(output_subdir)
-                folder_name = str(rel_path.parent)
-                if folder_name == ".":
-                    folder_name = "Inbox"  # Default folder name
-            except ValueError:
-                folder_name = "Inbox"
+            folder_name = folder_names.get(eml_path.parent)
+            if folder_name is None:
+                # Get relative folder within PST
+                try:
+                    folder_name = str(eml_path.parent.relative_to(output_subdir))
+                    if folder_name == ".":
+                        folder_name = "Inbox"  # Default folder name
+                except ValueError:
+                    folder_name = "Inbox"
+                folder_names[eml_path.parent] = folder_name
             
             emls.append((eml_path, folder_name))
         
@@ -496,19 +631,31 @@ class ConversionPipeline:
         
         return None
     
-    def _copy_eml(self, eml_path: str, result: PipelineResult) -> Optional[Tuple[Path, str]]:
-        """Copy an EML file to the working directory."""
-        src = Path(eml_path)
-        dest = self.emls_dir / src.name
+    def _free_eml_dest(self, dest_folder: Path, src: Path) -> Path:
+        """
+        Pick a free path in dest_folder for a copy of src, adding _1, _2, ... on collision.
         
-        # Handle name collision
+        Names handed out this run are remembered, so copying many same-named
+        files costs one stat each instead of one per earlier copy.
+        """
+        used = self._eml_dest_names.setdefault(dest_folder, set())
+        name = src.name
         counter = 1
-        while dest.exists():
-            dest = self.emls_dir / f"{src.stem}_{counter}{src.suffix}"
+        # Casefolded, as the filesystem may ignore case
+        while name.casefold() in used or (dest_folder / name).exists():
+            used.add(name.casefold())
+            name = f"{src.stem}_{counter}{src.suffix}"
             counter += 1
+        used.add(name.casefold())
+        return dest_folder / name
+    
+    def _copy_eml(self, eml_path: str, result: PipelineResult) -> Optional[Tuple[Path, str]]:
+        """Copy an EML file to the working directory."""
+        src = Path(eml_path)
+        dest = self._free_eml_dest(self.emls_dir, src)
         
         try:
-            shutil.copy(src, dest)
+            shutil.copyfile(src, dest)
             result.emails_found += 1
             return (dest, "")  # No folder for single EML
         except Exception as e:
@@ -531,43 +678,50 @@ class ConversionPipeline:
             folder_path, f"Processing folder: {folder.name}..."
         )
         
+        files = self._files_by_extension(folder)
+        
         # Process PST files
-        for pst_file in list(folder.glob("*.pst")) + list(folder.glob("*.PST")):
+        for pst_file in files.get(".pst", ()):
             pst_emls = self._extract_from_pst(str(pst_file), result)
             emls.extend(pst_emls)
         
         # Process MBOX files
-        for mbox_file in list(folder.glob("*.mbox")) + list(folder.glob("*.MBOX")):
+        for mbox_file in files.get(".mbox", ()):
             mbox_emls = self._extract_from_mbox(str(mbox_file), result)
             emls.extend(mbox_emls)
         
         # Process MSG files
-        for msg_file in list(folder.glob("*.msg")) + list(folder.glob("*.MSG")):
+        for msg_file in files.get(".msg", ()):
             msg_result = self._convert_msg_to_eml(str(msg_file), result)
             if msg_result:
                 emls.append(msg_result)
         
+        # EML files in the folder and its subfolders, in one walk of the tree
+        eml_files = [
+            Path(dirpath, name)
+            for dirpath, _, names in os.walk(folder, followlinks=True)
+            for name in names
+            if name.lower().endswith(".eml")
+        ]
+        
         # Process EML files - preserve folder structure
-        for eml_file in list(folder.glob("**/*.eml")) + list(folder.glob("**/*.EML")):
+        folder_names: Dict[Path, str] = {}  # source directory -> folder name
+        for eml_file in eml_files:
             try:
-                # Get relative path within the input folder
-                rel_path = eml_file.relative_to(folder)
-                folder_name = str(rel_path.parent)
-                if folder_name == ".":
-                    folder_name = folder.name
+                folder_name = folder_names.get(eml_file.parent)
+                if folder_name is None:
+                    # Get relative path within the input folder
+                    folder_name = str(eml_file.parent.relative_to(folder))
+                    if folder_name == ".":
+                        folder_name = folder.name
+                    folder_names[eml_file.parent] = folder_name
                 
                 # Copy to working directory preserving structure
                 dest_folder = self.emls_dir / folder_name
-                dest_folder.mkdir(parents=True, exist_ok=True)
-                dest = dest_folder / eml_file.name
+                self._ensure_dir(dest_folder)
+                dest = self._free_eml_dest(dest_folder, eml_file)
                 
-                # Handle name collision
-                counter = 1
-                while dest.exists():
-                    dest = dest_folder / f"{eml_file.stem}_{counter}{eml_file.suffix}"
-                    counter += 1
-                
-                shutil.copy(eml_file, dest)
+                shutil.copyfile(eml_file, dest)
                 result.emails_found += 1
                 emls.append((dest, folder_name))
             except Exception as e:
@@ -612,199 +766,41 @@ class ConversionPipeline:
             if self._cancelled:
                 return self._handle_cancellation(result)
             
-            # Stage 2: Parse emails
+            # Stage 2-5: Parse emails and convert them as they are parsed, so
+            # conversion starts right away and parsed emails (with their
+            # attachment bytes) aren't all held in memory at once
             self._report_progress(
                 PipelineStage.PARSING_EMAILS, 0, len(all_emls),
                 "", "Parsing extracted emails..."
             )
             
-            parsed_emails: List[Tuple[ParsedEmail, Path, str]] = []  # (parsed, path, folder_name)
-            
-            for i, (eml_path, source_folder) in enumerate(all_emls):
-                if self._cancelled:
-                    return self._handle_cancellation(result)
-                
-                self._report_progress(
-                    PipelineStage.PARSING_EMAILS, i + 1, len(all_emls),
-                    eml_path.name, f"Parsing {eml_path.name}..."
-                )
-                
-                try:
-                    email_data = self.eml_parser.parse_file(str(eml_path))
-                    
-                    # Rename EML file if enabled (for diagnostics)
-                    if self.config.rename_emls:
-                        new_name = f"{email_data.get_output_filename()}.eml"
-                        new_path = eml_path.parent / new_name
-                        counter = 1
-                        while new_path.exists() and new_path != eml_path:
-                            new_name = f"{email_data.get_output_filename()}_{counter}.eml"
-                            new_path = eml_path.parent / new_name
-                            counter += 1
-                        if new_path != eml_path:
-                            eml_path.rename(new_path)
-                            eml_path = new_path
-                    
-                    # Determine effective folder path
-                    # If combine_folders_by_name is enabled, use just the folder name (e.g., "Inbox")
-                    # Otherwise, use the full source path (e.g., "mailbox1/Inbox")
-                    if self.config.combine_folders_by_name and source_folder:
-                        # Use only the last folder name (e.g., "Inbox" from "MailMeter/Inbox")
-                        folder_path = Path(source_folder).name
-                    else:
-                        folder_path = source_folder
-                    
-                    # Check for duplicates
-                    if self.detect_duplicates:
-                        fp = create_fingerprint_from_parsed_email(email_data, str(eml_path))
-                        
-                        if self.duplicate_detector:
-                            duplicate = self.duplicate_detector.add_email(fp)
-                        else:
-                            if folder_path not in self.per_folder_detectors:
-                                self.per_folder_detectors[folder_path] = DuplicateDetector(
-                                    min_certainty=self.duplicate_certainty
-                                )
-                            duplicate = self.per_folder_detectors[folder_path].add_email(fp)
-                        
-                        if duplicate:
-                            result.duplicates_skipped += 1
-                            logger.info(f"Skipping duplicate: {eml_path.name} ({duplicate.reason})")
-                            continue
-                    
-                    # Skip "Deleted Items" folder if configured
-                    if self.config.skip_deleted_items:
-                        folder_lower = source_folder.lower()
-                        folder_parts = folder_lower.replace("\\", "/").split("/")
-                        is_deleted = (
-                            "deleted items" in folder_lower or
-                            "deleted" in folder_parts or
-                            any(part.startswith("deleted") for part in folder_parts)
-                        )
-                        if is_deleted:
-                            logger.info(f"Skipping email from Deleted Items: {eml_path.name}")
-                            continue
-                    
-                    # Apply date filter
-                    if self.config.date_from and email_data.date:
-                        if email_data.date < self.config.date_from:
-                            continue
-                    if self.config.date_to and email_data.date:
-                        if email_data.date > self.config.date_to:
-                            continue
-                    
-                    parsed_emails.append((email_data, eml_path, folder_path))
-                
-                except Exception as e:
-                    result.warnings.append(f"Error parsing {eml_path.name}: {e}")
-                    logger.warning(f"Error parsing {eml_path}: {e}")
+            converted = self._convert_emails(self._parse_emails(all_emls, result), len(all_emls))
+            if converted is None:
+                return self._handle_cancellation(result)
             
             result.stage_reached = PipelineStage.PARSING_EMAILS
             
-            if not parsed_emails:
+            if not converted:
                 result.warnings.append("No valid emails to process after filtering")
                 return result
             
-            # Stage 3-5: Convert emails and attachments, merge individual
-            self._report_progress(
-                PipelineStage.CONVERTING_EMAILS, 0, len(parsed_emails),
-                "", "Converting emails to PDF..."
-            )
-            
             # Track PDFs by folder for separate combined PDFs option
-            pdfs_by_folder: Dict[str, List[Tuple[Path, str]]] = {}
+            pdfs_by_folder: Dict[str, List[Tuple[Path, str]]] = defaultdict(list)
             individual_pdfs: List[Tuple[Path, str]] = []
             
-            for i, (email_data, eml_path, folder_path) in enumerate(parsed_emails):
-                if self._cancelled:
-                    return self._handle_cancellation(result)
+            for folder_path, timestamp, outcome in converted:
+                result.attachments_converted += outcome.attachments_converted
+                result.warnings.extend(outcome.warnings)
+                if outcome.error is not None:
+                    result.errors.append(outcome.error)
+                    continue
                 
-                output_name = email_data.get_output_filename()
-                timestamp = email_data.get_timestamp_prefix()
+                individual_pdfs.append((outcome.final_pdf_path, timestamp))
                 
-                self._report_progress(
-                    PipelineStage.CONVERTING_EMAILS, i + 1, len(parsed_emails),
-                    output_name, f"Converting: {output_name}"
-                )
-                
-                try:
-                    # Convert email to PDF
-                    email_pdf_path = self.temp_dir / f"{output_name}_email.pdf"
-                    self.email_converter.convert_email_to_pdf(email_data, email_pdf_path)
-                    
-                    # Convert attachments
-                    attachment_pdfs = []
-                    
-                    for j, attachment in enumerate(email_data.attachments):
-                        self._report_progress(
-                            PipelineStage.CONVERTING_ATTACHMENTS, 
-                            i * 100 + j + 1, 
-                            len(parsed_emails) * 100,
-                            attachment.filename,
-                            f"Converting attachment: {attachment.filename}"
-                        )
-                        
-                        att_output_name = f"{output_name}_att{j+1:02d}_{attachment.filename}"
-                        
-                        conv_result = self.attachment_converter.convert_bytes(
-                            attachment.content,
-                            attachment.content_type,
-                            attachment.filename,
-                            str(self.temp_dir),
-                            att_output_name
-                        )
-                        
-                        if conv_result.status in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL):
-                            is_placeholder = conv_result.status == ConversionStatus.PARTIAL
-                            attachment_pdfs.append((conv_result.output_path, is_placeholder))
-                            result.attachments_converted += 1
-                        else:
-                            result.warnings.append(
-                                f"Attachment conversion failed: {attachment.filename} - {conv_result.message}"
-                            )
-                    
-                    # Merge email + attachments
-                    self._report_progress(
-                        PipelineStage.MERGING_INDIVIDUAL, i + 1, len(parsed_emails),
-                        output_name, f"Creating individual PDF: {output_name}"
-                    )
-                    
-                    # Preserve folder structure in individual PDFs output
-                    if folder_path:
-                        pdf_output_folder = self.individual_pdfs_dir / folder_path
-                        pdf_output_folder.mkdir(parents=True, exist_ok=True)
-                    else:
-                        pdf_output_folder = self.individual_pdfs_dir
-                    
-                    final_pdf_path = pdf_output_folder / f"{output_name}.pdf"
-                    
-                    if attachment_pdfs:
-                        merge_result = self.pdf_merger.merge_email_with_attachments(
-                            email_pdf_path,
-                            attachment_pdfs,
-                            final_pdf_path,
-                            add_separators=self.config.add_att_separators
-                        )
-                        
-                        if not merge_result.success:
-                            result.warnings.extend(merge_result.errors)
-                    else:
-                        shutil.copy(email_pdf_path, final_pdf_path)
-                    
-                    individual_pdfs.append((final_pdf_path, timestamp))
-                    
-                    # Track by folder for per-folder combined PDFs
-                    if folder_path not in pdfs_by_folder:
-                        pdfs_by_folder[folder_path] = []
-                    pdfs_by_folder[folder_path].append((final_pdf_path, timestamp))
-                    
-                    result.emails_processed += 1
+                # Track by folder for per-folder combined PDFs
+                pdfs_by_folder[folder_path].append((outcome.final_pdf_path, timestamp))
                 
-                except Exception as e:
-                    import traceback
-                    tb = traceback.format_exc()
-                    result.errors.append(f"Error processing {output_name}: {e}")
-                    logger.error(f"Error processing email {output_name}:\n{tb}")
+                result.emails_processed += 1
             
             result.stage_reached = PipelineStage.MERGING_INDIVIDUAL
             result.individual_pdfs_dir = self.individual_pdfs_dir
@@ -870,6 +866,7 @@ class ConversionPipeline:
             # Cleanup temp directory
             if not self.config.keep_individual_pdfs:
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
+                self._known_dirs.clear()
             
             result.success = len(result.errors) == 0
             
@@ -890,6 +887,360 @@ class ConversionPipeline:
         
         return result
     
+    def _parse_emails(
+        self,
+        all_emls: List[Tuple[Path, str]],
+        result: PipelineResult
+    ) -> Iterator[Tuple[ParsedEmail, str, str, str]]:
+        """
+        Parse extracted EMLs, skipping duplicates and filtered emails.
+        
+        A generator, so each email can be handed to conversion as soon as it
+        is parsed. Duplicate detection runs here, in order, so which copy of
+        a duplicate is kept doesn't depend on conversion timing.
+        
+        Args:
+            all_emls: (eml path, source folder) per extracted email
+            result: PipelineResult to record duplicates and warnings in
+            
+        Yields:
+            (parsed email, unique output name, folder path, timestamp) per email to convert
+        """
+        used_names = set()
+        # Names in each EML folder (casefolded, as the filesystem may ignore case),
+        # listed once, so renaming doesn't stat the disk for every candidate name
+        eml_dir_names: Dict[Path, Set[str]] = {}
+        
+        for eml_path, source_folder in all_emls:
+            if self._cancelled:
+                return
+            
+            try:
+                email_data = self.eml_parser.parse_file(str(eml_path))
+                # Formatted once; the subject sanitizing runs regexes
+                base_name = email_data.get_output_filename()
+                timestamp = email_data.get_timestamp_prefix()
+                
+                # Rename EML file if enabled (for diagnostics)
+                if self.config.rename_emls:
+                    names = eml_dir_names.get(eml_path.parent)
+                    if names is None:
+                        names = {name.casefold() for name in os.listdir(eml_path.parent)}
+                        eml_dir_names[eml_path.parent] = names
+                    new_name = f"{base_name}.eml"
+                    counter = 1
+                    while new_name.casefold() in names and new_name != eml_path.name:
+                        new_name = f"{base_name}_{counter}.eml"
+                        counter += 1
+                    if new_name != eml_path.name:
+                        new_path = eml_path.with_name(new_name)
+                        eml_path.rename(new_path)
+                        names.discard(eml_path.name.casefold())
+                        names.add(new_name.casefold())
+                        eml_path = new_path
+                
+                # Determine effective folder path
+                # If combine_folders_by_name is enabled, use just the folder name (e.g., "Inbox")
+                # Otherwise, use the full source path (e.g., "mailbox1/Inbox")
+                if self.config.combine_folders_by_name and source_folder:
+                    # Use only the last folder name (e.g., "Inbox" from "MailMeter/Inbox")
+                    folder_path = Path(source_folder).name
+                else:
+                    folder_path = source_folder
+                
+                # Skip "Deleted Items" folder if configured. Filters run before
+                # duplicate detection: they're cheaper, and a skipped email
+                # mustn't make a kept copy of it count as a duplicate
+                if self.config.skip_deleted_items:
+                    if _is_deleted_folder(source_folder):
+                        logger.info(f"Skipping email from Deleted Items: {eml_path.name}")
+                        continue
+                
+                # Apply date filter
+                if self.config.date_from and email_data.date:
+                    if email_data.date < self.config.date_from:
+                        continue
+                if self.config.date_to and email_data.date:
+                    if email_data.date > self.config.date_to:
+                        continue
+                
+                # Check for duplicates
+                if self.detect_duplicates:
+                    fp = create_fingerprint_from_parsed_email(email_data, str(eml_path))
+                    
+                    if self.duplicate_detector:
+                        duplicate = self.duplicate_detector.add_email(fp)
+                    else:
+                        detector = self.per_folder_detectors.get(folder_path)
+                        if detector is None:
+                            detector = self.per_folder_detectors[folder_path] = DuplicateDetector(
+                                min_certainty=self.duplicate_certainty
+                            )
+                        duplicate = detector.add_email(fp)
+                    
+                    if duplicate:
+                        result.duplicates_skipped += 1
+                        logger.info(f"Skipping duplicate: {eml_path.name} ({duplicate.reason})")
+                        continue
+            
+            except Exception as e:
+                result.warnings.append(f"Error parsing {eml_path.name}: {e}")
+                logger.warning(f"Error parsing {eml_path}: {e}")
+                continue
+            
+            # Emails may be converted in parallel, so two emails with the same
+            # name in one folder get distinct files instead of overwriting each other
+            output_name = base_name
+            counter = 1
+            while (folder_path, output_name) in used_names:
+                output_name = f"{base_name}_{counter}"
+                counter += 1
+            used_names.add((folder_path, output_name))
+            
+            # The email's folders are created here, once per folder, so the
+            # (possibly many, per-process) converters never have to
+            if folder_path:
+                self._ensure_dir(self.temp_dir / folder_path)
+                self._ensure_dir(self.individual_pdfs_dir / folder_path)
+            
+            yield email_data, output_name, folder_path, timestamp
+    
+    def _convert_emails(
+        self,
+        jobs: Iterable[Tuple[ParsedEmail, str, str, str]],
+        total: int
+    ) -> Optional[List[Tuple[str, str, _EmailOutcome]]]:
+        """
+        Convert emails (with their attachments) to individual PDFs.
+        
+        Emails are independent and mostly CPU-bound (HTML rendering, image and
+        PDF work), so with more than one worker they run in a process pool;
+        each worker builds its own converters once. Jobs are pulled from the
+        iterable as workers free up, so parsing (in this process) overlaps
+        conversion; each parsed email is handed over as a temp pickle file, so
+        its attachment bytes aren't kept here while it waits for a worker.
+        
+        Args:
+            jobs: (parsed email, output name, folder path, timestamp) per email
+            total: Upper bound on the number of jobs, for progress and pool sizing
+            
+        Returns:
+            (folder path, timestamp, outcome) per job, in order, or None if
+            the run was cancelled
+        """
+        workers = self.config.max_workers or os.cpu_count() or 1
+        workers = min(workers, total)
+        if self.config.max_workers == 0 and total < 4:
+            # Starting worker processes (~1 s) isn't worth it for a handful of emails
+            workers = 1
+        
+        converted: List[Tuple[str, str, _EmailOutcome]] = []
+        
+        if workers <= 1:
+            for i, (email_data, output_name, folder_path, timestamp) in enumerate(jobs):
+                self._report_progress(
+                    PipelineStage.CONVERTING_EMAILS, i + 1, total,
+                    output_name, f"Converting: {output_name}"
+                )
+                outcome = self._convert_one_email(email_data, output_name, folder_path)
+                converted.append((folder_path, timestamp, outcome))
+            return None if self._cancelled else converted
+        
+        import logging.handlers
+        import multiprocessing
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        
+        # spawn: forking a process that runs GUI/worker threads can deadlock
+        mp_context = multiprocessing.get_context('spawn')
+        
+        # Workers log through a queue to this process's handlers (e.g. the log file)
+        root = logging.getLogger()
+        log_queue = mp_context.Queue()
+        log_listener = logging.handlers.QueueListener(log_queue, _WorkerLogHandler())
+        log_levels = {
+            name: logger_.level
+            for name, logger_ in root.manager.loggerDict.items()
+            if isinstance(logger_, logging.Logger) and logger_.level
+        }
+        log_levels[''] = root.level
+        log_listener.start()
+        
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_email_worker,
+            initargs=(self.config, workers, log_queue, log_levels)
+        )
+        names: List[str] = []
+        outcomes: Dict[int, _EmailOutcome] = {}
+        pending = {}  # future -> (job index, parsed email pickle)
+        
+        def collect(futures):
+            for future in futures:
+                i, _ = pending.pop(future)
+                try:
+                    outcomes[i] = future.result()
+                except Exception as e:
+                    # The worker itself failed (e.g. crashed), not just the conversion
+                    logger.error(f"Error processing email {names[i]}: {e}")
+                    outcomes[i] = _EmailOutcome(error=f"Error processing {names[i]}: {e}")
+                self._report_progress(
+                    PipelineStage.CONVERTING_EMAILS, len(outcomes), total,
+                    names[i], f"Converted: {names[i]}"
+                )
+        
+        try:
+            for i, (email_data, output_name, folder_path, timestamp) in enumerate(jobs):
+                names.append(output_name)
+                converted.append((folder_path, timestamp, None))
+                # Output names are unique per folder, so this file name is too
+                parsed_path = self.temp_dir / folder_path / f"{output_name}.parsed.pkl"
+                with open(parsed_path, 'wb') as f:
+                    pickle.dump(email_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                del email_data
+                future = executor.submit(_convert_email_in_worker, parsed_path, output_name, folder_path)
+                pending[future] = (i, parsed_path)
+                # Keep every worker busy, but don't parse far ahead of them
+                if len(pending) >= 2 * workers:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                if self._cancelled:
+                    break
+            
+            while pending and not self._cancelled:
+                collect(wait(pending, return_when=FIRST_COMPLETED).done)
+            
+            if self._cancelled:
+                # Drop queued emails; the shutdown below waits only for running ones
+                for future in pending:
+                    future.cancel()
+                return None
+            return [
+                (folder_path, timestamp, outcomes[i])
+                for i, (folder_path, timestamp, _) in enumerate(converted)
+            ]
+        finally:
+            executor.shutdown(wait=True)
+            # The workers have exited, so everything they logged is queued
+            log_listener.stop()
+            # Pickles of emails a worker never got to (cancelled, or the pool broke)
+            for _, parsed_path in pending.values():
+                parsed_path.unlink(missing_ok=True)
+    
+    def _convert_one_email(self, email_data: ParsedEmail, output_name: str, folder_path: str) -> _EmailOutcome:
+        """
+        Convert one email and its attachments, and merge them into its individual PDF.
+        
+        Runs in the pipeline's process or in a worker process, so it reports
+        back through the returned outcome rather than a PipelineResult. The
+        folders it writes to are created by _parse_emails().
+        """
+        outcome = _EmailOutcome()
+        
+        # Per-folder temp dir: same-named emails in different folders don't collide
+        temp_dir = self.temp_dir / folder_path if folder_path else self.temp_dir
+        
+        # Preserve folder structure in individual PDFs output
+        final_pdf_path = self.individual_pdfs_dir / folder_path / f"{output_name}.pdf"
+        
+        try:
+            if not email_data.attachments:
+                # Nothing to merge: render the email straight to its individual PDF
+                self.email_converter.convert_email_to_pdf(email_data, final_pdf_path)
+                outcome.final_pdf_path = final_pdf_path
+                return outcome
+            
+            # Convert email to PDF, in memory: it's only read back by the merge
+            email_pdf = io.BytesIO()
+            self.email_converter.convert_email_to_pdf(email_data, email_pdf)
+            email_pdf.seek(0)
+            
+            # Convert attachments; they are independent and mostly wait on
+            # child processes (LibreOffice, Tesseract), so threads overlap them
+            attachments = email_data.attachments
+            jobs = [
+                (
+                    attachment.content,
+                    attachment.content_type,
+                    attachment.filename,
+                    str(temp_dir),
+                    f"{output_name}_att{j+1:02d}_{attachment.filename}"
+                )
+                for j, attachment in enumerate(attachments)
+            ]
+            
+            workers = min(self.attachment_workers, len(jobs))
+            if workers > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(self.attachment_converter.convert_bytes, *job) for job in jobs]
+                    conv_results = []
+                    for j, future in enumerate(futures):
+                        conv_results.append(future.result())
+                        self._report_progress(
+                            PipelineStage.CONVERTING_ATTACHMENTS,
+                            j + 1,
+                            len(attachments),
+                            attachments[j].filename,
+                            f"Converted attachment: {attachments[j].filename}"
+                        )
+            else:
+                conv_results = []
+                for j, job in enumerate(jobs):
+                    self._report_progress(
+                        PipelineStage.CONVERTING_ATTACHMENTS,
+                        j + 1,
+                        len(attachments),
+                        attachments[j].filename,
+                        f"Converting attachment: {attachments[j].filename}"
+                    )
+                    conv_results.append(self.attachment_converter.convert_bytes(*job))
+            
+            # Collected in attachment order, so the merged PDF keeps that order
+            attachment_pdfs = []
+            for attachment, conv_result in zip(attachments, conv_results):
+                if conv_result.status in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL):
+                    is_placeholder = conv_result.status == ConversionStatus.PARTIAL
+                    attachment_pdfs.append((conv_result.output_path, is_placeholder))
+                    outcome.attachments_converted += 1
+                else:
+                    outcome.warnings.append(
+                        f"Attachment conversion failed: {attachment.filename} - {conv_result.message}"
+                    )
+            
+            # Merge email + attachments
+            self._report_progress(
+                PipelineStage.MERGING_INDIVIDUAL, 1, 1,
+                output_name, f"Creating individual PDF: {output_name}"
+            )
+            
+            if attachment_pdfs:
+                merge_result = self.pdf_merger.merge_email_with_attachments(
+                    email_pdf,
+                    attachment_pdfs,
+                    final_pdf_path,
+                    add_separators=self.config.add_att_separators
+                )
+                
+                if not merge_result.success:
+                    outcome.warnings.extend(merge_result.errors)
+            else:
+                # No attachment converted
+                final_pdf_path.write_bytes(email_pdf.getvalue())
+            
+            outcome.final_pdf_path = final_pdf_path
+        
+        except Exception as e:
+            outcome.error = f"Error processing {output_name}: {e}"
+            # The traceback is only formatted when debug logging is on
+            logger.error(
+                "Error processing email %s: %s", output_name, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+        
+        return outcome
+    
     def _handle_cancellation(self, result: PipelineResult) -> PipelineResult:
         """Handle pipeline cancellation."""
         result.errors.append("Pipeline was cancelled")
@@ -900,33 +1251,35 @@ class ConversionPipeline:
         """Write conversion log to file."""
         log_path = self.output_base / "conversion_log.txt"
         
+        # Built in memory and written at once: the warning list can be long
+        parts = [
+            "Mayo's Mail Converter - Conversion Log\n",
+            "=" * 50 + "\n\n",
+            "Input(s):\n",
+        ]
+        parts.extend(f"  - {input_path}\n" for input_path in self.config.input_paths)
+        parts.extend([
+            f"\nOutput: {self.config.output_dir}\n",
+            f"Date: {result.start_time}\n",
+            f"Duration: {result.duration_seconds:.1f} seconds\n",
+            f"Combine folders by name: {self.config.combine_folders_by_name}\n\n",
+            "Statistics:\n",
+            f"  - Emails found: {result.emails_found}\n",
+            f"  - Emails processed: {result.emails_processed}\n",
+            f"  - Duplicates skipped: {result.duplicates_skipped}\n",
+            f"  - Attachments converted: {result.attachments_converted}\n\n",
+        ])
+        
+        if result.errors:
+            parts.append("Errors:\n")
+            parts.extend(f"  - {error}\n" for error in result.errors)
+            parts.append("\n")
+        
+        if result.warnings:
+            parts.append("Warnings:\n")
+            parts.extend(f"  - {warning}\n" for warning in result.warnings)
+        
         with open(log_path, 'w') as f:
-            f.write("Mayo's Mail Converter - Conversion Log\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write("Input(s):\n")
-            for input_path in self.config.input_paths:
-                f.write(f"  - {input_path}\n")
-            f.write(f"\nOutput: {self.config.output_dir}\n")
-            f.write(f"Date: {result.start_time}\n")
-            f.write(f"Duration: {result.duration_seconds:.1f} seconds\n")
-            f.write(f"Combine folders by name: {self.config.combine_folders_by_name}\n\n")
-            
-            f.write("Statistics:\n")
-            f.write(f"  - Emails found: {result.emails_found}\n")
-            f.write(f"  - Emails processed: {result.emails_processed}\n")
-            f.write(f"  - Duplicates skipped: {result.duplicates_skipped}\n")
-            f.write(f"  - Attachments converted: {result.attachments_converted}\n\n")
-            
-            if result.errors:
-                f.write("Errors:\n")
-                for error in result.errors:
-                    f.write(f"  - {error}\n")
-                f.write("\n")
-            
-            if result.warnings:
-                f.write("Warnings:\n")
-                for warning in result.warnings:
-                    f.write(f"  - {warning}\n")
+            f.write("".join(parts))
         
         return log_path
@@ -0,0 +1,52 @@
+"""
+Conversion Group
+
+Extractors, parsers and converters used by the PST/EML/MBOX/MSG -> PDF
+pipeline. Names are resolved lazily, so importing this package does not
+load any of the Email Tools modules.
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ..pst_extractor import PSTExtractor
+    from ..eml_parser import EMLParser
+    from ..mbox_extractor import MBOXExtractor, MboxExtractionResult
+    from ..msg_parser import MSGParser, ParsedMSG
+    from ..attachment_converter import AttachmentConverter
+    from ..pdf_merger import PDFMerger
+    from ..duplicate_detector import DuplicateDetector
+    from ..conversion_pipeline import ConversionPipeline, InputType
+
+__all__ = (
+    'PSTExtractor',
+    'EMLParser',
+    'MBOXExtractor',
+    'MboxExtractionResult',
+    'MSGParser',
+    'ParsedMSG',
+    'AttachmentConverter',
+    'PDFMerger',
+    'DuplicateDetector',
+    'ConversionPipeline',
+    'InputType',
+)
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    'PSTExtractor': ('..pst_extractor', 'PSTExtractor'),
+    'EMLParser': ('..eml_parser', 'EMLParser'),
+    'MBOXExtractor': ('..mbox_extractor', 'MBOXExtractor'),
+    'MboxExtractionResult': ('.._types', 'MboxExtractionResult'),
+    'MSGParser': ('..msg_parser', 'MSGParser'),
+    'ParsedMSG': ('.._types', 'ParsedMSG'),
+    'AttachmentConverter': ('..attachment_converter', 'AttachmentConverter'),
+    'PDFMerger': ('..pdf_merger', 'PDFMerger'),
+    'DuplicateDetector': ('..duplicate_detector', 'DuplicateDetector'),
+    'ConversionPipeline': ('..conversion_pipeline', 'ConversionPipeline'),
+    'InputType': ('.._types', 'InputType'),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, __all__, _LAZY)
@@ -43,18 +43,30 @@ class EmailFingerprint:
     subject: str               # Subject line (normalized)
     timestamp: Optional[datetime]
     content_hash: str          # Hash of body content
+    # Derived keys, built on first use: the detector looks each one up when
+    # checking an email and again when indexing it
+    _normalized_subject: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _sender_subject_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _sender_ts_subject_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def get_sender_subject_key(self) -> str:
         """Get key for sender+subject matching."""
-        return f"{self.sender_email.lower()}|{self._normalize_subject()}"
+        if self._sender_subject_key is None:
+            self._sender_subject_key = f"{self.sender_email.lower()}|{self._normalize_subject()}"
+        return self._sender_subject_key
     
     def get_sender_timestamp_subject_key(self) -> str:
         """Get key for sender+timestamp+subject matching."""
-        ts = self.timestamp.strftime("%Y%m%d%H%M") if self.timestamp else "unknown"
-        return f"{self.sender_email.lower()}|{ts}|{self._normalize_subject()}"
+        if self._sender_ts_subject_key is None:
+            ts = self.timestamp.strftime("%Y%m%d%H%M") if self.timestamp else "unknown"
+            self._sender_ts_subject_key = f"{self.sender_email.lower()}|{ts}|{self._normalize_subject()}"
+        return self._sender_ts_subject_key
     
     def _normalize_subject(self) -> str:
-        """Normalize subject for comparison."""
+        """Normalize subject for comparison (computed once per fingerprint)."""
+        if self._normalized_subject is not None:
+            return self._normalized_subject
+        
         subject = self.subject.lower().strip()
         
         # Remove common prefixes
@@ -68,6 +80,7 @@ class EmailFingerprint:
                     if idx != -1:
                         subject = subject[idx+1:].strip()
         
+        self._normalized_subject = subject
         return subject
 
 
@@ -76,6 +89,14 @@ class DuplicateDetector:
     Detects duplicate emails with configurable certainty levels.
     """
     
+    # Certainty levels from weakest to strongest
+    CERTAINTY_RANK = {
+        DuplicateCertainty.LOW: 0,
+        DuplicateCertainty.MEDIUM: 1,
+        DuplicateCertainty.HIGH: 2,
+        DuplicateCertainty.EXACT: 3
+    }
+    
     def __init__(
         self,
         min_certainty: DuplicateCertainty = DuplicateCertainty.HIGH,
@@ -96,6 +117,7 @@ class DuplicateDetector:
         self._sender_subject: Dict[str, List[str]] = {}  # key -> [email_ids]
         self._sender_ts_subject: Dict[str, str] = {}  # key -> email_id
         self._content_hashes: Dict[str, str] = {}  # content_hash -> email_id
+        self._subjects: Dict[str, List[str]] = {}  # normalized subject -> [email_ids]
         
         # All fingerprints
         self._fingerprints: Dict[str, EmailFingerprint] = {}
@@ -106,6 +128,7 @@ class DuplicateDetector:
         self._sender_subject.clear()
         self._sender_ts_subject.clear()
         self._content_hashes.clear()
+        self._subjects.clear()
         self._fingerprints.clear()
     
     def create_fingerprint(
@@ -199,6 +222,10 @@ class DuplicateDetector:
                     if self._meets_certainty(DuplicateCertainty.HIGH):
                         return match
         
+        # Lower certainties can't be reported, so don't search for them
+        if not self._meets_certainty(DuplicateCertainty.MEDIUM):
+            return None
+        
         # Check by sender + subject within time window (MEDIUM certainty)
         ss_key = fingerprint.get_sender_subject_key()
         if ss_key in self._sender_subject and fingerprint.timestamp:
@@ -219,14 +246,18 @@ class DuplicateDetector:
                         if self._meets_certainty(DuplicateCertainty.MEDIUM):
                             return match
         
-        # Check by subject only within tight time window (LOW certainty)
+        if not self._meets_certainty(DuplicateCertainty.LOW):
+            return None
+        
+        # Check by subject only within tight time window (LOW certainty);
+        # only emails with the same normalized subject can match
         if fingerprint.timestamp:
-            normalized_subject = fingerprint._normalize_subject()
-            for other_id, other_fp in self._fingerprints.items():
+            for other_id in self._subjects.get(fingerprint._normalize_subject(), ()):
                 if other_id == fingerprint.id:
                     continue
-                    
-                if other_fp._normalize_subject() == normalized_subject and other_fp.timestamp:
+                
+                other_fp = self._fingerprints[other_id]
+                if other_fp.timestamp:
                     time_diff = abs(fingerprint.timestamp - other_fp.timestamp)
                     if time_diff <= timedelta(minutes=1):  # Very tight window for LOW
                         match = DuplicateMatch(
@@ -271,19 +302,15 @@ class DuplicateDetector:
             self._sender_subject[ss_key] = []
         self._sender_subject[ss_key].append(fingerprint.id)
         
+        self._subjects.setdefault(fingerprint._normalize_subject(), []).append(fingerprint.id)
+        
         self._fingerprints[fingerprint.id] = fingerprint
         
         return None
     
     def _meets_certainty(self, certainty: DuplicateCertainty) -> bool:
         """Check if a certainty level meets the minimum threshold."""
-        order = [
-            DuplicateCertainty.LOW,
-            DuplicateCertainty.MEDIUM,
-            DuplicateCertainty.HIGH,
-            DuplicateCertainty.EXACT
-        ]
-        return order.index(certainty) >= order.index(self.min_certainty)
+        return self.CERTAINTY_RANK[certainty] >= self.CERTAINTY_RANK[self.min_certainty]
     
     def get_statistics(self) -> Dict:
         """Get statistics about processed emails."""
@@ -13,7 +13,7 @@ import sys
 import base64
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import BinaryIO, Optional, List, Dict, Tuple, Union
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup
@@ -27,20 +27,6 @@ if sys.platform == 'win32':
     os.environ['GDK_SCALE'] = '1'
     os.environ['GDK_DPI_SCALE'] = '1'
 
-# Check for WeasyPrint availability
-# WeasyPrint requires GTK/GLib native libraries which may not be available on Windows
-WEASYPRINT_AVAILABLE = False
-WEASYPRINT_DEFAULT_URL_FETCHER = None
-try:
-    from weasyprint import HTML, CSS, default_url_fetcher
-    from weasyprint.text.fonts import FontConfiguration
-    WEASYPRINT_AVAILABLE = True
-    WEASYPRINT_DEFAULT_URL_FETCHER = default_url_fetcher
-except (ImportError, OSError, Exception):
-    # ImportError: package not installed
-    # OSError: native libraries (libgobject, etc.) not found on Windows
-    pass
-
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -53,8 +39,18 @@ from reportlab.platypus import (
 from reportlab.lib.utils import ImageReader
 from PIL import Image
 
+from ._markup import escape_markup
+from ._weasyprint import load_weasyprint
+
 logger = logging.getLogger(__name__)
 
+# NBSP and control characters other than newline and tab -> plain spaces,
+# for reportlab Paragraph text (see _escape_text())
+_PARAGRAPH_BLANKS = str.maketrans({
+    '\xa0': ' ',
+    **{chr(c): ' ' for c in range(32) if chr(c) not in '\n\t'},
+})
+
 
 class EmailToPDFConverter:
     """
@@ -78,7 +74,7 @@ class EmailToPDFConverter:
         self.load_remote_images = load_remote_images
         self._setup_styles()
         
-        if WEASYPRINT_AVAILABLE:
+        if load_weasyprint() is not None:
             logger.info("WeasyPrint available - HTML emails will render with full formatting")
             if not self.load_remote_images:
                 logger.info("Remote image loading disabled for security")
@@ -90,17 +86,18 @@ class EmailToPDFConverter:
         Custom URL fetcher for WeasyPrint that can block or allow remote URLs.
         Behavior depends on self.load_remote_images setting.
         """
+        default_url_fetcher = load_weasyprint().default_url_fetcher
         if url.startswith('data:'):
             # Always allow data: URLs (base64 embedded images)
-            return WEASYPRINT_DEFAULT_URL_FETCHER(url)
+            return default_url_fetcher(url)
         elif url.startswith('file://'):
             # Always allow local file URLs
-            return WEASYPRINT_DEFAULT_URL_FETCHER(url)
+            return default_url_fetcher(url)
         elif url.startswith(('http://', 'https://')):
             if self.load_remote_images:
                 # Allow remote URLs when enabled
                 logger.debug(f"Fetching remote image: {url[:100]}")
-                return WEASYPRINT_DEFAULT_URL_FETCHER(url)
+                return default_url_fetcher(url)
             else:
                 # Block remote URLs - return empty result
                 logger.debug(f"Blocked remote image: {url[:100]}")
@@ -108,7 +105,7 @@ class EmailToPDFConverter:
         else:
             # For other URLs (relative paths, etc.), try the default fetcher
             try:
-                return WEASYPRINT_DEFAULT_URL_FETCHER(url)
+                return default_url_fetcher(url)
             except Exception:
                 return {'string': b'', 'mime_type': 'image/png'}
     
@@ -159,25 +156,27 @@ class EmailToPDFConverter:
     def convert_email_to_pdf(
         self,
         email_data,  # ParsedEmail from eml_parser
-        output_path: Path,
+        output_path: Union[Path, BinaryIO],
         include_headers: bool = True
-    ) -> Path:
+    ) -> Union[Path, BinaryIO]:
         """
         Convert a parsed email to PDF.
         
         Args:
             email_data: ParsedEmail object from eml_parser
-            output_path: Path for the output PDF
+            output_path: Path for the output PDF, or a binary file object
+                (e.g. io.BytesIO) to write it to
             include_headers: Whether to include email headers
             
         Returns:
-            Path to the created PDF
+            Path to the created PDF, or the file object it was written to
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not hasattr(output_path, 'write'):
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Use WeasyPrint for HTML content if available
-        if WEASYPRINT_AVAILABLE and email_data.body_html:
+        if email_data.body_html and load_weasyprint() is not None:
             return self._convert_with_weasyprint(email_data, output_path, include_headers)
         else:
             return self._convert_with_reportlab(email_data, output_path, include_headers)
@@ -185,19 +184,20 @@ class EmailToPDFConverter:
     def _convert_with_weasyprint(
         self,
         email_data,
-        output_path: Path,
+        output_path: Union[Path, BinaryIO],
         include_headers: bool
-    ) -> Path:
+    ) -> Union[Path, BinaryIO]:
         """
         Convert email to PDF using WeasyPrint for full HTML/CSS support.
         Falls back to reportlab if WeasyPrint fails.
         """
+        weasyprint = load_weasyprint()
         try:
             # Build complete HTML document
             html_content = self._build_html_document(email_data, include_headers)
 
             # Create PDF with WeasyPrint
-            font_config = FontConfiguration()
+            font_config = weasyprint.FontConfiguration()
             
             # Page size CSS with configurable margin
             margin_str = f"{self.page_margin}in"
@@ -210,23 +210,28 @@ class EmailToPDFConverter:
                 # A4 size: 210 x 297 mm
                 page_size_css = f"@page {{ size: 210mm 297mm; margin: {margin_str}; }}"
             
-            css = CSS(string=page_size_css, font_config=font_config)
+            css = weasyprint.CSS(string=page_size_css, font_config=font_config)
             
             # Use custom url_fetcher to block remote images if setting is disabled
             # Enable presentational_hints=True to honor HTML table attributes like
             # width, cellpadding, cellspacing, bgcolor, align - critical for email HTML
+            target = str(output_path) if isinstance(output_path, Path) else output_path
             if self.load_remote_images:
-                html = HTML(string=html_content)
-                html.write_pdf(str(output_path), stylesheets=[css], font_config=font_config, presentational_hints=True)
+                html = weasyprint.HTML(string=html_content)
+                html.write_pdf(target, stylesheets=[css], font_config=font_config, presentational_hints=True)
             else:
-                html = HTML(string=html_content, url_fetcher=self._url_fetcher)
-                html.write_pdf(str(output_path), stylesheets=[css], font_config=font_config, presentational_hints=True)
+                html = weasyprint.HTML(string=html_content, url_fetcher=self._url_fetcher)
+                html.write_pdf(target, stylesheets=[css], font_config=font_config, presentational_hints=True)
             
             logger.info(f"Created PDF with WeasyPrint: {output_path}")
             return output_path
             
         except Exception as e:
             logger.warning(f"WeasyPrint conversion failed, falling back to reportlab: {e}")
+            if not isinstance(output_path, Path):
+                # Drop anything WeasyPrint wrote before failing
+                output_path.seek(0)
+                output_path.truncate()
             # Fall back to reportlab
             return self._convert_with_reportlab(email_data, output_path, include_headers)
     
@@ -996,23 +1001,19 @@ class EmailToPDFConverter:
         """Escape text for HTML."""
         if not text:
             return ""
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        text = text.replace('"', '&quot;')
-        return text
+        return escape_markup(text, quote=True)
     
     def _convert_with_reportlab(
         self,
         email_data,
-        output_path: Path,
+        output_path: Union[Path, BinaryIO],
         include_headers: bool
-    ) -> Path:
+    ) -> Union[Path, BinaryIO]:
         """
         Convert email to PDF using reportlab (fallback for plain text or when WeasyPrint unavailable).
         """
         doc = SimpleDocTemplate(
-            str(output_path),
+            str(output_path) if isinstance(output_path, Path) else output_path,
             pagesize=self.page_size,
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
@@ -1256,18 +1257,8 @@ class EmailToPDFConverter:
         if not text:
             return ""
         
-        # Replace special characters
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        
-        # Replace non-breaking spaces
-        text = text.replace('\xa0', ' ')
-        
-        # Remove other control characters
-        text = ''.join(char if ord(char) >= 32 or char in '\n\t' else ' ' for char in text)
-        
-        return text
+        # Each character maps to one, so translate() stays on its fast path
+        return escape_markup(text).translate(_PARAGRAPH_BLANKS)
     
     def _decode_html_entities(self, text: str) -> str:
         """Decode common HTML entities."""
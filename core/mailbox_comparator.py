@@ -9,67 +9,24 @@ import os
 import logging
 from pathlib import Path
 from typing import List, Optional, Callable, Tuple, Dict
-from dataclasses import dataclass, field
 from enum import Enum
 import shutil
 
 from .email_fingerprint import (
     EmailFingerprint,
     FingerprintIndex,
-    FingerprintMatch,
     MatchCertainty,
     create_fingerprint_from_parsed_email
 )
-from .mailbox_writer import MailboxWriter, OutputFormat, WriteResult
+from .mailbox_writer import MailboxWriter, WriteResult
 from .pst_extractor import PSTExtractor
 from .mbox_extractor import MBOXExtractor
 from .eml_parser import EMLParser
+from ._types import ComparisonConfig, ComparisonResult
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class ComparisonConfig:
-    """Configuration for mailbox comparison"""
-    # Matching options
-    use_message_id: bool = True
-    use_content: bool = True
-    timestamp_tolerance_seconds: int = 15
-    
-    # Output options
-    output_format: OutputFormat = OutputFormat.EML_FOLDER
-    
-    # What to output
-    output_common: bool = True
-    output_unique_a: bool = True
-    output_unique_b: bool = True
-
-
-@dataclass
-class ComparisonResult:
-    """Result of mailbox comparison"""
-    success: bool
-    
-    # Counts
-    total_in_a: int = 0
-    total_in_b: int = 0
-    common_count: int = 0
-    unique_to_a_count: int = 0
-    unique_to_b_count: int = 0
-    
-    # Output paths (set after writing)
-    common_output_path: Optional[str] = None
-    unique_a_output_path: Optional[str] = None
-    unique_b_output_path: Optional[str] = None
-    
-    # Errors and warnings
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    
-    # Detailed matches (for debugging/reporting)
-    matches: List[FingerprintMatch] = field(default_factory=list)
-
-
 class MailboxComparator:
     """
     Compares two mailboxes and identifies common/unique emails.
@@ -8,56 +8,22 @@ import os
 import logging
 from pathlib import Path
 from typing import List, Optional, Callable
-from dataclasses import dataclass, field
 import shutil
 import tempfile
 
 from .email_fingerprint import (
     FingerprintIndex,
-    FingerprintMatch,
     create_fingerprint_from_parsed_email
 )
 from .mailbox_writer import MailboxWriter, OutputFormat
 from .pst_extractor import PSTExtractor
 from .mbox_extractor import MBOXExtractor
 from .eml_parser import EMLParser
+from ._types import DedupeConfig, DedupeResult
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class DedupeConfig:
-    """Configuration for deduplication"""
-    # Matching options
-    use_message_id: bool = True
-    use_content: bool = True
-    timestamp_tolerance_seconds: int = 15
-    
-    # Output options
-    output_format: OutputFormat = OutputFormat.MBOX
-    keep_duplicates: bool = False  # If True, also output duplicates separately
-
-
-@dataclass
-class DedupeResult:
-    """Result of deduplication operation"""
-    success: bool
-    output_path: str = ""
-    duplicates_path: Optional[str] = None
-    
-    # Counts
-    total_emails: int = 0
-    unique_emails: int = 0
-    duplicates_found: int = 0
-    
-    # Detailed matches
-    duplicate_matches: List[FingerprintMatch] = field(default_factory=list)
-    
-    # Errors and warnings
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-
-
 class MailboxDeduplicator:
     """
     Removes duplicate emails from a mailbox.
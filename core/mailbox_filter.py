@@ -10,7 +10,6 @@ import re
 import logging
 from pathlib import Path
 from typing import List, Optional, Callable, Set
-from dataclasses import dataclass, field
 import shutil
 import tempfile
 
@@ -18,46 +17,11 @@ from .mailbox_writer import MailboxWriter, OutputFormat
 from .pst_extractor import PSTExtractor
 from .mbox_extractor import MBOXExtractor
 from .eml_parser import EMLParser
+from ._types import FilterConfig, FilterResult
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class FilterConfig:
-    """Configuration for email filtering"""
-    # Filter criteria (OR logic - email matches if ANY criteria matches)
-    sender_emails: List[str] = field(default_factory=list)      # Match if sender in list
-    sender_domains: List[str] = field(default_factory=list)     # Match if sender domain in list
-    recipient_emails: List[str] = field(default_factory=list)   # Match if any recipient in list
-    recipient_domains: List[str] = field(default_factory=list)  # Match if any recipient domain in list
-    
-    # Logic
-    match_mode: str = "any"  # "any" = OR, "all" = AND (for multiple criteria)
-    include_cc: bool = True  # Include CC recipients in matching
-    include_bcc: bool = True # Include BCC recipients in matching
-    
-    # Output
-    output_format: OutputFormat = OutputFormat.EML_FOLDER
-    output_non_matching: bool = False  # Also output non-matching emails
-
-
-@dataclass
-class FilterResult:
-    """Result of filter operation"""
-    success: bool
-    matched_output_path: str = ""
-    non_matched_output_path: Optional[str] = None
-    
-    # Counts
-    total_emails: int = 0
-    matched_emails: int = 0
-    non_matched_emails: int = 0
-    
-    # Errors and warnings
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-
-
 class MailboxFilter:
     """
     Filters emails from a mailbox by sender/recipient.
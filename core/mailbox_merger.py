@@ -8,7 +8,6 @@ import os
 import logging
 from pathlib import Path
 from typing import List, Optional, Callable, Dict
-from dataclasses import dataclass, field
 import shutil
 import tempfile
 
@@ -16,43 +15,15 @@ from .email_fingerprint import (
     FingerprintIndex,
     create_fingerprint_from_parsed_email
 )
-from .mailbox_writer import MailboxWriter, OutputFormat, WriteResult
+from .mailbox_writer import MailboxWriter, WriteResult
 from .pst_extractor import PSTExtractor
 from .mbox_extractor import MBOXExtractor
 from .eml_parser import EMLParser
+from ._types import MergeConfig, MergeResult
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class MergeConfig:
-    """Configuration for mailbox merging"""
-    # Deduplication options
-    deduplicate: bool = True
-    use_message_id: bool = True
-    use_content: bool = True
-    timestamp_tolerance_seconds: int = 15
-    
-    # Output options
-    output_format: OutputFormat = OutputFormat.MBOX
-
-
-@dataclass
-class MergeResult:
-    """Result of mailbox merge operation"""
-    success: bool
-    output_path: str = ""
-    
-    # Counts
-    total_input_emails: int = 0
-    emails_written: int = 0
-    duplicates_removed: int = 0
-    
-    # Errors and warnings
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-
-
 class MailboxMerger:
     """
     Merges multiple mailboxes into a single mailbox.
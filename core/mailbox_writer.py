@@ -11,19 +11,13 @@ import logging
 from pathlib import Path
 from typing import List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
-from enum import Enum
 from email import policy
 from email.generator import BytesGenerator
 import io
 
-logger = logging.getLogger(__name__)
-
+from ._types import OutputFormat
 
-class OutputFormat(Enum):
-    """Supported output formats"""
-    MBOX = "mbox"
-    EML_FOLDER = "eml_folder"
-    PST = "pst"  # Windows only
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -10,29 +10,13 @@ import mailbox
 import logging
 from pathlib import Path
 from typing import Optional, Callable, List, Tuple
-from dataclasses import dataclass, field
 from email import policy
 from email.generator import BytesGenerator
 import io
 
-logger = logging.getLogger(__name__)
-
+from ._types import MboxExtractionResult
 
-@dataclass
-class MboxExtractionResult:
-    """Result of MBOX extraction."""
-    success: bool
-    email_count: int  # Number of emails extracted
-    output_dir: str
-    extracted_files: List[str] = field(default_factory=list)  # Paths to extracted EML files
-    folder_structure: List[str] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    
-    @property
-    def emails_extracted(self) -> int:
-        """Alias for email_count for backwards compatibility."""
-        return self.email_count
+logger = logging.getLogger(__name__)
 
 
 class MBOXExtractor:
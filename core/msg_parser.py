@@ -7,12 +7,15 @@ MSG files are proprietary Microsoft format used by Outlook for individual emails
 
 import os
 import logging
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, Callable, List, Any
 from datetime import datetime
 import re
 
+from ._types import MSGAttachment, ParsedMSG
+
 logger = logging.getLogger(__name__)
 
 # Try to import RTF converter for RTF-only emails
@@ -22,49 +25,26 @@ try:
 except ImportError:
     RTF_CONVERTER_AVAILABLE = False
 
-# Try to import extract_msg
-MSG_AVAILABLE = False
-try:
-    import extract_msg
-    from extract_msg import Message
-    MSG_AVAILABLE = True
-except ImportError:
-    logger.warning("extract-msg not available - MSG support disabled")
-
 
-@dataclass
-class MSGAttachment:
-    """Represents an attachment from an MSG file."""
-    filename: str
-    content: bytes
-    content_type: str
-    content_id: Optional[str] = None
-    is_inline: bool = False
+def _msg_available() -> bool:
+    """Check whether extract-msg is installed without importing it."""
+    return importlib.util.find_spec("extract_msg") is not None
 
 
-@dataclass
-class ParsedMSG:
-    """Parsed MSG file data."""
-    subject: str
-    sender: str
-    sender_email: str
-    recipients_to: List[str]
-    recipients_cc: List[str]
-    recipients_bcc: List[str]
-    date: Optional[datetime]
-    body_text: str
-    body_html: str
-    attachments: List[MSGAttachment]
-    headers: Dict[str, str]
-    
-    # For compatibility with ParsedEmail
-    inline_images: Dict[str, MSGAttachment] = field(default_factory=dict)
+@lru_cache(maxsize=None)
+def _load_extract_msg():
+    """
+    Import extract_msg on first use.
     
-    def get_display_date(self) -> str:
-        """Get formatted date string."""
-        if self.date:
-            return self.date.strftime("%Y-%m-%d %H:%M:%S")
-        return "Unknown Date"
+    Returns:
+        The extract_msg.Message class, or None if extract-msg is not installed
+    """
+    try:
+        from extract_msg import Message
+    except ImportError:
+        logger.warning("extract-msg not available - MSG support disabled")
+        return None
+    return Message
 
 
 class MSGParser:
@@ -76,13 +56,13 @@ class MSGParser:
     
     def __init__(self):
         """Initialize the MSG parser."""
-        if not MSG_AVAILABLE:
+        if not _msg_available():
             logger.warning("MSG support not available - install extract-msg")
     
     @staticmethod
     def is_available() -> bool:
         """Check if MSG parsing is available."""
-        return MSG_AVAILABLE
+        return _msg_available()
     
     def parse(self, msg_path: str) -> Optional[ParsedMSG]:
         """
@@ -94,7 +74,8 @@ class MSGParser:
         Returns:
             ParsedMSG object or None if parsing failed
         """
-        if not MSG_AVAILABLE:
+        Message = _load_extract_msg()
+        if Message is None:
             logger.error("MSG parsing not available - extract-msg not installed")
             return None
         
@@ -321,7 +302,8 @@ class MSGParser:
         Returns:
             True if conversion successful
         """
-        if not MSG_AVAILABLE:
+        Message = _load_extract_msg()
+        if Message is None:
             return False
         
         try:
@@ -12,21 +12,92 @@ PyPDF2 is still used for reading page counts and extracting metadata.
 import os
 import io
 from pathlib import Path
-from typing import List, Optional, Callable, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Callable, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 import logging
 
-import pikepdf
-from PyPDF2 import PdfReader, PdfWriter
+# pikepdf, PyPDF2 and reportlab.platypus are imported inside the methods that
+# use them so that importing this module stays cheap (e.g. in worker processes).
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
+
+from ._markup import escape_markup
+
+if TYPE_CHECKING:
+    import pikepdf
+    from reportlab.lib.styles import ParagraphStyle
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _page_styles() -> Dict[str, 'ParagraphStyle']:
+    """Paragraph styles for separator and table-of-contents pages, built once."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    
+    styles = getSampleStyleSheet()
+    
+    return {
+        # Attachment separator
+        'AttSeparator': ParagraphStyle(
+            name='AttSeparator',
+            parent=styles['Title'],
+            fontSize=16,
+            textColor=colors.Color(0.3, 0.3, 0.6),
+            spaceAfter=20
+        ),
+        'AttSubtitle': ParagraphStyle(
+            name='AttSubtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.Color(0.5, 0.5, 0.5),
+            alignment=1  # Center
+        ),
+        # Email separator
+        'EmailSeparator': ParagraphStyle(
+            name='EmailSeparator',
+            parent=styles['Title'],
+            fontSize=14,
+            textColor=colors.Color(0.2, 0.2, 0.4),
+            spaceAfter=20,
+            alignment=1
+        ),
+        'DateStyle': ParagraphStyle(
+            name='DateStyle',
+            parent=styles['Normal'],
+            fontSize=11,
+            textColor=colors.Color(0.4, 0.4, 0.4),
+            alignment=1
+        ),
+        # Table of contents
+        'TOCTitle': ParagraphStyle(
+            name='TOCTitle',
+            parent=styles['Title'],
+            fontName='Helvetica-Bold',
+            fontSize=18,
+            spaceAfter=30
+        ),
+        'TOCEntry': ParagraphStyle(
+            name='TOCEntry',
+            parent=styles['Normal'],
+            fontName='Helvetica',
+            fontSize=10,
+            leading=18,
+        ),
+        'TOCPage': ParagraphStyle(
+            name='TOCPage',
+            parent=styles['Normal'],
+            fontName='Helvetica',
+            fontSize=10,
+            leading=18,
+            alignment=2  # Right align
+        ),
+    }
+
+
 @dataclass
 class MergeItem:
     """Represents an item to be merged"""
@@ -79,6 +150,8 @@ class PDFMerger:
         Copy embedded files from source PDF to destination PDF.
         This preserves file attachments during merge operations.
         """
+        import pikepdf
+        
         try:
             # Check if source has embedded files
             if '/Root' not in src_pdf.trailer:
@@ -134,6 +207,8 @@ class PDFMerger:
             toc_page_count: Number of TOC pages
             toc_entries: List of (title, page_number) tuples with adjusted page numbers
         """
+        import pikepdf
+        
         try:
             # TOC layout parameters (must match _create_table_of_contents)
             page_width = float(letter[0])
@@ -232,7 +307,7 @@ class PDFMerger:
         except Exception as e:
             logger.warning(f"Could not add TOC links: {e}")
     
-    def _add_bookmarks(self, pdf: pikepdf.Pdf, toc_entries: List[Tuple[str, int]]) -> None:
+    def _add_bookmarks(self, pdf: 'pikepdf.Pdf', toc_entries: List[Tuple[str, int]]) -> None:
         """
         Add PDF bookmarks (outline) for easy navigation.
         
@@ -240,6 +315,8 @@ class PDFMerger:
             pdf: The pikepdf.Pdf object to add bookmarks to
             toc_entries: List of (title, page_number) tuples (1-based page numbers)
         """
+        import pikepdf
+        
         try:
             with pdf.open_outline() as outline:
                 for title, page_num in toc_entries:
@@ -300,7 +377,7 @@ class PDFMerger:
     
     def merge_email_with_attachments(
         self,
-        email_pdf: Path,
+        email_pdf: Union[Path, BinaryIO],
         attachment_pdfs: List,  # List of Path or (Path, is_placeholder) tuples
         output_path: Path,
         add_separators: bool = True
@@ -309,7 +386,7 @@ class PDFMerger:
         Merge an email PDF with its attachment PDFs.
         
         Args:
-            email_pdf: Path to the email body PDF
+            email_pdf: Path to the email body PDF, or a file object holding it
             attachment_pdfs: List of paths or (path, is_placeholder) tuples
                             If is_placeholder=True, separator is skipped
             output_path: Output path for merged PDF
@@ -318,6 +395,8 @@ class PDFMerger:
         Returns:
             MergeResult with operation details
         """
+        import pikepdf
+        
         errors = []
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -330,7 +409,7 @@ class PDFMerger:
         try:
             self._report_progress(0, len(attachment_pdfs) + 1, "Adding email content...")
             
-            src_pdf = pikepdf.Pdf.open(str(email_pdf))
+            src_pdf = pikepdf.Pdf.open(email_pdf if hasattr(email_pdf, 'read') else str(email_pdf))
             merged_pdf.pages.extend(src_pdf.pages)
             total_pages += len(src_pdf.pages)
         
@@ -417,12 +496,15 @@ class PDFMerger:
         Returns:
             MergeResult with operation details
         """
+        import pikepdf
+        from PyPDF2 import PdfReader
+        
         errors = []
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Sort by timestamp (YYYYMMDD_HHMMSS format sorts correctly as string)
-        sorted_files = sorted(pdf_files, key=lambda x: x[1])
+        sorted_files = sorted(pdf_files, key=itemgetter(1))
         
         # Log sorting for debugging
         logger.info(f"Merging {len(sorted_files)} PDFs chronologically")
@@ -551,6 +633,8 @@ class PDFMerger:
     
     def _create_attachment_separator(self, attachment_name: str) -> bytes:
         """Create a separator page for an attachment."""
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
         buffer = io.BytesIO()
         
         doc = SimpleDocTemplate(
@@ -562,30 +646,13 @@ class PDFMerger:
             bottomMargin=inch
         )
         
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            name='AttSeparator',
-            parent=styles['Title'],
-            fontSize=16,
-            textColor=colors.Color(0.3, 0.3, 0.6),
-            spaceAfter=20
-        )
-        
-        subtitle_style = ParagraphStyle(
-            name='AttSubtitle',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.Color(0.5, 0.5, 0.5),
-            alignment=1  # Center
-        )
+        styles = _page_styles()
         
         story = [
             Spacer(1, 2*inch),
-            Paragraph("ATTACHMENT", title_style),
+            Paragraph("ATTACHMENT", styles['AttSeparator']),
             Spacer(1, 20),
-            Paragraph(self._escape_text(attachment_name), subtitle_style),
+            Paragraph(self._escape_text(attachment_name), styles['AttSubtitle']),
         ]
         
         doc.build(story)
@@ -593,6 +660,8 @@ class PDFMerger:
     
     def _create_email_separator(self, email_name: str, timestamp: str) -> bytes:
         """Create a separator page between emails."""
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
         buffer = io.BytesIO()
         
         doc = SimpleDocTemplate(
@@ -604,24 +673,7 @@ class PDFMerger:
             bottomMargin=inch
         )
         
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            name='EmailSeparator',
-            parent=styles['Title'],
-            fontSize=14,
-            textColor=colors.Color(0.2, 0.2, 0.4),
-            spaceAfter=20,
-            alignment=1
-        )
-        
-        date_style = ParagraphStyle(
-            name='DateStyle',
-            parent=styles['Normal'],
-            fontSize=11,
-            textColor=colors.Color(0.4, 0.4, 0.4),
-            alignment=1
-        )
+        styles = _page_styles()
         
         # Format timestamp for display
         display_date = timestamp
@@ -633,9 +685,9 @@ class PDFMerger:
         
         story = [
             Spacer(1, 2*inch),
-            Paragraph(self._escape_text(email_name), title_style),
+            Paragraph(self._escape_text(email_name), styles['EmailSeparator']),
             Spacer(1, 10),
-            Paragraph(display_date, date_style),
+            Paragraph(display_date, styles['DateStyle']),
         ]
         
         doc.build(story)
@@ -649,6 +701,9 @@ class PDFMerger:
         """
         from reportlab.pdfbase import pdfmetrics
         from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.platypus import (
+            SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+        )
         
         buffer = io.BytesIO()
         
@@ -661,34 +716,11 @@ class PDFMerger:
             bottomMargin=inch
         )
         
-        # Register a standard font that will be embedded
-        # Use Helvetica which is a PDF standard font (always available)
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            name='TOCTitle',
-            parent=styles['Title'],
-            fontName='Helvetica-Bold',
-            fontSize=18,
-            spaceAfter=30
-        )
-        
-        entry_style = ParagraphStyle(
-            name='TOCEntry',
-            parent=styles['Normal'],
-            fontName='Helvetica',
-            fontSize=10,
-            leading=18,
-        )
-        
-        page_style = ParagraphStyle(
-            name='TOCPage',
-            parent=styles['Normal'],
-            fontName='Helvetica',
-            fontSize=10,
-            leading=18,
-            alignment=2  # Right align
-        )
+        # Helvetica is a PDF standard font (always available)
+        styles = _page_styles()
+        title_style = styles['TOCTitle']
+        entry_style = styles['TOCEntry']
+        page_style = styles['TOCPage']
         
         # Calculate available width for TOC entries
         page_width = letter[0] - 1.5*inch  # Account for margins
@@ -740,10 +772,7 @@ class PDFMerger:
         """Escape text for reportlab."""
         if not text:
             return ""
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        return text
+        return escape_markup(text)
     
     def simple_merge(self, pdf_files: List[Path], output_path: Path) -> MergeResult:
         """
@@ -756,6 +785,8 @@ class PDFMerger:
         Returns:
             MergeResult
         """
+        from PyPDF2 import PdfMerger, PdfReader
+        
         errors = []
         
         try:
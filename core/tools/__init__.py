@@ -0,0 +1,68 @@
+"""
+Email Tools Group
+
+Fingerprinting, mailbox writing, compare/merge/deduplicate/filter. Names are
+resolved lazily, so importing this package does not load the PDF conversion
+stack (reportlab, PyPDF2, LibreOffice helpers).
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ..email_fingerprint import EmailFingerprint, FingerprintIndex, create_fingerprint
+    from ..mailbox_writer import (
+        MailboxWriter, OutputFormat, is_mapi_available, is_pst_write_available
+    )
+    from ..mailbox_comparator import MailboxComparator, ComparisonConfig, ComparisonResult
+    from ..mailbox_merger import MailboxMerger, MergeConfig, MergeResult
+    from ..mailbox_deduplicator import MailboxDeduplicator, DedupeConfig, DedupeResult
+    from ..mailbox_filter import MailboxFilter, FilterConfig, FilterResult
+
+__all__ = (
+    'EmailFingerprint',
+    'FingerprintIndex',
+    'create_fingerprint',
+    'MailboxWriter',
+    'OutputFormat',
+    'is_mapi_available',
+    'is_pst_write_available',
+    'MailboxComparator',
+    'ComparisonConfig',
+    'ComparisonResult',
+    'MailboxMerger',
+    'MergeConfig',
+    'MergeResult',
+    'MailboxDeduplicator',
+    'DedupeConfig',
+    'DedupeResult',
+    'MailboxFilter',
+    'FilterConfig',
+    'FilterResult',
+)
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    'EmailFingerprint': ('..email_fingerprint', 'EmailFingerprint'),
+    'FingerprintIndex': ('..email_fingerprint', 'FingerprintIndex'),
+    'create_fingerprint': ('..email_fingerprint', 'create_fingerprint'),
+    'MailboxWriter': ('..mailbox_writer', 'MailboxWriter'),
+    'OutputFormat': ('.._types', 'OutputFormat'),
+    'is_mapi_available': ('..mailbox_writer', 'is_mapi_available'),
+    'is_pst_write_available': ('..mailbox_writer', 'is_pst_write_available'),
+    'MailboxComparator': ('..mailbox_comparator', 'MailboxComparator'),
+    'ComparisonConfig': ('.._types', 'ComparisonConfig'),
+    'ComparisonResult': ('.._types', 'ComparisonResult'),
+    'MailboxMerger': ('..mailbox_merger', 'MailboxMerger'),
+    'MergeConfig': ('.._types', 'MergeConfig'),
+    'MergeResult': ('.._types', 'MergeResult'),
+    'MailboxDeduplicator': ('..mailbox_deduplicator', 'MailboxDeduplicator'),
+    'DedupeConfig': ('.._types', 'DedupeConfig'),
+    'DedupeResult': ('.._types', 'DedupeResult'),
+    'MailboxFilter': ('..mailbox_filter', 'MailboxFilter'),
+    'FilterConfig': ('.._types', 'FilterConfig'),
+    'FilterResult': ('.._types', 'FilterResult'),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, __all__, _LAZY)
@@ -13,11 +13,13 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional, Callable
 
-from core.mailbox_comparator import MailboxComparator, ComparisonConfig, ComparisonResult
-from core.mailbox_merger import MailboxMerger, MergeConfig, MergeResult
-from core.mailbox_deduplicator import MailboxDeduplicator, DedupeConfig, DedupeResult
-from core.mailbox_filter import MailboxFilter, FilterConfig, FilterResult
-from core.mailbox_writer import OutputFormat, is_pst_write_available
+from core.tools import (
+    MailboxComparator, ComparisonConfig, ComparisonResult,
+    MailboxMerger, MergeConfig, MergeResult,
+    MailboxDeduplicator, DedupeConfig, DedupeResult,
+    MailboxFilter, FilterConfig, FilterResult,
+    OutputFormat, is_pst_write_available,
+)
 
 logger = logging.getLogger(__name__)
 
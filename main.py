@@ -315,4 +315,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds: let process-pool workers run their task instead of the GUI
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -190,6 +190,192 @@ class TestAttachmentConverter:
         assert '.html' in supported
         
         converter.cleanup()
+    
+    def test_convert_many_keeps_order(self):
+        """Test that batch conversion returns one result per input, in order."""
+        from core.attachment_converter import AttachmentConverter, ConversionStatus
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            converter = AttachmentConverter(ocr_enabled=False, pdf_cache_dir=Path(tmpdir) / 'cache')
+            inputs = []
+            for name in ('b.txt', 'a.txt'):
+                path = Path(tmpdir) / name
+                path.write_text(f"contents of {name}")
+                inputs.append(path)
+            
+            results = converter.convert_many(inputs, Path(tmpdir) / 'out', ['first', None])
+            
+            assert [r.original_path for r in results] == inputs
+            assert all(r.status == ConversionStatus.SUCCESS for r in results)
+            assert results[0].output_path.name == 'first.pdf'
+            assert results[1].output_path.name == 'a.pdf'
+            converter.cleanup()
+    
+    def test_convert_reuses_identical_content(self):
+        """Test that converting the same attachment twice reuses the first PDF."""
+        from core.attachment_converter import AttachmentConverter, ConversionStatus
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / 'cache'
+            converter = AttachmentConverter(ocr_enabled=False, pdf_cache_dir=cache_dir)
+            first = converter.convert_bytes(b"same text", 'text/plain', 'note.txt', tmpdir, 'one')
+            second = converter.convert_bytes(b"same text", 'text/plain', 'note.txt', tmpdir, 'two')
+            
+            assert second.status == ConversionStatus.SUCCESS
+            assert second.output_path.name == 'two.pdf'
+            assert second.output_path.read_bytes() == first.output_path.read_bytes()
+            assert len(converter._result_cache) == 1
+            converter.cleanup()
+            
+            # A later converter finds the PDF in the on-disk cache
+            other = AttachmentConverter(ocr_enabled=False, pdf_cache_dir=cache_dir)
+            other._convert_uncached = lambda *args: pytest.fail("converted again")
+            third = other.convert_bytes(b"same text", 'text/plain', 'note.txt', tmpdir, 'three')
+            
+            assert third.status == ConversionStatus.SUCCESS
+            assert third.message == first.message
+            assert third.output_path.read_bytes() == first.output_path.read_bytes()
+            other.cleanup()
+    
+    def test_placeholder_embeds_original(self):
+        """Test that unsupported files become a placeholder PDF with the file attached."""
+        import pikepdf
+        from core.attachment_converter import AttachmentConverter, ConversionStatus
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            converter = AttachmentConverter(ocr_enabled=False, pdf_cache_dir=Path(tmpdir) / 'cache')
+            result = converter.convert_bytes(b"\x00\x01payload", 'application/octet-stream',
+                                             'data (1).bin', tmpdir)
+            
+            assert result.status == ConversionStatus.PARTIAL
+            with pikepdf.open(result.output_path) as pdf:
+                assert pdf.attachments['data (1).bin'].get_file().read_bytes() == b"\x00\x01payload"
+                assert b'(data \\(1\\).bin) Tj' in pdf.pages[0].Contents[-1].read_bytes()
+            converter.cleanup()
+
+
+# Test Conversion Pipeline
+class TestConversionPipeline:
+    """Tests for the Conversion Pipeline module."""
+    
+    def _write_emls(self, folder: Path, count: int):
+        """Write small EMLs; the first two share a subject and date, so a name."""
+        from email.message import EmailMessage
+        
+        folder.mkdir()
+        for i in range(count):
+            msg = EmailMessage()
+            msg['From'] = 'sender@example.com'
+            msg['To'] = 'recipient@example.com'
+            msg['Subject'] = 'Same name' if i < 2 else f'Email {i}'
+            msg['Date'] = f'Mon, 1 Jan 2024 12:{max(i - 1, 0):02d}:00 +0000'
+            msg.set_content(f"Body of email {i}.")
+            if i % 2:
+                msg.add_attachment(f"notes for email {i}".encode(), maintype='text',
+                                   subtype='plain', filename='notes.txt')
+            (folder / f"email{i}.eml").write_bytes(bytes(msg))
+    
+    def _config(self, input_dir: Path, output_dir: Path, max_workers: int):
+        from core.conversion_pipeline import PipelineConfig
+        
+        return PipelineConfig(
+            pst_path=str(input_dir),
+            output_dir=str(output_dir),
+            detect_duplicates=False,
+            ocr_enabled=False,
+            create_combined_pdf=False,
+            max_workers=max_workers
+        )
+    
+    def test_worker_count_gives_same_pdfs(self):
+        """Test that in-process and process-pool runs write the same PDFs, in order."""
+        import pikepdf
+        from core.conversion_pipeline import ConversionPipeline
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / 'in'
+            self._write_emls(input_dir, 4)
+            
+            outputs = {}
+            for workers in (1, 2):
+                output_dir = Path(tmpdir) / f'out{workers}'
+                result = ConversionPipeline(self._config(input_dir, output_dir, workers)).run()
+                
+                assert result.success, result.errors
+                assert result.emails_processed == 4
+                assert result.attachments_converted == 2
+                assert not list((output_dir / '_temp').rglob('*.parsed.pkl'))
+                outputs[workers] = sorted(result.individual_pdfs_dir.rglob('*.pdf'))
+            
+            names = [path.name for path in outputs[1]]
+            assert names == [path.name for path in outputs[2]]
+            # Same-named emails in one folder get distinct files
+            assert '20240101_120000_Same_name.pdf' in names
+            assert '20240101_120000_Same_name_1.pdf' in names
+            # Compare page contents; the creation date and document ID differ per run
+            for serial, pooled in zip(outputs[1], outputs[2]):
+                with pikepdf.open(serial) as a, pikepdf.open(pooled) as b:
+                    assert len(a.pages) == len(b.pages)
+                    for page_a, page_b in zip(a.pages, b.pages):
+                        assert page_a.Contents.read_bytes() == page_b.Contents.read_bytes()
+    
+    def test_cancel_during_conversion(self):
+        """Test that cancelling mid-run returns the cancellation and removes leftover pickles."""
+        from core.conversion_pipeline import ConversionPipeline, PipelineStage
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / 'in'
+            output_dir = Path(tmpdir) / 'out'
+            self._write_emls(input_dir, 8)
+            
+            def on_progress(progress):
+                if progress.stage == PipelineStage.CONVERTING_EMAILS:
+                    pipeline.cancel()
+            
+            pipeline = ConversionPipeline(self._config(input_dir, output_dir, 2), on_progress)
+            result = pipeline.run()
+            
+            assert not result.success
+            assert "Pipeline was cancelled" in result.errors
+            assert not list((output_dir / '_temp').rglob('*.parsed.pkl'))
+
+
+# Test Core Package
+class TestCorePackage:
+    """Tests for the core package namespace."""
+    
+    def test_import_is_lazy(self):
+        """Importing core should not load the heavy converter modules."""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, core; "
+            "assert 'core.attachment_converter' not in sys.modules; "
+            "assert 'reportlab' not in sys.modules; "
+            "core.DedupeConfig(); "
+            "assert 'core.mailbox_deduplicator' not in sys.modules; "
+            "core.EMLParser; "
+            "assert 'core.eml_parser' in sys.modules"
+        )
+        root = Path(__file__).resolve().parent.parent
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+    
+    def test_group_subpackages(self):
+        """core.convert and core.tools resolve to the same objects as core."""
+        import core
+        from core.convert import EMLParser
+        from core.tools import create_fingerprint
+        
+        assert core.EMLParser is EMLParser
+        assert core.create_fingerprint is create_fingerprint
+    
+    def test_unknown_attribute(self):
+        """Unknown names raise AttributeError."""
+        import core
+        
+        with pytest.raises(AttributeError):
+            core.DoesNotExist
 
 
 if __name__ == '__main__':